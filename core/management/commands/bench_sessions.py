@@ -0,0 +1,70 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+
+TOUCH_MIDDLEWARE = "core.middleware.SessionTouchMiddleware"
+
+# (이름, 세션 엔진, 매 요청 저장 여부, 만료 연장 미들웨어 사용 여부)
+SCENARIOS = [
+    ("db / 매 요청 저장 (기존)", "django.contrib.sessions.backends.db", True, False),
+    ("db / 변경 시에만 저장", "django.contrib.sessions.backends.db", False, True),
+    ("cached_db / 변경 시에만 저장", "django.contrib.sessions.backends.cached_db", False, True),
+]
+
+
+class Command(BaseCommand):
+    help = "세션 설정별 초당 요청 수와 요청당 쿼리 수를 비교한다. (로그인 세션으로 같은 URL 을 반복 호출)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/google-auth-status/", help="반복 호출할 URL (세션을 읽는 가벼운 JSON 응답 권장)")
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--user-id", default="bench-session", help="세션에 넣을 login_user_id")
+
+    def _run(self, engine, save_every_request, touch, opts):
+        middleware = [m for m in settings.MIDDLEWARE if m != TOUCH_MIDDLEWARE]
+        if touch:
+            idx = middleware.index("django.contrib.sessions.middleware.SessionMiddleware") + 1
+            middleware.insert(idx, TOUCH_MIDDLEWARE)
+
+        with override_settings(
+            SESSION_ENGINE=engine,
+            SESSION_SAVE_EVERY_REQUEST=save_every_request,
+            SESSION_CACHE_ALIAS="sessions",
+            MIDDLEWARE=middleware,
+            ALLOWED_HOSTS=["testserver"],
+        ):
+            client = Client()
+            session = client.session
+            session["login_user_id"] = opts["user_id"]
+            session.save()
+            client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+            client.get(opts["path"])  # 워밍업
+            n = opts["requests"]
+            counts = {"all": 0, "session": 0}
+
+            def count_queries(execute, sql, params, many, context):
+                counts["all"] += 1
+                if "django_session" in sql:
+                    counts["session"] += 1
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(count_queries):
+                started = time.perf_counter()
+                for _ in range(n):
+                    client.get(opts["path"])
+                elapsed = time.perf_counter() - started
+
+            session.delete()
+        return n / elapsed, counts["all"] / n, counts["session"] / n
+
+    def handle(self, *args, **opts):
+        self.stdout.write(f"{opts['path']} x {opts['requests']}회 (단일 스레드, 테스트 클라이언트)")
+        for name, engine, save_every_request, touch in SCENARIOS:
+            rps, queries, session_queries = self._run(engine, save_every_request, touch, opts)
+            self.stdout.write(
+                f"{name:28s}: {rps:8.1f} req/s, 요청당 쿼리 {queries:.2f} (세션 {session_queries:.2f})"
+            )
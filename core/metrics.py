@@ -0,0 +1,228 @@
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 응답 시간 히스토그램 구간(초). STT/SLLM 처럼 수 분 걸리는 요청까지 담는다.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900)
+
+
+class RequestTimings:
+    """요청 하나 동안 모은 SQL/외부 호출 시간 (RequestMetricsMiddleware 가 만든다)"""
+
+    __slots__ = ("queries", "db_seconds", "external")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.external = {}   # service -> [호출 수, 초]
+
+    def add_external(self, service: str, seconds: float):
+        entry = self.external.setdefault(service, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+
+_current = contextvars.ContextVar("request_timings", default=None)
+
+
+def start_request():
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def resume_request(timings):
+    """스트리밍 응답 본문을 만드는 동안 다시 같은 요청으로 세도록 되돌린다. (end_request 로 해제)"""
+    return _current.set(timings)
+
+
+@contextmanager
+def track_external(service: str):
+    """
+    외부 호출(S3, RunPod, Google) 시간을 현재 요청에 더한다.
+    요청 밖(배치, 풀 스레드)에서는 아무것도 하지 않는다. 풀 스레드에 맡긴 호출은
+    요청 스레드가 결과를 기다리는 구간을 감싸서 잰다.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_external(service, time.perf_counter() - started)
+
+
+def count_query(execute, sql, params, many, context):
+    """connection.execute_wrapper 용. 현재 요청의 쿼리 수/시간을 센다."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.db_seconds += time.perf_counter() - started
+
+
+def view_label(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    return match.view_name or match._func_path
+
+
+def response_size(response):
+    if getattr(response, "streaming", False):
+        length = response.get("Content-Length")
+        return int(length) if length and length.isdigit() else 0
+    return len(response.content)
+
+
+def server_timing(total_seconds: float, timings: RequestTimings) -> str:
+    """Server-Timing 헤더 값 (브라우저 개발자 도구 Network > Timing 에 표시됨)"""
+    parts = [
+        f"app;dur={total_seconds * 1000:.1f}",
+        f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.queries} queries"',
+    ]
+    for service, (calls, seconds) in sorted(timings.external.items()):
+        parts.append(f'{service};dur={seconds * 1000:.1f};desc="{calls} calls"')
+    return ", ".join(parts)
+
+
+class _ViewStats:
+    __slots__ = ("requests", "statuses", "buckets", "seconds", "queries", "db_seconds", "bytes", "external")
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses = {}
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.seconds = 0.0
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.bytes = 0
+        self.external = {}   # service -> [호출 수, 초]
+
+
+class MetricsRegistry:
+    """
+    뷰별 누적 지표. 프로세스(gunicorn 워커)마다 따로 모으며, 내보낼 때 worker 라벨(pid)을 붙인다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+        self.started_at = time.time()
+
+    def observe(self, view: str, status: int, seconds: float, timings: RequestTimings, size: int):
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = _ViewStats()
+            stats.requests += 1
+            status_class = f"{status // 100}xx"
+            stats.statuses[status_class] = stats.statuses.get(status_class, 0) + 1
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    stats.buckets[i] += 1
+                    break
+            stats.seconds += seconds
+            stats.queries += timings.queries
+            stats.db_seconds += timings.db_seconds
+            stats.bytes += size
+            for service, (calls, ext_seconds) in timings.external.items():
+                entry = stats.external.setdefault(service, [0, 0.0])
+                entry[0] += calls
+                entry[1] += ext_seconds
+
+    def reset(self):
+        with self._lock:
+            self._views = {}
+            self.started_at = time.time()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            views = {}
+            for view, s in sorted(self._views.items()):
+                views[view] = {
+                    "requests": s.requests,
+                    "statuses": dict(s.statuses),
+                    "avg_ms": round(s.seconds / s.requests * 1000, 1),
+                    "avg_queries": round(s.queries / s.requests, 1),
+                    "avg_db_ms": round(s.db_seconds / s.requests * 1000, 1),
+                    "avg_bytes": s.bytes // s.requests,
+                    "external": {
+                        service: {"calls": calls, "avg_ms": round(sec / s.requests * 1000, 1)}
+                        for service, (calls, sec) in sorted(s.external.items())
+                    },
+                }
+            return {"worker": os.getpid(), "since": self.started_at, "views": views}
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        worker = os.getpid()
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            items = sorted(self._views.items())
+
+            metric("django_view_requests_total", "counter", "Requests by view and status class.")
+            for view, s in items:
+                for status_class, count in sorted(s.statuses.items()):
+                    lines.append(
+                        f'django_view_requests_total{{worker="{worker}",view="{view}",status="{status_class}"}} {count}'
+                    )
+
+            metric("django_view_duration_seconds", "histogram", "Wall time per request.")
+            for view, s in items:
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS, s.buckets):
+                    cumulative += count
+                    lines.append(
+                        f'django_view_duration_seconds_bucket{{worker="{worker}",view="{view}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'django_view_duration_seconds_bucket{{worker="{worker}",view="{view}",le="+Inf"}} {s.requests}')
+                lines.append(f'django_view_duration_seconds_sum{{worker="{worker}",view="{view}"}} {s.seconds:.6f}')
+                lines.append(f'django_view_duration_seconds_count{{worker="{worker}",view="{view}"}} {s.requests}')
+
+            metric("django_view_db_queries_total", "counter", "SQL queries issued by the view.")
+            for view, s in items:
+                lines.append(f'django_view_db_queries_total{{worker="{worker}",view="{view}"}} {s.queries}')
+
+            metric("django_view_db_seconds_total", "counter", "Time spent in SQL.")
+            for view, s in items:
+                lines.append(f'django_view_db_seconds_total{{worker="{worker}",view="{view}"}} {s.db_seconds:.6f}')
+
+            metric("django_view_external_seconds_total", "counter", "Time spent waiting on external services.")
+            for view, s in items:
+                for service, (_, seconds) in sorted(s.external.items()):
+                    lines.append(
+                        f'django_view_external_seconds_total{{worker="{worker}",view="{view}",service="{service}"}} {seconds:.6f}'
+                    )
+
+            metric("django_view_external_calls_total", "counter", "External service calls.")
+            for view, s in items:
+                for service, (calls, _) in sorted(s.external.items()):
+                    lines.append(
+                        f'django_view_external_calls_total{{worker="{worker}",view="{view}",service="{service}"}} {calls}'
+                    )
+
+            metric("django_view_response_bytes_total", "counter", "Response body bytes.")
+            for view, s in items:
+                lines.append(f'django_view_response_bytes_total{{worker="{worker}",view="{view}"}} {s.bytes}')
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,116 @@
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.http import FileResponse
+
+from core import metrics
+
+# 세션 만료 시각을 마지막으로 연장한 시각(epoch 초)
+SESSION_TOUCH_KEY = "_touched_at"
+
+
+class SessionTouchMiddleware:
+    """
+    SESSION_SAVE_EVERY_REQUEST 없이도 사용 중인 세션이 만료되지 않게 한다.
+    데이터가 바뀌지 않은 요청은 저장하지 않고, SESSION_TOUCH_INTERVAL 초가 지났을 때만
+    세션을 수정 표시해 SessionMiddleware 가 만료 시각/쿠키를 연장하도록 한다.
+    (SessionMiddleware 보다 뒤에 두어야 응답 처리 시 먼저 실행된다)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        session = getattr(request, "session", None)
+        # 이번 요청에서 세션을 읽지 않았거나, 비었거나(로그아웃 포함) 하면 건드리지 않는다.
+        if session is None or not session.accessed or session.is_empty():
+            return response
+
+        now = int(time.time())
+        if session.modified:
+            # 어차피 저장되므로 기준 시각만 갱신
+            session[SESSION_TOUCH_KEY] = now
+        elif now - session.get(SESSION_TOUCH_KEY, 0) >= settings.SESSION_TOUCH_INTERVAL:
+            session[SESSION_TOUCH_KEY] = now
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    요청마다 전체 시간, SQL 쿼리 수/시간, 외부 호출(S3, RunPod, Google) 시간, 응답 크기를 재서
+    core.metrics.registry 에 뷰별로 쌓고 Server-Timing 헤더로도 내려준다.
+    (전체 시간을 재야 하므로 MIDDLEWARE 맨 앞에 둔다)
+    스트리밍 응답(회의록 일괄 다운로드 등)은 본문을 다 보내거나 연결이 끊겨 닫힐 때 기록하며,
+    헤더가 본문보다 먼저 나가므로 Server-Timing 은 붙이지 않는다. FileResponse 는 파일 전송뿐이라
+    본문을 감싸지 않고(wsgi.file_wrapper 유지) 헤더까지의 시간으로 기록한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timings, token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics.count_query):
+                response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+
+        def finish(size):
+            elapsed = time.perf_counter() - started
+            metrics.registry.observe(
+                metrics.view_label(request), response.status_code, elapsed, timings, size
+            )
+            return elapsed
+
+        if (
+            getattr(response, "streaming", False)
+            and not isinstance(response, FileResponse)
+            and not getattr(response, "is_async", False)
+        ):
+            response.streaming_content = _MeasuredStream(response.streaming_content, timings, finish)
+            return response
+
+        elapsed = finish(metrics.response_size(response))
+        if settings.METRICS_SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing(elapsed, timings)
+        return response
+
+
+class _MeasuredStream:
+    """
+    스트리밍 응답 본문. 조각을 만드는 동안의 SQL/외부 호출을 같은 요청으로 세고,
+    끝까지 보냈거나 close 될 때(클라이언트가 끊은 경우 포함) 한 번만 finish(보낸 바이트 수)를 부른다.
+    """
+
+    def __init__(self, content, timings, finish):
+        self._content = iter(content)
+        self._timings = timings
+        self._finish = finish
+        self._size = 0
+        self._finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        token = metrics.resume_request(self._timings)
+        try:
+            with connection.execute_wrapper(metrics.count_query):
+                chunk = next(self._content)
+        except StopIteration:
+            self.close()
+            raise
+        finally:
+            metrics.end_request(token)
+        self._size += len(chunk)
+        return chunk
+
+    def close(self):
+        if not self._finished:
+            self._finished = True
+            self._finish(self._size)
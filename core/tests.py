@@ -1,3 +1,74 @@
-from django.test import TestCase
+"""
+관리 화면 쿼리 수 회귀 테스트 (meetings.tests 의 팩토리 사용)와 요청 지표 미들웨어 테스트.
+"""
+import time
 
-# Create your tests here.
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core import metrics
+from core.middleware import RequestMetricsMiddleware
+from meetings.tests import QueryCountTestCase, SIZES, make_dataset, make_dept, make_users, query_test_settings
+from users.models import User
+
+
+@query_test_settings
+class AdminHomeQueryTests(QueryCountTestCase):
+    def test_admin_home(self):
+        dept = make_dept()
+        admin = make_users(dept, 1, prefix="admin-", admin=True)[0]
+        self.login(admin, admin=True)
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                # 부서와 부서원이 늘어도 관리 화면 쿼리 수는 같아야 한다
+                make_dataset(n, m * 5, k, prefix=f"member{i}-")
+                with self.assertNumQueries(9):
+                    self.get("/admin/")
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        metrics.registry.reset()
+        self.addCleanup(metrics.registry.reset)
+        self.request = RequestFactory().get("/stream/")
+
+    def observed(self):
+        return metrics.registry.snapshot()["views"].get("unresolved")
+
+    def streaming_response(self):
+        def body():
+            yield b"a" * 10
+            time.sleep(0.05)
+            # 본문을 만드는 도중의 쿼리도 같은 요청으로 센다
+            User.objects.count()
+            yield b"b" * 5
+
+        return StreamingHttpResponse(body())
+
+    def test_streaming_response_is_measured_until_sent(self):
+        response = RequestMetricsMiddleware(lambda request: self.streaming_response())(self.request)
+        self.assertNotIn("Server-Timing", response)
+        self.assertIsNone(self.observed())
+
+        self.assertEqual(b"".join(response.streaming_content), b"a" * 10 + b"b" * 5)
+        response.close()
+        stats = self.observed()
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["avg_bytes"], 15)
+        self.assertEqual(stats["avg_queries"], 1)
+        self.assertGreaterEqual(stats["avg_ms"], 50)
+
+    def test_streaming_response_closed_early_is_recorded_once(self):
+        response = RequestMetricsMiddleware(lambda request: self.streaming_response())(self.request)
+        next(iter(response.streaming_content))
+        response.close()
+        response.close()
+        stats = self.observed()
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["avg_bytes"], 10)
+
+    @override_settings(METRICS_SERVER_TIMING=True)
+    def test_plain_response_gets_server_timing(self):
+        response = RequestMetricsMiddleware(lambda request: HttpResponse(b"ok"))(self.request)
+        self.assertTrue(response["Server-Timing"].startswith("app;dur="))
+        self.assertEqual(self.observed()["avg_bytes"], 2)
@@ -5,7 +5,8 @@ from .views import (
     admin_member_create,
     admin_member_update,
     admin_member_delete,
-    admin_member_reset_password
+    admin_member_reset_password,
+    metrics_view,
 )
 
 app_name = "core"
@@ -17,4 +18,5 @@ urlpatterns = [
     path("admin/member/<str:user_id>/update/", admin_member_update, name="admin_member_update"),
     path("admin/member/<str:user_id>/delete/", admin_member_delete, name="admin_member_delete"),
     path("admin/member/<str:user_id>/reset-password/", admin_member_reset_password, name="admin_member_reset_password"),
+    path("metrics/", metrics_view, name="metrics"),
 ]
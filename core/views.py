@@ -2,13 +2,16 @@ from django.shortcuts import redirect
 from django.views.generic import TemplateView
 from django.views.decorators.cache import never_cache
 from django.utils.decorators import method_decorator
-from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
+from django.http import HttpResponse, JsonResponse
+from django.conf import settings
+from django.views.decorators.http import require_GET, require_http_methods
 from django.contrib.auth.hashers import make_password
 import json
 import re
 
 from users.models import User, Dept
+from users.throttle import reset_login_failures
+from core import metrics
 from datetime import date, datetime, timedelta
 
 class LoginRequiredSessionMixin:
@@ -280,6 +283,7 @@ def admin_member_reset_password(request, user_id):
         birth_date_str = user.birth_date.strftime("%Y%m%d")
         user.password = make_password(birth_date_str)
         user.save()
+        reset_login_failures(user.user_id)
 
         return JsonResponse({
             "success": True,
@@ -289,4 +293,24 @@ def admin_member_reset_password(request, user_id):
     except User.DoesNotExist:
         return JsonResponse({"success": False, "message": "존재하지 않는 사용자입니다."}, status=404)
     except Exception as e:
-        return JsonResponse({"success": False, "message": f"오류가 발생했습니다: {str(e)}"}, status=500)
\ No newline at end of file
+        return JsonResponse({"success": False, "message": f"오류가 발생했습니다: {str(e)}"}, status=500)
+
+
+@require_GET
+def metrics_view(request):
+    """
+    요청 지표 조회 (core.metrics). 기본은 Prometheus text, ?format=json 이면 JSON.
+    Authorization: Bearer <METRICS_TOKEN> 또는 관리자 세션만 허용한다.
+    지표는 워커(프로세스)마다 따로 모이므로 worker 라벨로 구분된다.
+    """
+    token = settings.METRICS_TOKEN
+    authorized = bool(token) and request.headers.get("Authorization") == f"Bearer {token}"
+    if not authorized and not request.session.get("login_user_admin"):
+        return JsonResponse({"success": False, "message": "권한이 없습니다."}, status=403)
+
+    if request.GET.get("format") == "json":
+        return JsonResponse(metrics.registry.snapshot())
+    return HttpResponse(
+        metrics.registry.prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
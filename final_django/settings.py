@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -10,6 +11,25 @@ GOOGLE_OAUTH2_SCOPES = [
 ]
 GOOGLE_OAUTH2_REDIRECT_URI = "http://localhost:8000/oauth2callback/"
 # GOOGLE_OAUTH2_REDIRECT_URI = "https://malhaneundaero.com/oauth2callback/"
+# 캘린더별 이벤트 조회 동시 실행 수 / 캘린더 하나당 제한 시간(초)
+GOOGLE_CALENDAR_FETCH_WORKERS = 8
+GOOGLE_CALENDAR_FETCH_TIMEOUT = 10
+# 반복 일정은 원본만 동기화하고 피드 기간만큼 펼친다. 원본 하나에서 펼칠 최대 회차 수
+GOOGLE_CALENDAR_MAX_INSTANCES = 500
+# 홈 캘린더 피드(기간별) 응답 캐시 시간(초)
+GOOGLE_EVENTS_CACHE_TTL = 30
+# 구글 Tasks 스냅샷: 이 시간(초) 안에는 Google 을 다시 확인하지 않음 / 스냅샷 보관 시간(초, 지나면 전체 재조회)
+GOOGLE_TASKS_SNAPSHOT_TTL = 60
+GOOGLE_TASKS_SNAPSHOT_MAX_AGE = 86400
+# 구글 로그인 OAuth state 유효 시간(초). 지나면 콜백을 거부하고 배치에서 삭제
+OAUTH_STATE_TTL = 600
+# 구글 토큰 메모리 캐시: 만료 N초 전 미리 갱신 / 갱신 확인 주기(초) / 미사용 시 캐시에서 제거(초)
+GOOGLE_CREDENTIALS_REFRESH_MARGIN = 600
+GOOGLE_CREDENTIALS_REFRESH_INTERVAL = 60
+GOOGLE_CREDENTIALS_IDLE_TTL = 3600
+# 구글 토큰/일정 피드 캐시 버전을 둘 캐시. 한 워커에서 연동 해제나 일정 변경이 일어나도
+# 다른 워커가 예전 토큰/일정을 쓰지 않도록 워커 공용이어야 한다.
+GOOGLE_SHARED_CACHE = "shared"
 
 load_dotenv(os.path.join(BASE_DIR, '.env'))
 
@@ -55,8 +75,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.SessionTouchMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -121,6 +143,55 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # cached_db 세션용. gunicorn 워커끼리 같은 세션을 봐야 하므로 프로세스 공용인 파일 캐시를 쓴다.
+    # (locmem 은 워커마다 따로라 다른 워커가 바꾼 세션을 오래된 값으로 읽게 된다)
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "SESSION_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "final_django_sessions"),
+        ),
+        "TIMEOUT": 1209600,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+    # 로그인 실패 기록. 같은 이유로 워커 공용 파일 캐시를 쓴다.
+    "throttle": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "LOGIN_THROTTLE_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "final_django_throttle"),
+        ),
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+    # 워커끼리 맞춰야 하는 작은 값(구글 토큰 버전 등). 같은 이유로 워커 공용 파일 캐시를 쓴다.
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "SHARED_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "final_django_shared"),
+        ),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
+# 로그인 실패 제한 (users.throttle)
+# 최근 LOGIN_FAIL_WINDOW 초 안에 같은 아이디로 LOGIN_MAX_FAILURES 회 틀리면 계정을 비활성화하고,
+# 같은 IP 에서 LOGIN_IP_MAX_FAILURES 회 틀리면 창 안의 실패가 줄어들 때까지 DB 조회 없이 429 로 거절한다.
+LOGIN_THROTTLE_CACHE = "throttle"
+LOGIN_FAIL_WINDOW = 3600
+LOGIN_MAX_FAILURES = 5
+LOGIN_IP_MAX_FAILURES = 20
+
+# 요청 지표 (core.middleware.RequestMetricsMiddleware)
+# Server-Timing 헤더를 붙일지 / /metrics/ 조회 토큰 (비우면 관리자 세션으로만 조회)
+METRICS_SERVER_TIMING = os.getenv("METRICS_SERVER_TIMING", "true").lower() == "true"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 LANGUAGE_CODE = 'ko-kr'
 TIME_ZONE = 'Asia/Seoul'
 
@@ -128,9 +199,18 @@ USE_I18N = True
 USE_TZ = False  # 시간대
 
 # 세션 설정 (구글 OAuth 상태 유지를 위해)
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# SESSION_BACKEND=cached_db 이면 세션을 "sessions" 캐시에 두고 DB 는 캐시 미스/저장 시에만 사용
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "db")
+if SESSION_BACKEND == "cached_db":
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+    SESSION_CACHE_ALIAS = "sessions"
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 SESSION_COOKIE_AGE = 1209600  # 2주
-SESSION_SAVE_EVERY_REQUEST = True  # OAuth 리다이렉트 시 세션 유지
+# 세션 데이터가 바뀐 요청에서만 저장. 만료 시각은 core.middleware.SessionTouchMiddleware 가
+# SESSION_TOUCH_INTERVAL 초에 한 번씩만 연장한다.
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_TOUCH_INTERVAL = int(os.getenv("SESSION_TOUCH_INTERVAL", "300"))
 SESSION_COOKIE_HTTPONLY = False  # OAuth 리다이렉트를 위해 False
 SESSION_COOKIE_SECURE = False  # HTTP localhost를 위해
 SESSION_COOKIE_SAMESITE = None  # OAuth 리다이렉트를 위해 None (쿠키 전송 허용)
@@ -147,6 +227,38 @@ STATICFILES_DIRS = [
 KOREAN_FONT_NAME = "MalgunGothic"
 KOREAN_FONT_PATH = BASE_DIR / "static" / "font" / "malgun.ttf"
 
+# 회의록(PDF/DOCX) 생성 프로세스 수 (0이면 요청 스레드에서 직접 생성)
+MINUTES_RENDER_WORKERS = int(os.getenv("MINUTES_RENDER_WORKERS", "2"))
+# 문서 한 건 생성 제한 시간(초)
+MINUTES_RENDER_TIMEOUT = int(os.getenv("MINUTES_RENDER_TIMEOUT", "60"))
+
+# 녹음 파일 분할 업로드: 조각 크기 / 최대 파일 크기 / 조각을 모아 두는 임시 디렉터리
+RECORD_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+RECORD_UPLOAD_MAX_SIZE = 2 * 1024 * 1024 * 1024
+RECORD_UPLOAD_SPOOL_DIR = os.getenv(
+    "RECORD_UPLOAD_SPOOL_DIR",
+    os.path.join(tempfile.gettempdir(), "final_django_uploads"),
+)
+# 이 시간(초) 동안 조각이 오지 않은 미완료 업로드는 배치(run_batch)에서 정리
+RECORD_UPLOAD_SESSION_TTL = 60 * 60 * 24
+# complete 가 S3 업로드 중 죽어 이 시간(초) 넘게 마무리 중(completing)으로 남은 세션은 다시 complete 할 수 있다
+RECORD_UPLOAD_COMPLETE_TIMEOUT = 60 * 30
+# 녹음 WAV 를 STT 입력 형식(16 kHz mono 16-bit)으로 변환해 저장 / 변환 전 원본도 S3 에 보관할지
+RECORD_NORMALIZE_AUDIO = os.getenv("RECORD_NORMALIZE_AUDIO", "true").lower() == "true"
+RECORD_KEEP_ORIGINAL = os.getenv("RECORD_KEEP_ORIGINAL", "false").lower() == "true"
+# 녹음의 발화 구간 검출(에너지 기반) / 발화 구간만 이어 붙인 파일을 만들어 STT 에 보낼지
+RECORD_DETECT_SPEECH = os.getenv("RECORD_DETECT_SPEECH", "true").lower() == "true"
+RECORD_STRIP_SILENCE = os.getenv("RECORD_STRIP_SILENCE", "false").lower() == "true"
+
+# 긴 녹음은 무음 경계에서 약 STT_CHUNK_SECONDS 길이로 나눠 STT_MAX_CONCURRENCY 개까지 동시에 전사
+STT_CHUNK_SECONDS = int(os.getenv("STT_CHUNK_SECONDS", "600"))
+STT_MAX_CONCURRENCY = int(os.getenv("STT_MAX_CONCURRENCY", "3"))
+# 한 번의 전사 요청 안에서 조각당 시도 횟수 / STT 요청 하나의 제한 시간(초)
+STT_CHUNK_MAX_ATTEMPTS = 2
+STT_REQUEST_TIMEOUT = 1800
+# 전사 진행 중 표시가 이 시간(초) 동안 갱신되지 않으면 중단된 것으로 보고 다시 시작
+STT_STALE_SECONDS = 3600
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # 파일은 S3에 저장
@@ -164,6 +276,8 @@ STORAGES = {
 AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_REGION_NAME = os.getenv('AWS_S3_REGION_NAME', 'ap-northeast-2')
 POD_ID = os.getenv("POD_ID")
+# STT/SLLM 추론 서버 주소. 로컬 테스트 시 fake_runpod 명령으로 띄운 서버 주소를 넣는다.
+RUNPOD_BASE_URL = os.getenv("RUNPOD_BASE_URL") or f"https://{POD_ID}-8000.proxy.runpod.net/"
 
 
 CSRF_TRUSTED_ORIGINS = [
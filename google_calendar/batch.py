@@ -0,0 +1,19 @@
+from google_calendar.models import OAuthState
+
+# 한 번에 지우는 행 수 (긴 잠금을 피하기 위해 나눠서 삭제)
+SWEEP_BATCH_SIZE = 5000
+
+
+def delete_expired_oauth_states():
+    """
+    콜백까지 오지 않아 남은(만료된) OAuth state 를 일괄 삭제한다.
+    created_at 인덱스를 타는 범위 조회로 PK 를 모아 나눠서 지운다.
+    """
+    deleted_count = 0
+    expired_qs = OAuthState.objects.expired()
+    while True:
+        states = list(expired_qs.values_list("state", flat=True)[:SWEEP_BATCH_SIZE])
+        if not states:
+            return deleted_count
+        deleted, _ = OAuthState.objects.filter(state__in=states).delete()
+        deleted_count += deleted
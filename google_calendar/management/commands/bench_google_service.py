@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
+from google_calendar.services import get_discovery_doc, get_service
+
+
+class Command(BaseCommand):
+    help = "Google API 서비스 객체 생성: discovery.build 와 캐시된 discovery 문서 사용 방식의 요청당 비용을 비교한다."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="반복 횟수 (요청 1회 = calendar + tasks 서비스 생성)")
+
+    def handle(self, *args, **opts):
+        n = opts["requests"]
+        # 네트워크를 타지 않는 가짜 토큰 (서비스 객체 생성만 측정)
+        creds = Credentials(token="bench-token")
+
+        def per_request_build():
+            build("calendar", "v3", credentials=creds)
+            build("tasks", "v1", credentials=creds)
+
+        def per_request_factory():
+            get_service("calendar", "v3", creds)
+            get_service("tasks", "v1", creds)
+
+        started = time.perf_counter()
+        get_discovery_doc("calendar", "v3")
+        get_discovery_doc("tasks", "v1")
+        warmup_ms = (time.perf_counter() - started) * 1000
+
+        results = []
+        for label, fn in (("discovery.build", per_request_build), ("get_service", per_request_factory)):
+            fn()
+            started = time.perf_counter()
+            for _ in range(n):
+                fn()
+            results.append((label, (time.perf_counter() - started) * 1000 / n))
+
+        self.stdout.write(f"요청 {n}회 (calendar v3 + tasks v1 서비스 생성)")
+        self.stdout.write(f"discovery 문서 최초 로드(프로세스당 1회): {warmup_ms:.1f}ms")
+        for label, per_ms in results:
+            self.stdout.write(f"{label:16s}: 요청당 {per_ms:7.2f}ms")
+        self.stdout.write(f"요청당 절감: {results[0][1] - results[1][1]:.2f}ms (x{results[0][1] / max(results[1][1], 1e-9):.1f})")
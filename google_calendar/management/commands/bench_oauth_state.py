@@ -0,0 +1,73 @@
+import secrets
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from google_calendar.batch import delete_expired_oauth_states
+from google_calendar.models import OAuthState
+
+BENCH_PREFIX = "bench-"
+
+
+class Command(BaseCommand):
+    help = (
+        "OAuth state 부하 테스트: 행 수를 늘려 가며 콜백 조회(valid().get) 비용이 일정한지 확인하고 "
+        "만료 state 일괄 삭제 시간을 잰다. 테스트 행은 bench- 접두어로 만들고 끝나면 지운다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--total", type=int, default=100_000, help="최종 state 행 수")
+        parser.add_argument("--steps", type=int, default=3, help="측정 구간 수 (total 의 1/10^n 부터)")
+        parser.add_argument("--lookups", type=int, default=500, help="구간마다 조회 횟수")
+        parser.add_argument("--expired-ratio", type=float, default=0.9, help="만료 상태로 만들 비율")
+
+    def _fill(self, count, expired_ratio):
+        """count 개의 state 를 만들고 그중 expired_ratio 만큼을 TTL 이전 시각으로 돌린다."""
+        rows = [
+            OAuthState(state=f"{BENCH_PREFIX}{secrets.token_urlsafe(24)}", user_id="bench")
+            for _ in range(count)
+        ]
+        OAuthState.objects.bulk_create(rows, batch_size=5000)
+        expired = [r.state for r in rows[: int(count * expired_ratio)]]
+        old = timezone.now() - timedelta(seconds=settings.OAUTH_STATE_TTL * 2)
+        for i in range(0, len(expired), 5000):
+            OAuthState.objects.filter(state__in=expired[i:i + 5000]).update(created_at=old)
+        return [r.state for r in rows[int(count * expired_ratio):]]
+
+    def _lookup_us(self, states, lookups):
+        picks = [states[i % len(states)] for i in range(lookups)]
+        started = time.perf_counter()
+        for state in picks:
+            OAuthState.objects.valid().get(state=state)
+        return (time.perf_counter() - started) * 1_000_000 / lookups
+
+    def handle(self, *args, **opts):
+        total = opts["total"]
+        sizes = sorted({max(1, total // (10 ** n)) for n in range(opts["steps"])})
+        valid_states = []
+        created = 0
+        try:
+            for size in sizes:
+                valid_states += self._fill(size - created, opts["expired_ratio"])
+                created = size
+                us = self._lookup_us(valid_states, opts["lookups"])
+                self.stdout.write(f"state {size:>8,}행: 콜백 조회 평균 {us:8.1f}us")
+
+            with CaptureQueriesContext(connection) as ctx:
+                OAuthState.objects.valid().get(state=valid_states[0])
+            self.stdout.write(f"조회 SQL: {ctx.captured_queries[0]['sql']}")
+
+            started = time.perf_counter()
+            swept = delete_expired_oauth_states()
+            self.stdout.write(
+                f"만료 state 일괄 삭제: {swept:,}행 / {(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+            us = self._lookup_us(valid_states, opts["lookups"])
+            self.stdout.write(f"삭제 후 {OAuthState.objects.count():,}행: 콜백 조회 평균 {us:8.1f}us")
+        finally:
+            OAuthState.objects.filter(state__startswith=BENCH_PREFIX).delete()
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('google_calendar', '0001_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendar_id', models.CharField(max_length=255)),
+                ('event_id', models.CharField(max_length=255)),
+                ('title', models.TextField(blank=True, default='')),
+                ('description', models.TextField(blank=True, default='')),
+                ('start', models.CharField(max_length=64)),
+                ('end', models.CharField(max_length=64)),
+                ('start_at', models.DateTimeField()),
+                ('end_at', models.DateTimeField()),
+                ('all_day', models.BooleanField(default=False)),
+                ('repeat', models.CharField(default='none', max_length=10)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_events', to='users.user')),
+            ],
+            options={
+                'db_table': 'google_calendar_event',
+                'indexes': [models.Index(fields=['user', 'start_at'], name='google_cale_user_id_fe4066_idx')],
+                'unique_together': {('user', 'calendar_id', 'event_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CalendarSyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('calendar_id', models.CharField(max_length=255)),
+                ('sync_token', models.TextField(blank=True, default='')),
+                ('synced_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_sync_states', to='users.user')),
+            ],
+            options={
+                'db_table': 'google_calendar_sync_state',
+                'unique_together': {('user', 'calendar_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('google_calendar', '0002_calendarevent_calendarsyncstate'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='oauthstate',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
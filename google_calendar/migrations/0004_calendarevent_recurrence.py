@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-20 04:12
+
+from django.db import migrations, models
+
+
+def reset_mirror(apps, schema_editor):
+    # 기존 사본/syncToken 은 singleEvents 로 펼친 결과라 반복 일정 원본 형태로 처음부터 다시 받는다.
+    apps.get_model('google_calendar', 'CalendarEvent').objects.all().delete()
+    apps.get_model('google_calendar', 'CalendarSyncState').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('google_calendar', '0003_alter_oauthstate_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarevent',
+            name='cancelled',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='original_start_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurrence',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurring_event_id',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='time_zone',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.RunPython(reset_mirror, migrations.RunPython.noop),
+    ]
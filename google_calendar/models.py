@@ -1,4 +1,8 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from users.models import User
 
 
@@ -19,11 +23,84 @@ class GoogleCalendarToken(models.Model):
         return f"GoogleToken({self.user.user_id})"
 
 
+class OAuthStateQuerySet(models.QuerySet):
+    @staticmethod
+    def cutoff():
+        return timezone.now() - timedelta(seconds=settings.OAUTH_STATE_TTL)
+
+    def valid(self):
+        """OAUTH_STATE_TTL 안에 만들어진 state 만"""
+        return self.filter(created_at__gte=self.cutoff())
+
+    def expired(self):
+        return self.filter(created_at__lt=self.cutoff())
+
+
 class OAuthState(models.Model):
-    """OAuth 인증 과정에서 state와 user_id를 임시 저장"""
+    """OAuth 인증 과정에서 state와 user_id를 임시 저장 (OAUTH_STATE_TTL 초 후 만료)"""
     state = models.CharField(max_length=255, unique=True, primary_key=True)
     user_id = models.CharField(max_length=255)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = OAuthStateQuerySet.as_manager()
 
     class Meta:
         db_table = "oauth_state"
+
+
+class CalendarSyncState(models.Model):
+    """사용자/캘린더별 증분 동기화 상태 (Google events.list 의 nextSyncToken)"""
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="calendar_sync_states",
+    )
+    calendar_id = models.CharField(max_length=255)
+    sync_token = models.TextField(blank=True, default="")
+    synced_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "google_calendar_sync_state"
+        unique_together = ("user", "calendar_id")
+
+    def __str__(self):
+        return f"CalendarSyncState({self.user_id}, {self.calendar_id})"
+
+
+class CalendarEvent(models.Model):
+    """Google Calendar 이벤트의 로컬 사본. 홈 캘린더 피드는 이 테이블에서 읽는다."""
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="calendar_events",
+    )
+    calendar_id = models.CharField(max_length=255)
+    event_id = models.CharField(max_length=255)
+    title = models.TextField(blank=True, default="")
+    description = models.TextField(blank=True, default="")
+    # Google 이 준 원본 문자열 (dateTime 또는 date) - 피드에는 이 값을 그대로 내려준다.
+    start = models.CharField(max_length=64)
+    end = models.CharField(max_length=64)
+    # 기간 조회용 (TIME_ZONE 기준 naive datetime)
+    start_at = models.DateTimeField()
+    end_at = models.DateTimeField()
+    all_day = models.BooleanField(default=False)
+    repeat = models.CharField(max_length=10, default="none")
+    # 반복 일정 원본: RRULE/EXDATE 줄 (start_at/end_at 은 첫 회차). 피드 조회 시 기간만큼 펼친다.
+    recurrence = models.TextField(blank=True, default="")
+    time_zone = models.CharField(max_length=64, blank=True, default="")
+    # 반복 일정에서 따로 수정/취소된 회차: 원본 이벤트 id 와 원래 시작 시각
+    recurring_event_id = models.CharField(max_length=255, blank=True, default="")
+    original_start_at = models.DateTimeField(null=True, blank=True)
+    cancelled = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "google_calendar_event"
+        unique_together = ("user", "calendar_id", "event_id")
+        indexes = [
+            models.Index(fields=["user", "start_at"]),
+        ]
+
+    def __str__(self):
+        return f"CalendarEvent({self.user_id}, {self.event_id})"
@@ -0,0 +1,53 @@
+import json
+import threading
+
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import HttpRequest
+
+from core.metrics import track_external
+
+
+# (api, version) -> 파싱된 discovery 문서 (프로세스 공용, 읽기 전용으로 사용)
+_discovery_docs = {}
+_discovery_lock = threading.Lock()
+
+
+def get_discovery_doc(api: str, version: str) -> dict:
+    """
+    google-api-python-client 에 포함된 정적 discovery 문서를 한 번만 읽어 파싱해 둔다.
+    (calendar v3 문서는 130KB 가 넘어 요청마다 읽고 파싱하는 비용이 크다)
+    """
+    key = (api, version)
+    doc = _discovery_docs.get(key)
+    if doc is None:
+        with _discovery_lock:
+            doc = _discovery_docs.get(key)
+            if doc is None:
+                content = get_static_doc(api, version)
+                if content is None:
+                    raise ValueError(f"discovery 문서가 없습니다: {api} {version}")
+                doc = json.loads(content)
+                _discovery_docs[key] = doc
+    return doc
+
+
+class _TimedHttpRequest(HttpRequest):
+    """execute() 시간을 요청 지표의 google 외부 호출로 기록한다."""
+
+    def execute(self, http=None, num_retries=0):
+        with track_external("google"):
+            return super().execute(http=http, num_retries=num_retries)
+
+
+def get_service(api: str, version: str, credentials):
+    """
+    googleapiclient.discovery.build 대신 사용하는 서비스 팩토리.
+    discovery 문서는 캐시된 것을 쓰고, 서비스 객체(http 포함)는 요청마다 새로 만든다.
+    서비스 객체는 스레드 간에 공유하지 않는다.
+    """
+    return build_from_document(
+        get_discovery_doc(api, version),
+        credentials=credentials,
+        requestBuilder=_TimedHttpRequest,
+    )
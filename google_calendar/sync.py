@@ -0,0 +1,341 @@
+import math
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import httplib2
+from dateutil.rrule import rrulestr
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.errors import HttpError
+
+from core.metrics import track_external
+from google_calendar.models import CalendarEvent, CalendarSyncState
+from google_calendar.services import get_service
+from google_calendar.utils import invalidate_events_cache
+
+
+# events.list 한 페이지 최대 크기 (Google 허용 최대값)
+SYNC_PAGE_SIZE = 2500
+
+# 캘린더별 변경분 조회를 동시에 실행하는 스레드 풀 (프로세스 공용)
+_fetch_pool = None
+_fetch_pool_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def _get_fetch_pool():
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None:
+            _fetch_pool = ThreadPoolExecutor(
+                max_workers=settings.GOOGLE_CALENDAR_FETCH_WORKERS,
+                thread_name_prefix="gcal-fetch",
+            )
+        return _fetch_pool
+
+
+def _thread_http():
+    """
+    httplib2.Http 는 스레드 간 공유가 안전하지 않으므로 풀 스레드마다 하나씩 만들어 재사용한다.
+    timeout 은 소켓 단위라 캘린더 하나가 느려도 해당 요청만 끊긴다.
+    """
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = httplib2.Http(timeout=settings.GOOGLE_CALENDAR_FETCH_TIMEOUT)
+        _thread_local.http = http
+    return http
+
+
+def _repeat_type(event: dict) -> str:
+    repeat_type = "none"
+    if "recurrence" in event:
+        rrule = event["recurrence"][0] if event["recurrence"] else ""
+        if "FREQ=DAILY" in rrule:
+            repeat_type = "daily"
+        elif "FREQ=WEEKLY" in rrule:
+            repeat_type = "weekly"
+        elif "FREQ=MONTHLY" in rrule:
+            repeat_type = "monthly"
+        elif "FREQ=YEARLY" in rrule:
+            repeat_type = "yearly"
+    return repeat_type
+
+
+def parse_event_time(raw: str) -> datetime:
+    """
+    Google 의 dateTime / date 문자열을 TIME_ZONE 기준 naive datetime 으로 바꾼다. (USE_TZ=False)
+    종일 일정(date)은 그날 0시로 취급한다.
+    """
+    parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(ZoneInfo(settings.TIME_ZONE)).replace(tzinfo=None)
+    return parsed
+
+
+def _event_time(value: dict) -> str:
+    return value.get("dateTime") or value.get("date")
+
+
+def _event_row(user_id, calendar_id, event: dict) -> CalendarEvent:
+    original = event.get("originalStartTime")
+    if event.get("status") == "cancelled":
+        # 반복 일정에서 취소된 회차: id/원본 id/원래 시작 시각만 온다. 펼칠 때 그 회차를 빼기 위해 남긴다.
+        start = _event_time(original)
+        return CalendarEvent(
+            user_id=user_id,
+            calendar_id=calendar_id,
+            event_id=event["id"],
+            start=start,
+            end=start,
+            start_at=parse_event_time(start),
+            end_at=parse_event_time(start),
+            all_day="dateTime" not in original,
+            recurring_event_id=event["recurringEventId"],
+            original_start_at=parse_event_time(start),
+            cancelled=True,
+        )
+
+    start = _event_time(event["start"])
+    end = _event_time(event["end"])
+    return CalendarEvent(
+        user_id=user_id,
+        calendar_id=calendar_id,
+        event_id=event["id"],
+        title=event.get("summary", ""),
+        description=event.get("description", ""),
+        start=start,
+        end=end,
+        start_at=parse_event_time(start),
+        end_at=parse_event_time(end),
+        all_day="dateTime" not in event["start"],
+        repeat=_repeat_type(event),
+        recurrence="\n".join(event.get("recurrence", [])),
+        time_zone=event["start"].get("timeZone", ""),
+        recurring_event_id=event.get("recurringEventId", ""),
+        original_start_at=parse_event_time(_event_time(original)) if original else None,
+    )
+
+
+def fetch_calendar_changes(creds, calendar_id, sync_token=""):
+    """
+    풀 스레드에서 실행. sync_token 이 있으면 그 이후 바뀐 이벤트만, 없거나 만료(410)됐으면 전체를 받아온다.
+    - 반환: {"items": [...], "next_sync_token": str, "full_sync": bool}
+    - syncToken 과 timeMin/timeMax/orderBy 는 같이 쓸 수 없으므로 전체 동기화도 기간 없이 받는다.
+      그래서 singleEvents 로 펼치지 않고 반복 일정은 원본(recurrence) 과 따로 수정/취소된 회차만 받는다.
+      (끝이 없는 반복 일정도 이벤트 수가 늘지 않음. 회차는 피드 기간만큼 expand_recurring 에서 만든다)
+    - 서비스 객체는 스레드 간에 공유할 수 없으므로 여기서(풀 스레드에서) 만든다.
+    """
+    service = get_service("calendar", "v3", creds)
+    http = AuthorizedHttp(creds, http=_thread_http())
+    full_sync = not sync_token
+    items = []
+    page_token = None
+
+    while True:
+        params = {
+            "calendarId": calendar_id,
+            "maxResults": SYNC_PAGE_SIZE,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        if not full_sync:
+            params["syncToken"] = sync_token
+
+        try:
+            result = service.events().list(**params).execute(http=http)
+        except HttpError as e:
+            if e.resp.status == 410 and not full_sync:
+                # 토큰이 만료되면 처음부터 전체 동기화
+                full_sync = True
+                items = []
+                page_token = None
+                continue
+            raise
+
+        items.extend(result.get("items", []))
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return {
+                "items": items,
+                "next_sync_token": result.get("nextSyncToken", ""),
+                "full_sync": full_sync,
+            }
+
+
+def apply_calendar_changes(user_id, calendar_id, changes: dict):
+    """fetch_calendar_changes 결과를 로컬 사본과 동기화 상태에 반영한다."""
+    removed_ids = []
+    rows = {}
+    for e in changes["items"]:
+        if e.get("status") == "cancelled" and not e.get("recurringEventId"):
+            removed_ids.append(e["id"])
+            rows.pop(e["id"], None)
+        else:
+            rows[e["id"]] = _event_row(user_id, calendar_id, e)
+
+    with transaction.atomic():
+        qs = CalendarEvent.objects.filter(user_id=user_id, calendar_id=calendar_id)
+        if changes["full_sync"]:
+            qs.delete()
+        else:
+            # 바뀐 이벤트는 지우고 다시 넣는다. (DB 별 upsert 문법 차이를 피하기 위함)
+            stale_ids = removed_ids + list(rows)
+            for i in range(0, len(stale_ids), 500):
+                qs.filter(event_id__in=stale_ids[i:i + 500]).delete()
+            # 반복 일정이 통째로 지워지면 따로 수정/취소된 회차도 함께 지운다.
+            for i in range(0, len(removed_ids), 500):
+                qs.filter(recurring_event_id__in=removed_ids[i:i + 500]).delete()
+        CalendarEvent.objects.bulk_create(rows.values(), batch_size=500)
+
+        CalendarSyncState.objects.update_or_create(
+            user_id=user_id,
+            calendar_id=calendar_id,
+            defaults={
+                "sync_token": changes["next_sync_token"],
+                "synced_at": timezone.now(),
+            },
+        )
+
+
+def sync_calendars(user_id, creds, calendar_ids):
+    """
+    캘린더마다 변경분을 스레드 풀에서 동시에 받아 오고, DB 반영은 요청 스레드에서 한다.
+    제한 시간 안에 끝나지 않았거나 실패한 캘린더는 기존 사본을 그대로 둔다.
+    """
+    tokens = dict(
+        CalendarSyncState.objects.filter(
+            user_id=user_id, calendar_id__in=calendar_ids
+        ).values_list("calendar_id", "sync_token")
+    )
+
+    pool = _get_fetch_pool()
+    futures = [
+        pool.submit(fetch_calendar_changes, creds, calendar_id, tokens.get(calendar_id, ""))
+        for calendar_id in calendar_ids
+    ]
+    # 워커 수보다 캘린더가 많으면 대기열이 생기므로 그만큼 제한 시간을 늘려 준다.
+    rounds = math.ceil(len(futures) / settings.GOOGLE_CALENDAR_FETCH_WORKERS)
+    with track_external("google"):
+        wait(futures, timeout=settings.GOOGLE_CALENDAR_FETCH_TIMEOUT * rounds)
+
+    for calendar_id, future in zip(calendar_ids, futures):
+        if not future.done():
+            future.cancel()
+            continue
+        if future.exception() is not None:
+            continue
+        apply_calendar_changes(user_id, calendar_id, future.result())
+
+    # 목록에서 빠진(구독 해제/삭제된) 캘린더의 사본 정리
+    CalendarEvent.objects.filter(user_id=user_id).exclude(calendar_id__in=calendar_ids).delete()
+    CalendarSyncState.objects.filter(user_id=user_id).exclude(calendar_id__in=calendar_ids).delete()
+
+
+def _zone(name):
+    try:
+        return ZoneInfo(name or settings.TIME_ZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(settings.TIME_ZONE)
+
+
+def expand_recurring(master: CalendarEvent, range_start, range_end, overridden=()):
+    """
+    반복 일정 원본을 [range_start, range_end) 와 겹치는 회차들로 펼친다. (저장하지 않은 CalendarEvent 목록)
+    - 회차 id 는 Google singleEvents 와 같은 형식({원본 id}_{시작 시각}) 이라 회차별 수정/삭제 API 에 그대로 쓸 수 있다.
+    - overridden(원래 시작 시각) 에 있는 회차는 따로 수정/취소된 것이므로 건너뛴다.
+    - 한 원본에서 최대 GOOGLE_CALENDAR_MAX_INSTANCES 개까지만 만든다.
+    """
+    local_tz = ZoneInfo(settings.TIME_ZONE)
+    duration = master.end_at - master.start_at
+    if master.all_day:
+        # 종일 일정은 날짜 단위라 시간대 없이 펼친다.
+        dtstart, after, before = master.start_at, range_start, range_end
+    else:
+        # 일광 절약 시간이 있는 시간대도 벽시계 시각이 유지되도록 이벤트 시간대에서 펼친다.
+        dtstart = master.start_at.replace(tzinfo=local_tz).astimezone(_zone(master.time_zone))
+        after = range_start.replace(tzinfo=local_tz)
+        before = range_end.replace(tzinfo=local_tz)
+
+    occurrences = []
+    try:
+        rules = rrulestr(master.recurrence, dtstart=dtstart, forceset=True)
+        for occ in rules.xafter(after - duration):
+            if occ >= before or len(occurrences) >= settings.GOOGLE_CALENDAR_MAX_INSTANCES:
+                break
+            occurrences.append(occ)
+    except (ValueError, TypeError):
+        # 해석할 수 없는 규칙(UNTIL 시간대 불일치 등)이면 첫 회차만 보여 준다.
+        occurrences = [dtstart] if after - duration < dtstart < before else []
+
+    instances = []
+    for occ in occurrences:
+        end = occ + duration
+        if master.all_day:
+            start_at, end_at = occ, end
+            start_raw, end_raw = occ.date().isoformat(), end.date().isoformat()
+            stamp = occ.strftime("%Y%m%d")
+        else:
+            start_at = occ.astimezone(local_tz).replace(tzinfo=None)
+            end_at = end.astimezone(local_tz).replace(tzinfo=None)
+            start_raw, end_raw = occ.isoformat(), end.isoformat()
+            stamp = occ.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        if start_at in overridden:
+            continue
+        instances.append(
+            CalendarEvent(
+                user_id=master.user_id,
+                calendar_id=master.calendar_id,
+                event_id=f"{master.event_id}_{stamp}",
+                title=master.title,
+                description=master.description,
+                start=start_raw,
+                end=end_raw,
+                start_at=start_at,
+                end_at=end_at,
+                all_day=master.all_day,
+                recurring_event_id=master.event_id,
+                original_start_at=start_at,
+            )
+        )
+    return instances
+
+
+def mirrored_events(user_id, calendar_ids, range_start, range_end):
+    """
+    로컬 사본에서 기간과 겹치는 이벤트를 시작 시각 순으로 돌려준다.
+    반복 일정은 원본만 저장돼 있으므로 여기서 기간만큼 펼치고, 따로 수정된 회차는 그 행을 쓴다.
+    """
+    qs = CalendarEvent.objects.filter(user_id=user_id, calendar_id__in=calendar_ids)
+    events = list(
+        qs.filter(recurrence="", cancelled=False, end_at__gt=range_start, start_at__lt=range_end)
+    )
+
+    masters = list(qs.exclude(recurrence="").filter(cancelled=False, start_at__lt=range_end))
+    if masters:
+        overridden = defaultdict(set)
+        exceptions = qs.exclude(recurring_event_id="").values_list(
+            "calendar_id", "recurring_event_id", "original_start_at"
+        )
+        for calendar_id, recurring_event_id, original_start_at in exceptions:
+            overridden[(calendar_id, recurring_event_id)].add(original_start_at)
+        for master in masters:
+            events.extend(
+                expand_recurring(
+                    master, range_start, range_end, overridden[(master.calendar_id, master.event_id)]
+                )
+            )
+
+    events.sort(key=lambda ev: ev.start_at)
+    return events
+
+
+def clear_calendar_mirror(user_id):
+    """구글 연동을 해제하거나 다시 연결할 때 사용자의 로컬 사본과 피드 캐시를 비운다."""
+    CalendarEvent.objects.filter(user_id=user_id).delete()
+    CalendarSyncState.objects.filter(user_id=user_id).delete()
+    invalidate_events_cache(user_id)
@@ -0,0 +1,108 @@
+import json
+
+from googleapiclient.errors import HttpError
+
+from core.metrics import track_external
+
+# 배치 요청 하나에 담는 호출 수 (Google 은 50개 이하를 권장)
+BATCH_SIZE = 50
+
+
+def task_body(task, meeting_title: str = "") -> dict:
+    """
+    meetings.Task 를 Google Tasks 리소스로 변환.
+    task_content 가 JSON 이면 description/assignee/due 를, 아니면 문자열 그대로 쓴다.
+    """
+    title = task.task_content or ""
+    who = ""
+    when = ""
+    try:
+        parsed = json.loads(task.task_content or "")
+        if isinstance(parsed, dict):
+            title = parsed.get("description") or title
+            who = parsed.get("assignee") or ""
+            when = parsed.get("due") or parsed.get("due_text") or ""
+    except (TypeError, ValueError):
+        pass
+    if task.assignee_id and task.assignee:
+        who = task.assignee.name
+
+    notes = []
+    if meeting_title:
+        notes.append(f"회의: {meeting_title}")
+    if who:
+        notes.append(f"담당: {who}")
+    if when and not task.due_date:
+        notes.append(f"기한: {when}")
+
+    body = {"title": title.strip() or "회의 태스크"}
+    if notes:
+        body["notes"] = "\n".join(notes)
+    if task.due_date:
+        # Tasks API 는 due 의 날짜 부분만 사용한다.
+        body["due"] = f"{task.due_date.isoformat()}T00:00:00.000Z"
+    return body
+
+
+def _run_batch(service, calls):
+    """
+    calls: [(key, api_request)] 를 BATCH_SIZE 단위 배치로 실행.
+    반환: {key: (response, exception)}
+    """
+    results = {}
+
+    def callback(request_id, response, exception):
+        results[request_id] = (response, exception)
+
+    for i in range(0, len(calls), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for key, api_request in calls[i:i + BATCH_SIZE]:
+            batch.add(api_request, request_id=key)
+        with track_external("google"):
+            batch.execute()
+    return results
+
+
+def _is_missing(exception) -> bool:
+    return isinstance(exception, HttpError) and exception.resp.status in (404, 410)
+
+
+def push_tasks(service, tasks, tasklist_id="@default", meeting_title=""):
+    """
+    태스크 목록을 Google Tasks 배치 요청으로 한 번에 내보낸다.
+    - google_task_id 가 있으면 patch, 없으면 insert
+    - patch 대상이 구글에서 지워졌으면(404) 새로 insert
+    반환: (created, updated, failed) - created/updated 는 {task_id: google_task_id}, failed 는 [task_id]
+    """
+    by_key = {str(t.task_id): t for t in tasks}
+    bodies = {key: task_body(t, meeting_title) for key, t in by_key.items()}
+
+    calls = []
+    for key, t in by_key.items():
+        if t.google_task_id:
+            api_request = service.tasks().patch(
+                tasklist=tasklist_id, task=t.google_task_id, body=bodies[key]
+            )
+        else:
+            api_request = service.tasks().insert(tasklist=tasklist_id, body=bodies[key])
+        calls.append((key, api_request))
+
+    created, updated, failed = {}, {}, []
+    reinsert = []
+    for key, (response, exception) in _run_batch(service, calls).items():
+        t = by_key[key]
+        if exception is None:
+            (updated if t.google_task_id else created)[t.task_id] = response.get("id")
+        elif t.google_task_id and _is_missing(exception):
+            reinsert.append((key, service.tasks().insert(tasklist=tasklist_id, body=bodies[key])))
+        else:
+            failed.append(t.task_id)
+
+    for key, (response, exception) in _run_batch(service, reinsert).items():
+        t = by_key[key]
+        if exception is None:
+            created[t.task_id] = response.get("id")
+        else:
+            failed.append(t.task_id)
+
+    return created, updated, sorted(failed)
@@ -0,0 +1,146 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.cache import caches
+
+# 기본 목록 하나만 캘린더에 표시한다.
+DEFAULT_TASKLIST = "@default"
+# updatedMin 기준 시각은 서버 간 시계 차이를 고려해 조금 앞당긴다. (중복 반영은 무해)
+UPDATED_MIN_SKEW = timedelta(minutes=1)
+
+
+def _cache():
+    # 태스크를 바꾼 워커와 조회하는 워커가 다를 수 있으므로 워커 공용 캐시에 둔다.
+    return caches[settings.GOOGLE_SHARED_CACHE]
+
+
+def _snapshot_key(user_id):
+    return f"gcal:tasks-snapshot:{user_id}"
+
+
+def _version_key(user_id):
+    """태스크를 바꿀 때마다 새 값 (다음 조회에서 변경분 확인)"""
+    return f"gcal:tasks-version:{user_id}"
+
+
+def _account_key(user_id):
+    """연동 해제/재연결 때마다 새 값 (예전 계정 스냅샷은 버리고 전체 조회)"""
+    return f"gcal:tasks-account:{user_id}"
+
+
+def _rfc3339_now():
+    return (datetime.now(timezone.utc) - UPDATED_MIN_SKEW).isoformat().replace("+00:00", "Z")
+
+
+def _is_active(task: dict) -> bool:
+    return not task.get("deleted") and not task.get("hidden") and task.get("status") != "completed"
+
+
+def _list_all(service, **params):
+    items = []
+    page_token = None
+    while True:
+        result = service.tasks().list(
+            tasklist=DEFAULT_TASKLIST,
+            pageToken=page_token,
+            maxResults=100,
+            **params,
+        ).execute()
+        items.extend(result.get("items", []))
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return items
+
+
+def _full_snapshot(service) -> dict:
+    updated_min = _rfc3339_now()
+    tasklist = service.tasklists().get(tasklist=DEFAULT_TASKLIST).execute()
+    items = _list_all(service, showCompleted=False, showDeleted=False)
+    return {
+        "tasklist": {
+            "id": tasklist.get("id") or DEFAULT_TASKLIST,
+            "title": tasklist.get("title") or "Tasks",
+        },
+        "tasks": {t["id"]: t for t in items if _is_active(t)},
+        "updated_min": updated_min,
+        "checked_at": time.time(),
+    }
+
+
+def _refresh_snapshot(service, snapshot: dict) -> dict:
+    """
+    마지막 확인 이후 바뀐 태스크만 받아 반영한다.
+    완료/삭제/숨김 처리된 태스크도 알아야 하므로 show* 옵션을 모두 켠다.
+    """
+    updated_min = _rfc3339_now()
+    changed = _list_all(
+        service,
+        updatedMin=snapshot["updated_min"],
+        showCompleted=True,
+        showDeleted=True,
+        showHidden=True,
+    )
+    tasks = snapshot["tasks"]
+    for t in changed:
+        if _is_active(t):
+            tasks[t["id"]] = t
+        else:
+            tasks.pop(t["id"], None)
+    snapshot["updated_min"] = updated_min
+    snapshot["checked_at"] = time.time()
+    return snapshot
+
+
+def get_tasks_snapshot(user_id, service_factory) -> dict:
+    """
+    사용자 기본 태스크 목록의 스냅샷. {"tasklist": {"id", "title"}, "tasks": {id: task}}
+    - GOOGLE_TASKS_SNAPSHOT_TTL 초 안에 확인했다면 Google 을 호출하지 않는다.
+    - 그 이후에는 updatedMin 조건 요청 한 번으로 변경분만 반영한다.
+    - 어느 워커에서든 태스크를 바꿨으면(mark_tasks_stale) TTL 과 관계없이 변경분을 확인하고,
+      연동 해제/재연결(forget_tasks_snapshot) 전에 만든 스냅샷은 쓰지 않는다.
+    - service_factory 는 실제로 호출이 필요할 때만 불린다.
+    """
+    if not user_id:
+        # 로그인 사용자를 알 수 없으면 공유 캐시에 올리지 않고 매번 조회
+        return _full_snapshot(service_factory())
+
+    shared = _cache()
+    key, version_key, account_key = _snapshot_key(user_id), _version_key(user_id), _account_key(user_id)
+    # 표시 값은 Google 을 부르기 전에 읽는다. (조회 중 바뀌면 다음 조회에서 다시 확인)
+    found = shared.get_many([key, version_key, account_key])
+    snapshot = found.get(key)
+    version, account = found.get(version_key), found.get(account_key)
+    if snapshot is not None and snapshot.get("account") != account:
+        snapshot = None
+    if (
+        snapshot is not None
+        and snapshot.get("version") == version
+        and time.time() - snapshot["checked_at"] < settings.GOOGLE_TASKS_SNAPSHOT_TTL
+    ):
+        return snapshot
+
+    service = service_factory()
+    if snapshot is None:
+        snapshot = _full_snapshot(service)
+    else:
+        snapshot = _refresh_snapshot(service, snapshot)
+    snapshot["version"] = version
+    snapshot["account"] = account
+    shared.set(key, snapshot, settings.GOOGLE_TASKS_SNAPSHOT_MAX_AGE)
+    return snapshot
+
+
+def mark_tasks_stale(user_id):
+    """태스크를 만들거나 지운 직후 모든 워커의 다음 조회에서 바로 변경분을 확인하도록 표시한다."""
+    if not user_id:
+        return
+    _cache().set(_version_key(user_id), uuid.uuid4().hex, settings.GOOGLE_TASKS_SNAPSHOT_MAX_AGE)
+
+
+def forget_tasks_snapshot(user_id):
+    """연동 해제/재연결 시 스냅샷을 버린다. 조회 중이던 워커가 예전 계정 스냅샷을 다시 써도 읽히지 않는다."""
+    shared = _cache()
+    shared.delete(_snapshot_key(user_id))
+    shared.set(_account_key(user_id), uuid.uuid4().hex, None)
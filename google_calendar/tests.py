@@ -1,3 +1,346 @@
-from django.test import TestCase
+"""
+구글 연동 상태 조회 쿼리 수 회귀 테스트 (meetings.tests 의 팩토리 사용)와 토큰 메모리 캐시 테스트.
+"""
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+
+from google_calendar import sync, tasks_snapshot, utils
+from google_calendar.models import CalendarEvent, GoogleCalendarToken
+from meetings.tests import QueryCountTestCase, SIZES, make_dataset, make_dept, make_users, query_test_settings
+
+
+@query_test_settings
+class GoogleAuthStatusQueryTests(QueryCountTestCase):
+    def test_google_auth_status_without_token(self):
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                host, _, _ = make_dataset(n, m, k, prefix=f"g{i}-")
+                self.login(host)
+                with self.assertNumQueries(2):
+                    res = self.get("/api/google-auth-status/")
+                self.assertEqual(res.json(), {"authenticated": False})
+
+    def test_google_events_without_token(self):
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                host, _, _ = make_dataset(n, m, k, prefix=f"e{i}-")
+                self.login(host)
+                with self.assertNumQueries(2):
+                    self.get("/api/google-events/", status=401)
+
+
+def _token_json(token, expiry):
+    return json.dumps({
+        "token": token,
+        "refresh_token": "refresh",
+        "client_id": "client",
+        "client_secret": "secret",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "scopes": settings.GOOGLE_OAUTH2_SCOPES,
+        "expiry": expiry.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    })
+
+
+@query_test_settings
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "gcal-tests"},
+})
+class GoogleCredentialsCacheTests(TestCase):
+    """다른 워커에서 연동 해제/재연결한 뒤 이 워커의 메모리 캐시가 폐기된 토큰을 쓰지 않는지"""
+
+    def setUp(self):
+        caches["shared"].clear()
+        utils._credentials.clear()
+        self.addCleanup(utils._credentials.clear)
+        patcher = mock.patch.object(utils, "_ensure_refresher")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        host, _, _ = make_dataset(1, 0, 0, prefix="c-")
+        self.user_id = host.user_id
+        self.token = _token_json("old", utils._utcnow() + timedelta(hours=1))
+        GoogleCalendarToken.objects.create(user=host, token_json=self.token)
+
+    def request(self, **session):
+        return SimpleNamespace(session={"login_user_id": self.user_id, **session})
+
+    def revoke_in_other_worker(self):
+        # 다른 워커의 forget_google_credentials: 이 워커의 _credentials 는 그대로 남는다.
+        GoogleCalendarToken.objects.filter(user_id=self.user_id).delete()
+        saved = dict(utils._credentials)
+        utils.forget_google_credentials(self.user_id)
+        utils._credentials.update(saved)
+
+    def test_cache_hit_skips_db(self):
+        first = utils.get_google_credentials(self.request())
+        self.assertEqual(first.token, "old")
+        with self.assertNumQueries(0):
+            self.assertIs(utils.get_google_credentials(self.request()), first)
+
+    def test_revoke_in_other_worker_drops_cached_token(self):
+        utils.get_google_credentials(self.request())
+        self.revoke_in_other_worker()
+
+        request = self.request()
+        self.assertIsNone(utils.get_google_credentials(request))
+        self.assertNotIn("google_credentials", request.session)
+        self.assertNotIn(self.user_id, utils._credentials)
+
+    def test_revoked_session_token_is_not_reused(self):
+        # 연동 해제 전 다른 브라우저 세션에 남아 있던 토큰
+        request = self.request()
+        utils.get_google_credentials(request)
+        stale_session = dict(request.session)
+        self.revoke_in_other_worker()
+
+        request = self.request(**stale_session)
+        self.assertIsNone(utils.get_google_credentials(request))
+        self.assertNotIn("google_credentials", request.session)
+
+    def test_cache_hit_does_not_write_token_into_session_without_one(self):
+        utils.get_google_credentials(self.request())
+        request = self.request()
+        self.assertIsNotNone(utils.get_google_credentials(request))
+        self.assertNotIn("google_credentials", request.session)
+
+    def test_refresher_skips_revoked_entry(self):
+        expiring = _token_json("old", utils._utcnow() + timedelta(minutes=5))
+        GoogleCalendarToken.objects.filter(user_id=self.user_id).update(token_json=expiring)
+        utils.get_google_credentials(self.request())
+        self.revoke_in_other_worker()
+
+        with mock.patch.object(utils.Credentials, "refresh") as refresh:
+            self.assertEqual(utils.refresh_expiring_credentials(), 0)
+        refresh.assert_not_called()
+        self.assertNotIn(self.user_id, utils._credentials)
+
+    def test_refresher_does_not_overwrite_reconnected_token(self):
+        expiring = _token_json("old", utils._utcnow() + timedelta(minutes=5))
+        GoogleCalendarToken.objects.filter(user_id=self.user_id).update(token_json=expiring)
+        utils.get_google_credentials(self.request())
+        # 갱신 도중 재연결로 DB 토큰이 바뀐 경우
+        reconnected = _token_json("new", utils._utcnow() + timedelta(hours=1))
+
+        def refresh(creds, request):
+            GoogleCalendarToken.objects.filter(user_id=self.user_id).update(token_json=reconnected)
+            creds.token = "refreshed"
+
+        with mock.patch.object(utils.Credentials, "refresh", autospec=True, side_effect=refresh):
+            self.assertEqual(utils.refresh_expiring_credentials(), 0)
+        self.assertEqual(GoogleCalendarToken.objects.get(user_id=self.user_id).token_json, reconnected)
+        self.assertNotIn(self.user_id, utils._credentials)
+
+
+def worker_caches(name):
+    """gunicorn 워커 하나: default 는 워커마다 따로(locmem), shared 는 워커 공용"""
+    return override_settings(CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": f"worker-{name}"},
+        "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "gcal-workers-shared"},
+    })
+
+
+class EventsCacheAcrossWorkersTests(TestCase):
+    def setUp(self):
+        for name in ("a", "b"):
+            with worker_caches(name):
+                caches["default"].clear()
+                caches["shared"].clear()
+        self.start = datetime(2026, 1, 1)
+        self.end = datetime(2026, 2, 1)
+
+    def test_invalidate_on_one_worker_drops_range_cache_on_others(self):
+        for name in ("a", "b"):
+            with worker_caches(name):
+                cache.set(utils.events_cache_key("u1", self.start, self.end), ["예전 일정"])
+
+        with worker_caches("b"):
+            utils.invalidate_events_cache("u1")
+            self.assertIsNone(cache.get(utils.events_cache_key("u1", self.start, self.end)))
+        with worker_caches("a"):
+            self.assertIsNone(cache.get(utils.events_cache_key("u1", self.start, self.end)))
+            # 다른 사용자의 캐시는 그대로
+            self.assertEqual(utils.events_cache_key("u2", self.start, self.end).split(":")[3], "0")
+
+
+class FakeTasksService:
+    """tasks_snapshot 가 쓰는 tasklists().get / tasks().list 만 흉내 낸다."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+
+    def tasklists(self):
+        return SimpleNamespace(get=lambda **kw: SimpleNamespace(execute=lambda: {"id": "list", "title": "Tasks"}))
+
+    def tasks(self):
+        def list_(**params):
+            self.calls.append("updatedMin" in params)
+            return SimpleNamespace(execute=lambda: {"items": list(self.items)})
+        return SimpleNamespace(list=list_)
+
+
+@override_settings(GOOGLE_TASKS_SNAPSHOT_TTL=60)
+class TasksSnapshotAcrossWorkersTests(TestCase):
+    def setUp(self):
+        for name in ("a", "b"):
+            with worker_caches(name):
+                caches["default"].clear()
+                caches["shared"].clear()
+
+    def test_change_on_one_worker_is_seen_by_others(self):
+        service = FakeTasksService([{"id": "t1", "title": "처음"}])
+        with worker_caches("a"):
+            snapshot = tasks_snapshot.get_tasks_snapshot("u1", lambda: service)
+        self.assertEqual(list(snapshot["tasks"]), ["t1"])
+
+        service.items = [{"id": "t2", "title": "새 태스크"}]
+        with worker_caches("b"):
+            tasks_snapshot.mark_tasks_stale("u1")
+        with worker_caches("a"):
+            snapshot = tasks_snapshot.get_tasks_snapshot("u1", lambda: service)
+        self.assertEqual(sorted(snapshot["tasks"]), ["t1", "t2"])
+        self.assertEqual(service.calls, [False, True])
+
+        # 표시 후 한 번 확인했으면 TTL 동안은 Google 을 다시 부르지 않는다
+        with worker_caches("b"):
+            tasks_snapshot.get_tasks_snapshot("u1", lambda: self.fail("Google 을 호출함"))
+
+    def test_relink_on_one_worker_drops_previous_account_everywhere(self):
+        old_account = FakeTasksService([{"id": "old", "title": "예전 계정"}])
+        with worker_caches("a"):
+            tasks_snapshot.get_tasks_snapshot("u1", lambda: old_account)
+        with worker_caches("b"):
+            tasks_snapshot.forget_tasks_snapshot("u1")
+        # 조회 중이던 워커가 예전 계정 스냅샷을 다시 써 넣은 경우
+        with worker_caches("a"):
+            caches["shared"].set(
+                "gcal:tasks-snapshot:u1",
+                {"tasklist": {}, "tasks": {"old": {}}, "updated_min": "", "checked_at": time.time(),
+                 "version": None, "account": None},
+            )
+
+        new_account = FakeTasksService([{"id": "new", "title": "새 계정"}])
+        with worker_caches("a"):
+            snapshot = tasks_snapshot.get_tasks_snapshot("u1", lambda: new_account)
+        self.assertEqual(list(snapshot["tasks"]), ["new"])
+        self.assertEqual(new_account.calls, [False])
+
+
+class FakeCalendarService:
+    """sync 가 쓰는 events().list 만 흉내 낸다. 어느 스레드에서 쓰였는지 기록한다."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.params = []
+        self.threads = set()
+
+    def events(self):
+        def list_(**params):
+            self.params.append(params)
+            self.threads.add(threading.get_ident())
+            page = self.pages[params["calendarId"]]
+            return SimpleNamespace(execute=lambda http=None: page)
+        return SimpleNamespace(list=list_)
+
+
+WEEKLY_MASTER = {
+    "id": "weekly",
+    "summary": "주간 회의",
+    "start": {"dateTime": "2026-01-05T10:00:00+09:00", "timeZone": "Asia/Seoul"},
+    "end": {"dateTime": "2026-01-05T11:00:00+09:00", "timeZone": "Asia/Seoul"},
+    "recurrence": ["RRULE:FREQ=WEEKLY"],
+}
+
+
+class CalendarSyncRecurrenceTests(TestCase):
+    def setUp(self):
+        self.user = make_users(make_dept(), 1, "gcal")[0]
+        self.services = []
+
+    def sync(self, pages):
+        def build(api, version, creds):
+            service = FakeCalendarService(pages)
+            self.services.append(service)
+            return service
+
+        with mock.patch.object(sync, "get_service", side_effect=build), \
+                mock.patch.object(sync, "AuthorizedHttp"):
+            sync.sync_calendars(self.user.user_id, object(), list(pages))
+
+    def test_recurring_events_are_stored_as_master_and_not_expanded_by_google(self):
+        self.sync({
+            "a": {"items": [WEEKLY_MASTER], "nextSyncToken": "t1"},
+            "b": {"items": [], "nextSyncToken": "t2"},
+        })
+
+        # 캘린더마다 풀 스레드에서 서비스를 따로 만들고, 회차 펼치기는 요청하지 않는다
+        self.assertEqual(len(self.services), 2)
+        for service in self.services:
+            self.assertEqual(len(service.threads), 1)
+            self.assertNotIn(threading.get_ident(), service.threads)
+            self.assertTrue(all("singleEvents" not in params for params in service.params))
+        self.assertEqual(
+            list(CalendarEvent.objects.values_list("event_id", "recurrence")),
+            [("weekly", "RRULE:FREQ=WEEKLY")],
+        )
+
+    def test_feed_expands_only_the_requested_range(self):
+        moved = {
+            "id": "weekly_20260112T010000Z",
+            "summary": "주간 회의 (변경)",
+            "recurringEventId": "weekly",
+            "originalStartTime": {"dateTime": "2026-01-12T10:00:00+09:00"},
+            "start": {"dateTime": "2026-01-13T15:00:00+09:00"},
+            "end": {"dateTime": "2026-01-13T16:00:00+09:00"},
+        }
+        cancelled = {
+            "id": "weekly_20260119T010000Z",
+            "status": "cancelled",
+            "recurringEventId": "weekly",
+            "originalStartTime": {"dateTime": "2026-01-19T10:00:00+09:00"},
+        }
+        self.sync({"a": {"items": [WEEKLY_MASTER, moved, cancelled], "nextSyncToken": "t1"}})
+
+        events = sync.mirrored_events(self.user.user_id, ["a"], datetime(2026, 1, 1), datetime(2026, 2, 1))
+        self.assertEqual(
+            [(ev.event_id, ev.start) for ev in events],
+            [
+                ("weekly_20260105T010000Z", "2026-01-05T10:00:00+09:00"),
+                ("weekly_20260112T010000Z", "2026-01-13T15:00:00+09:00"),
+                ("weekly_20260126T010000Z", "2026-01-26T10:00:00+09:00"),
+            ],
+        )
+
+        # 끝이 없는 반복 일정도 먼 미래 기간은 그 기간의 회차만 만든다
+        events = sync.mirrored_events(self.user.user_id, ["a"], datetime(2099, 3, 1), datetime(2099, 3, 15))
+        self.assertEqual([ev.start for ev in events], ["2099-03-02T10:00:00+09:00", "2099-03-09T10:00:00+09:00"])
+
+    @override_settings(GOOGLE_CALENDAR_MAX_INSTANCES=10)
+    def test_instances_per_series_are_capped(self):
+        daily = dict(WEEKLY_MASTER, id="daily", recurrence=["RRULE:FREQ=DAILY"])
+        self.sync({"a": {"items": [daily], "nextSyncToken": "t1"}})
+
+        events = sync.mirrored_events(self.user.user_id, ["a"], datetime(2020, 1, 1), datetime(2030, 12, 31))
+        self.assertEqual(len(events), 10)
+
+    def test_deleting_series_drops_its_exceptions(self):
+        moved = {
+            "id": "weekly_20260112T010000Z",
+            "recurringEventId": "weekly",
+            "originalStartTime": {"dateTime": "2026-01-12T10:00:00+09:00"},
+            "start": {"dateTime": "2026-01-13T15:00:00+09:00"},
+            "end": {"dateTime": "2026-01-13T16:00:00+09:00"},
+        }
+        self.sync({"a": {"items": [WEEKLY_MASTER, moved], "nextSyncToken": "t1"}})
+        self.sync({"a": {"items": [{"id": "weekly", "status": "cancelled"}], "nextSyncToken": "t2"}})
+
+        self.assertFalse(CalendarEvent.objects.exists())
+        self.assertEqual(self.services[-1].params[0]["syncToken"], "t1")
@@ -1,10 +1,212 @@
 import json
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 from google.oauth2.credentials import Credentials
 from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections
 from google_calendar.models import GoogleCalendarToken
 
 
+class _CachedCredentials:
+    """
+    캐시에 올려 둔 사용자 토큰. 갱신 시에는 객체를 바꾸지 않고 새 항목으로 교체한다.
+    version 은 올릴 때의 공용 토큰 버전으로, 다른 워커가 연동을 해제/재연결하면 더 이상 쓰지 않는다.
+    """
+    __slots__ = ("creds", "token_json", "version", "last_used")
+
+    def __init__(self, creds, token_json, version, last_used=None):
+        self.creds = creds
+        self.token_json = token_json
+        self.version = version
+        self.last_used = time.monotonic() if last_used is None else last_used
+
+
+# user_id -> _CachedCredentials (프로세스 공용)
+_credentials = {}
+_credentials_lock = threading.Lock()
+_refresher = None
+
+
 def get_google_credentials(request):
+    """
+    로그인 사용자의 구글 자격 증명.
+    메모리 캐시에 유효한 토큰이 있으면 세션/DB 를 읽지 않고 바로 반환하고,
+    만료가 가까운 토큰은 백그라운드 스레드가 미리 갱신해 둔다.
+    메모리 캐시와 세션 토큰은 워커 공용 토큰 버전이 같을 때만 믿는다.
+    """
+    user_id = request.session.get("login_user_id")
+    version = _credentials_version(user_id) if user_id else None
+    if user_id:
+        entry = _cached_entry(user_id, version)
+        if entry is not None:
+            # 세션에 토큰이 있고 백그라운드에서 갱신된 경우에만 세션에 반영 (매번 쓰지 않음)
+            # 세션에 토큰이 없으면(연동 해제된 세션) 캐시된 토큰을 다시 써 넣지 않는다.
+            stored = request.session.get("google_credentials")
+            if stored and stored != entry.token_json:
+                _store_session_token(request, entry.token_json, version)
+            return entry.creds
+
+    creds = _load_google_credentials(request, version)
+    if creds and user_id:
+        _remember_credentials(user_id, creds, version, request.session.get("google_credentials"))
+    return creds
+
+
+def forget_google_credentials(user_id):
+    """
+    연동 해제/재연결 시 캐시된 토큰을 버린다.
+    공용 토큰 버전을 새로 발급하므로 다른 워커의 메모리 캐시와 다른 세션에 남은 토큰도 더 이상 쓰이지 않는다.
+    """
+    with _credentials_lock:
+        _credentials.pop(user_id, None)
+    shared_cache().set(_credentials_version_key(user_id), uuid.uuid4().hex, None)
+
+
+def shared_cache():
+    """워커 공용 캐시 (GOOGLE_SHARED_CACHE). 워커마다 따로인 default(locmem) 캐시를 무효화할 버전 값을 둔다."""
+    return caches[settings.GOOGLE_SHARED_CACHE]
+
+
+def _credentials_version_key(user_id):
+    return f"gcal:creds-version:{user_id}"
+
+
+def _credentials_version(user_id):
+    """한 번도 해제/재연결하지 않은 사용자는 None"""
+    return shared_cache().get(_credentials_version_key(user_id))
+
+
+def _store_session_token(request, token_json, version):
+    request.session["google_credentials"] = token_json
+    request.session["google_credentials_version"] = version
+
+
+def _drop_cached_entry(user_id, entry):
+    """이 워커의 캐시에서만 내린다 (그 사이 새 항목으로 바뀌었으면 그대로 둔다)"""
+    with _credentials_lock:
+        if _credentials.get(user_id) is entry:
+            del _credentials[user_id]
+
+
+def _cached_entry(user_id, version):
+    with _credentials_lock:
+        entry = _credentials.get(user_id)
+        if entry is None:
+            return None
+        entry.last_used = time.monotonic()
+    # 다른 워커에서 연동 해제/재연결했다면 폐기된 토큰이므로 버린다.
+    if entry.version != version:
+        _drop_cached_entry(user_id, entry)
+        return None
+    # 갱신이 늦어 이미 만료됐다면 기존 경로(요청 안에서 갱신)로 넘긴다.
+    if not entry.creds.valid:
+        return None
+    return entry
+
+
+def _remember_credentials(user_id, creds, version, token_json=None):
+    entry = _CachedCredentials(creds, token_json or creds.to_json(), version)
+    with _credentials_lock:
+        _credentials[user_id] = entry
+    _ensure_refresher()
+
+
+def _utcnow():
+    # google-auth 의 expiry 는 naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def refresh_expiring_credentials():
+    """
+    캐시된 토큰 중 GOOGLE_CREDENTIALS_REFRESH_MARGIN 초 안에 만료되는 것을 미리 갱신한다.
+    GOOGLE_CREDENTIALS_IDLE_TTL 초 동안 쓰이지 않은 사용자는 캐시에서 내린다.
+    반환: 갱신한 사용자 수
+    """
+    from google.auth.transport.requests import Request
+
+    now = time.monotonic()
+    deadline = _utcnow() + timedelta(seconds=settings.GOOGLE_CREDENTIALS_REFRESH_MARGIN)
+    with _credentials_lock:
+        for user_id in [
+            uid for uid, e in _credentials.items()
+            if now - e.last_used > settings.GOOGLE_CREDENTIALS_IDLE_TTL
+        ]:
+            del _credentials[user_id]
+        targets = [
+            (uid, e) for uid, e in _credentials.items()
+            if e.creds.refresh_token and e.creds.expiry and e.creds.expiry <= deadline
+        ]
+
+    refreshed = 0
+    for user_id, entry in targets:
+        # 다른 워커에서 연동 해제/재연결한 토큰은 갱신하지 않고 내린다.
+        if entry.version != _credentials_version(user_id):
+            _drop_cached_entry(user_id, entry)
+            continue
+        # 요청 스레드가 쓰고 있는 객체를 건드리지 않도록 복사본을 갱신
+        creds = Credentials.from_authorized_user_info(
+            json.loads(entry.token_json), settings.GOOGLE_OAUTH2_SCOPES
+        )
+        try:
+            creds.refresh(Request())
+        except Exception:
+            # 갱신 실패(권한 철회 등)는 다음 요청에서 기존 경로가 처리하도록 캐시에서만 내린다.
+            _drop_cached_entry(user_id, entry)
+            continue
+
+        token_json = creds.to_json()
+        # 갱신하는 사이 연동 해제/재연결로 DB 토큰이 바뀌었으면 덮어쓰지 않고 캐시에서도 내린다.
+        updated = GoogleCalendarToken.objects.filter(
+            user_id=user_id, token_json=entry.token_json
+        ).update(token_json=token_json)
+        if not updated:
+            _drop_cached_entry(user_id, entry)
+            continue
+        with _credentials_lock:
+            if _credentials.get(user_id) is entry:
+                _credentials[user_id] = _CachedCredentials(
+                    creds, token_json, entry.version, entry.last_used
+                )
+        refreshed += 1
+    return refreshed
+
+
+def _refresh_loop():
+    while True:
+        time.sleep(settings.GOOGLE_CREDENTIALS_REFRESH_INTERVAL)
+        try:
+            refreshed = refresh_expiring_credentials()
+            if refreshed > 0:
+                print(f"[구글 토큰] 미리 갱신한 사용자 수: {refreshed}")
+        except Exception as e:
+            print(f"[구글 토큰] 갱신 실패: {e}")
+        finally:
+            close_old_connections()
+
+
+def _ensure_refresher():
+    """
+    토큰이 처음 캐시에 올라갈 때 갱신 스레드를 띄운다.
+    (AppConfig.ready 는 runserver 의 RUN_MAIN 에서만 배치를 띄우므로 gunicorn 에서도 동작하도록 지연 시작)
+    """
+    global _refresher
+    if _refresher is not None and _refresher.is_alive():
+        return
+    with _credentials_lock:
+        if _refresher is not None and _refresher.is_alive():
+            return
+        _refresher = threading.Thread(target=_refresh_loop, name="gcal-token-refresher", daemon=True)
+        _refresher.start()
+
+
+def _load_google_credentials(request, version=None):
+    # 0) 다른 세션/워커에서 연동 해제/재연결했다면 세션 토큰은 폐기된 것이므로 DB 에서 다시 읽는다.
+    if request.session.get("google_credentials_version") != version:
+        request.session.pop("google_credentials", None)
+
     # 1) 세션에 있으면 바로 사용
     token_json = request.session.get("google_credentials")
     if token_json:
@@ -25,7 +227,7 @@ def get_google_credentials(request):
                     from google.auth.transport.requests import Request
                     creds.refresh(Request())
                     # 갱신된 토큰을 세션에 저장
-                    request.session["google_credentials"] = creds.to_json()
+                    _store_session_token(request, creds.to_json(), version)
                     # DB에도 저장
                     user_id = request.session.get("login_user_id")
                     if user_id:
@@ -73,7 +275,7 @@ def get_google_credentials(request):
                 creds.refresh(Request())
                 # 갱신된 토큰을 세션과 DB에 저장
                 updated_token = creds.to_json()
-                request.session["google_credentials"] = updated_token
+                _store_session_token(request, updated_token, version)
                 token_obj.token_json = updated_token
                 token_obj.save()
                 return creds
@@ -87,5 +289,27 @@ def get_google_credentials(request):
             return None
 
     # DB 토큰을 세션에 넣어두기
-    request.session["google_credentials"] = token_obj.token_json
+    _store_session_token(request, token_obj.token_json, version)
     return creds
+
+
+def _events_version_key(user_id):
+    return f"gcal:events-version:{user_id}"
+
+
+def events_cache_key(user_id, start, end):
+    """
+    사용자/조회 기간별 google_events 응답 캐시 키.
+    응답은 워커별 default 캐시에 두고, 버전은 워커 공용 캐시에 둔다.
+    일정이 바뀌면(어느 워커에서든) 사용자 버전이 바뀌므로 모든 워커에서 이전 기간 캐시가 더 이상 읽히지 않는다.
+    """
+    version = shared_cache().get(_events_version_key(user_id), 0)
+    return f"gcal:events:{user_id}:{version}:{start.isoformat()}:{end.isoformat()}"
+
+
+def invalidate_events_cache(user_id):
+    """일정 생성/수정/삭제 후 해당 사용자의 기간별 캐시를 모든 워커에서 무효화"""
+    if not user_id:
+        return
+    # 파일 캐시의 incr 는 읽고-쓰기라 겹치면 같은 값이 될 수 있으므로 매번 새 값을 쓴다.
+    shared_cache().set(_events_version_key(user_id), uuid.uuid4().hex, None)
@@ -3,17 +3,56 @@ import json
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
 
 from users.models import User
-from google_calendar.models import GoogleCalendarToken, OAuthState
-from google_calendar.utils import get_google_credentials
+from meetings.models import Meeting, Task
+from google_calendar.models import CalendarEvent, GoogleCalendarToken, OAuthState
+from google_calendar.services import get_service
+from google_calendar.sync import (
+    clear_calendar_mirror,
+    mirrored_events,
+    parse_event_time,
+    sync_calendars,
+)
+from google_calendar.tasks_push import push_tasks
+from google_calendar.tasks_snapshot import (
+    forget_tasks_snapshot,
+    get_tasks_snapshot,
+    mark_tasks_stale,
+)
+from google_calendar.utils import (
+    events_cache_key,
+    forget_google_credentials,
+    get_google_credentials,
+    invalidate_events_cache,
+)
 
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
+
+
+# start/end 파라미터가 없을 때 피드로 내려주는 기간 (로컬 사본에서 조회)
+FEED_TIME_MIN = datetime(2020, 1, 1)
+FEED_TIME_MAX = datetime(2030, 12, 31, 23, 59, 59)
+
+
+def _parse_feed_range(request):
+    """
+    FullCalendar 가 보내는 start/end(ISO 8601) 를 TIME_ZONE 기준 naive datetime 으로 바꾼다.
+    잘못된 값이면 ValueError.
+    """
+    # 인코딩 없이 붙은 "+09:00" 은 쿼리스트링에서 공백으로 바뀌어 들어온다.
+    start = (request.GET.get("start") or "").strip().replace(" ", "+")
+    end = (request.GET.get("end") or "").strip().replace(" ", "+")
+    range_start = parse_event_time(start) if start else FEED_TIME_MIN
+    range_end = parse_event_time(end) if end else FEED_TIME_MAX
+    if range_start >= range_end:
+        raise ValueError("start 는 end 보다 앞서야 합니다.")
+    return range_start, range_end
 
 
 # -------------------------------------------------------------------
@@ -48,10 +87,8 @@ def google_login(request):
     )
 
     # ✅ state와 user_id를 DB에 저장 (세션이 유지되지 않으므로)
-    OAuthState.objects.update_or_create(
-        state=state,
-        defaults={"user_id": login_user_id}
-    )
+    # state 는 매번 새로 만들어지므로 조회 없이 바로 INSERT
+    OAuthState.objects.create(state=state, user_id=login_user_id)
 
     return redirect(authorization_url)
 
@@ -72,9 +109,9 @@ def oauth2callback(request):
             "detail": "인증 상태 정보가 없습니다.",
         }, status=400)
 
-    # DB에서 state로 user_id 조회
+    # DB에서 state로 user_id 조회 (OAUTH_STATE_TTL 이 지난 state 는 거부)
     try:
-        oauth_state = OAuthState.objects.get(state=state)
+        oauth_state = OAuthState.objects.valid().get(state=state)
         login_user_id = oauth_state.user_id
     except OAuthState.DoesNotExist:
         return JsonResponse({
@@ -130,6 +167,10 @@ def oauth2callback(request):
         user=user,
         defaults={"token_json": token_json},
     )
+    # 다른 구글 계정으로 다시 연결했을 수 있으므로 로컬 사본은 처음부터 다시 받는다.
+    clear_calendar_mirror(user.user_id)
+    forget_tasks_snapshot(user.user_id)
+    forget_google_credentials(user.user_id)
 
     # 사용한 state는 DB에서 삭제
     oauth_state.delete()
@@ -150,11 +191,22 @@ def oauth2callback(request):
 # -------------------------------------------------------------------
 def google_events(request):
     creds = get_google_credentials(request)
-    if not creds:
+    login_user_id = request.session.get("login_user_id")
+    if not creds or not login_user_id:
         return JsonResponse({"error": "not_authenticated"}, status=401)
 
-    service = build("calendar", "v3", credentials=creds)
-    tasks_service = None
+    try:
+        range_start, range_end = _parse_feed_range(request)
+    except ValueError:
+        return JsonResponse({"error": "invalid_range"}, status=400)
+
+    # 같은 기간을 짧은 시간 안에 다시 요청하면(월 이동 후 복귀 등) Google 을 거치지 않는다.
+    cache_key = events_cache_key(login_user_id, range_start, range_end)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return JsonResponse(cached, safe=False)
+
+    service = get_service("calendar", "v3", creds)
 
     events = []
     calendars = []
@@ -176,121 +228,92 @@ def google_events(request):
     if not calendars:
         calendars.append({"id": "primary", "summary": "기본 캘린더", "primary": True})
 
-    for cal in calendars:
-        try:
-            events_result = service.events().list(
-                calendarId=cal.get("id", "primary"),
-                timeMin="2020-01-01T00:00:00Z",
-                timeMax="2030-12-31T23:59:59Z",
-                maxResults=500,
-                singleEvents=True,
-                orderBy="startTime",
-            ).execute()
-        except Exception:
-            # 특정 캘린더 조회 실패 시 다른 캘린더는 계속 조회
-            continue
-
-        for e in events_result.get("items", []):
-            repeat_type = "none"
-            if "recurrence" in e:
-                rrule = e["recurrence"][0] if e["recurrence"] else ""
-                if "FREQ=DAILY" in rrule:
-                    repeat_type = "daily"
-                elif "FREQ=WEEKLY" in rrule:
-                    repeat_type = "weekly"
-                elif "FREQ=MONTHLY" in rrule:
-                    repeat_type = "monthly"
-                elif "FREQ=YEARLY" in rrule:
-                    repeat_type = "yearly"
+    # 바뀐 부분만 Google 에서 받아 로컬 사본에 반영한 뒤, 피드는 DB 에서 만든다.
+    summaries = {cal.get("id", "primary"): cal.get("summary", "") for cal in calendars}
+    sync_calendars(login_user_id, creds, list(summaries))
 
-            events.append(
-                {
-                    "id": e["id"],
-                    "title": e.get("summary", ""),
-                    "start": e["start"].get("dateTime") or e["start"].get("date"),
-                    "end": e["end"].get("dateTime") or e["end"].get("date"),
-                    "description": e.get("description", ""),
-                    "repeat": repeat_type,
-                    "calendarId": cal.get("id", "primary"),
-                    "calendarSummary": cal.get("summary", ""),
-                }
-            )
+    for ev in mirrored_events(login_user_id, list(summaries), range_start, range_end):
+        events.append(
+            {
+                "id": ev.event_id,
+                "title": ev.title,
+                "start": ev.start,
+                "end": ev.end,
+                "description": ev.description,
+                "repeat": ev.repeat,
+                "calendarId": ev.calendar_id,
+                "calendarSummary": summaries[ev.calendar_id],
+            }
+        )
 
-    # Google Tasks -> FullCalendar 이벤트 형태로 변환하여 추가
+    # Google Tasks -> FullCalendar 이벤트 형태로 변환하여 추가 (google_calendars 와 같은 스냅샷 사용)
     try:
-        tasks_service = build("tasks", "v1", credentials=creds)
-        default_tasklist = tasks_service.tasklists().get(tasklist="@default").execute()
-        task_calendar_id = default_tasklist.get("id") or "@default"
-        task_calendar_summary = default_tasklist.get("title") or "Tasks"
-
-        task_page_token = None
-        while True:
-            task_list = tasks_service.tasks().list(
-                tasklist="@default",
-                pageToken=task_page_token,
-                showCompleted=False,
-                showDeleted=False,
-                maxResults=100,
-            ).execute()
-
-            for t in task_list.get("items", []):
-                due = t.get("due")
-                if not due:
-                    continue  # 마감일이 없는 태스크는 달력에 표시하지 않음
-
-                start_iso = due
-                end_iso = due
-
-                # notes에 start/end를 JSON 형태로 저장했다면 그것을 우선 사용
-                notes_raw = t.get("notes") or ""
+        snapshot = get_tasks_snapshot(login_user_id, lambda: get_service("tasks", "v1", creds))
+        task_calendar_id = snapshot["tasklist"]["id"]
+        task_calendar_summary = snapshot["tasklist"]["title"]
+
+        for t in snapshot["tasks"].values():
+            due = t.get("due")
+            if not due:
+                continue  # 마감일이 없는 태스크는 달력에 표시하지 않음
+
+            start_iso = due
+            end_iso = due
+
+            # notes에 start/end를 JSON 형태로 저장했다면 그것을 우선 사용
+            notes_raw = t.get("notes") or ""
+            parsed_start = None
+            parsed_end = None
+            try:
+                notes_json = json.loads(notes_raw)
+                parsed_start = notes_json.get("start") or None
+                parsed_end = notes_json.get("end") or None
+            except Exception:
                 parsed_start = None
                 parsed_end = None
+
+            if parsed_start:
+                start_iso = parsed_start
+            if parsed_end:
+                end_iso = parsed_end
+
+            # end 시간이 없으면 +1시간 기본 설정
+            is_timed = "T" in start_iso if start_iso else False
+            if not parsed_end and is_timed:
                 try:
-                    notes_json = json.loads(notes_raw)
-                    parsed_start = notes_json.get("start") or None
-                    parsed_end = notes_json.get("end") or None
+                    parsed = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
+                    end_iso = (parsed + timedelta(hours=1)).isoformat()
                 except Exception:
-                    parsed_start = None
-                    parsed_end = None
-
-                if parsed_start:
-                    start_iso = parsed_start
-                if parsed_end:
-                    end_iso = parsed_end
-
-                # end 시간이 없으면 +1시간 기본 설정
-                is_timed = "T" in start_iso if start_iso else False
-                if not parsed_end and is_timed:
-                    try:
-                        parsed = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
-                        end_iso = (parsed + timedelta(hours=1)).isoformat()
-                    except Exception:
-                        end_iso = start_iso
-                # 시각이 없으면 종일 이벤트로 취급
-                if not is_timed:
                     end_iso = start_iso
+            # 시각이 없으면 종일 이벤트로 취급
+            if not is_timed:
+                end_iso = start_iso
 
-                events.append(
-                    {
-                        "id": f"task-{t.get('id')}",
-                        "title": t.get("title", ""),
-                        "start": start_iso,
-                        "end": end_iso,
-                        "allDay": not is_timed,
-                        "description": notes_raw,
-                        "repeat": "none",
-                        "calendarId": task_calendar_id,
-                        "calendarSummary": task_calendar_summary,
-                    }
-                )
-
-            task_page_token = task_list.get("nextPageToken")
-            if not task_page_token:
-                break
+            # 표시 기간과 겹치지 않는 태스크는 제외
+            try:
+                if parse_event_time(start_iso) >= range_end or parse_event_time(end_iso) < range_start:
+                    continue
+            except ValueError:
+                pass
+
+            events.append(
+                {
+                    "id": f"task-{t.get('id')}",
+                    "title": t.get("title", ""),
+                    "start": start_iso,
+                    "end": end_iso,
+                    "allDay": not is_timed,
+                    "description": notes_raw,
+                    "repeat": "none",
+                    "calendarId": task_calendar_id,
+                    "calendarSummary": task_calendar_summary,
+                }
+            )
     except Exception:
         # Tasks 연동 실패 시에도 기존 캘린더 이벤트 반환
         pass
 
+    cache.set(cache_key, events, settings.GOOGLE_EVENTS_CACHE_TTL)
     return JsonResponse(events, safe=False)
 
 
@@ -323,7 +346,7 @@ def create_google_event(request):
     if not title or not start or not end:
         return JsonResponse({"error": "missing_fields"}, status=400)
 
-    service = build("calendar", "v3", credentials=creds)
+    service = get_service("calendar", "v3", creds)
 
     time_zone = "Asia/Seoul"
 
@@ -363,6 +386,7 @@ def create_google_event(request):
             status=500,
         )
 
+    invalidate_events_cache(request.session.get("login_user_id"))
     return JsonResponse(
         {
             "id": created_event.get("id"),
@@ -406,7 +430,7 @@ def create_google_task(request):
         return JsonResponse({"error": "missing_fields"}, status=400)
 
     try:
-        service = build("tasks", "v1", credentials=creds)
+        service = get_service("tasks", "v1", creds)
         body = {
             "title": title,
             "due": due,
@@ -415,6 +439,8 @@ def create_google_task(request):
             body["notes"] = notes
 
         task = service.tasks().insert(tasklist=tasklist_id, body=body).execute()
+        mark_tasks_stale(request.session.get("login_user_id"))
+        invalidate_events_cache(request.session.get("login_user_id"))
         return JsonResponse({"ok": True, "task_id": task.get("id")})
     except Exception as e:
         return JsonResponse(
@@ -423,6 +449,64 @@ def create_google_task(request):
         )
 
 
+# -------------------------------------------------------------------
+# 회의 태스크 일괄 내보내기 (Google Tasks 배치 요청)
+#  - /api/google-tasks/meetings/<meeting_id>/push/
+# -------------------------------------------------------------------
+@csrf_exempt
+@require_POST
+def push_meeting_tasks(request, meeting_id):
+    """
+    회의의 태스크 전체를 Google Tasks 에 한 번의 배치 요청으로 내보낸다. 주최자만 가능.
+    내보낸 구글 태스크 ID 를 Task 에 저장해 두므로 다시 내보내면 중복 생성 대신 수정된다.
+    """
+    creds = get_google_credentials(request)
+    if not creds:
+        return JsonResponse({"error": "not_authenticated"}, status=401)
+
+    try:
+        meeting = Meeting.objects.get(pk=meeting_id)
+    except Meeting.DoesNotExist:
+        return JsonResponse({"error": "meeting_not_found"}, status=404)
+
+    login_user_id = request.session.get("login_user_id")
+    if not login_user_id or str(meeting.host_id) != str(login_user_id):
+        return JsonResponse({"error": "forbidden", "detail": "주최자만 내보낼 수 있습니다."}, status=403)
+
+    tasks = list(meeting.tasks.select_related("assignee").order_by("task_id"))
+    if not tasks:
+        return JsonResponse({"ok": True, "created": 0, "updated": 0, "failed": []})
+
+    try:
+        service = get_service("tasks", "v1", creds)
+        created, updated, failed = push_tasks(service, tasks, meeting_title=meeting.title or "")
+    except Exception as e:
+        return JsonResponse(
+            {"error": "google_api_error", "detail": str(e)},
+            status=500,
+        )
+
+    changed = []
+    for t in tasks:
+        google_task_id = created.get(t.task_id) or updated.get(t.task_id)
+        if google_task_id and google_task_id != t.google_task_id:
+            t.google_task_id = google_task_id
+            changed.append(t)
+    if changed:
+        Task.objects.bulk_update(changed, ["google_task_id"])
+
+    mark_tasks_stale(login_user_id)
+    invalidate_events_cache(login_user_id)
+    return JsonResponse(
+        {
+            "ok": not failed,
+            "created": len(created),
+            "updated": len(updated),
+            "failed": failed,
+        }
+    )
+
+
 # -------------------------------------------------------------------
 # Google Calendar 인증 여부 확인
 #  - /api/google-auth-status/
@@ -464,7 +548,7 @@ def update_google_event(request, event_id):
     if not title or not start or not end:
         return JsonResponse({"error": "missing_fields"}, status=400)
 
-    service = build("calendar", "v3", credentials=creds)
+    service = get_service("calendar", "v3", creds)
     time_zone = "Asia/Seoul"
 
     event_body = {
@@ -504,6 +588,7 @@ def update_google_event(request, event_id):
             status=500,
         )
 
+    invalidate_events_cache(request.session.get("login_user_id"))
     return JsonResponse(
         {
             "id": updated_event.get("id"),
@@ -538,15 +623,16 @@ def google_events_delete(request, event_id):
         task_id = event_id.replace("task-", "", 1)
         tasklist_id = calendar_id or "@default"
         try:
-            tasks_service = build("tasks", "v1", credentials=creds)
+            tasks_service = get_service("tasks", "v1", creds)
             tasks_service.tasks().delete(tasklist=tasklist_id, task=task_id).execute()
         except Exception as e:
             return JsonResponse(
                 {"error": "google_api_error", "detail": str(e)},
                 status=500,
             )
+        mark_tasks_stale(request.session.get("login_user_id"))
     else:
-        service = build("calendar", "v3", credentials=creds)
+        service = get_service("calendar", "v3", creds)
         try:
             service.events().delete(
                 calendarId=calendar_id,
@@ -557,7 +643,14 @@ def google_events_delete(request, event_id):
                 {"error": "google_api_error", "detail": str(e)},
                 status=500,
             )
-
+        # 다음 동기화를 기다리지 않고 로컬 사본에서도 바로 지운다.
+        CalendarEvent.objects.filter(
+            user_id=request.session.get("login_user_id"),
+            calendar_id=calendar_id,
+            event_id=event_id,
+        ).delete()
+
+    invalidate_events_cache(request.session.get("login_user_id"))
     return JsonResponse({"success": True})
 
 
@@ -569,7 +662,7 @@ def google_calendars(request):
     if not creds:
         return JsonResponse({"error": "not_authenticated"}, status=401)
 
-    service = build("calendar", "v3", credentials=creds)
+    service = get_service("calendar", "v3", creds)
     calendars = []
     page_token = None
 
@@ -596,14 +689,16 @@ def google_calendars(request):
             }
         )
 
-    # 기본 Tasks 리스트도 별도 캘린더로 노출
+    # 기본 Tasks 리스트도 별도 캘린더로 노출 (google_events 와 같은 스냅샷 사용)
     try:
-        tasks_service = build("tasks", "v1", credentials=creds)
-        default_tasklist = tasks_service.tasklists().get(tasklist="@default").execute()
+        snapshot = get_tasks_snapshot(
+            request.session.get("login_user_id"),
+            lambda: get_service("tasks", "v1", creds),
+        )
         result.append(
             {
-                "id": default_tasklist.get("id") or "@default",
-                "summary": default_tasklist.get("title") or "Tasks",
+                "id": snapshot["tasklist"]["id"],
+                "summary": snapshot["tasklist"]["title"],
                 "primary": False,
                 "is_task_list": True,
             }
@@ -634,6 +729,9 @@ def revoke_google_auth(request):
     try:
         user = User.objects.get(user_id=login_user_id)
         GoogleCalendarToken.objects.filter(user=user).delete()
+        clear_calendar_mirror(user.user_id)
+        forget_tasks_snapshot(user.user_id)
+        forget_google_credentials(user.user_id)
 
         # 세션에서도 제거
         if "google_credentials" in request.session:
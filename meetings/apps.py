@@ -23,11 +23,7 @@ class MeetingsConfig(AppConfig):
         time.sleep(300)
 
         while True:
-            from .batch import delete_expired_s3_files
-            deleted = delete_expired_s3_files()
-            if deleted > 0:
-                print(f"[배치] 삭제된 파일 수: {deleted}")
-            else:
-                print("[배치] 삭제할 파일 없음")
+            from .batch import run_batch
+            run_batch()
 
-            time.sleep(3600)  # 1시간 대기
\ No newline at end of file
+            time.sleep(3600)  # 1시간 대기
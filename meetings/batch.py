@@ -2,7 +2,9 @@
 from django.utils import timezone
 from django.conf import settings
 import boto3
-from .models import S3File
+import os
+from datetime import timedelta
+from .models import S3File, TranscriptChunk, UploadSession
 
 def delete_expired_s3_files():
     now = timezone.now()
@@ -21,10 +23,87 @@ def delete_expired_s3_files():
     # 메모리 절약을 위해 iterator 사용
     for obj in expired_qs.iterator():
         try:
-            s3.delete_object(Bucket=bucket, Key=obj.s3_key)
+            # STT 조각(<s3_key>.chunkNNN.wav)도 함께 지운다. 짧은 녹음의 조각은 원본 키를 그대로 쓰므로 중복 제거
+            chunk_qs = TranscriptChunk.objects.filter(source_key=obj.s3_key)
+            keys = {obj.s3_key, obj.original_s3_key, obj.stripped_s3_key}
+            keys.update(chunk_qs.values_list("s3_key", flat=True))
+            for key in keys:
+                if key:
+                    s3.delete_object(Bucket=bucket, Key=key)
+            chunk_qs.delete()
             obj.delete()
             deleted_count += 1
         except Exception as e:
             print(f"삭제 실패: {obj.s3_key}, 오류: {e}")
 
     return deleted_count
+
+
+def delete_stale_upload_sessions():
+    """
+    RECORD_UPLOAD_SESSION_TTL 동안 조각이 오지 않은 미완료 분할 업로드와 스풀 파일을 정리한다.
+    완료된 세션 기록도 같은 기준으로 지운다. (녹음 파일은 S3File/Meeting 에 연결되어 있어 영향 없음)
+    """
+    from .utils.upload_spool import remove_spool
+
+    cutoff = timezone.now() - timedelta(seconds=settings.RECORD_UPLOAD_SESSION_TTL)
+    stale_qs = UploadSession.objects.filter(updated_at__lt=cutoff)
+
+    deleted_count = 0
+    for upload_id in stale_qs.values_list("upload_id", flat=True).iterator():
+        remove_spool(upload_id)
+        deleted_count += 1
+    stale_qs.delete()
+
+    # 세션 기록 없이 남은 스풀(세션 삭제 도중 실패 등)도 마지막 수정 시각 기준으로 지운다.
+    deleted_count += delete_orphan_spools(cutoff.timestamp())
+    return deleted_count
+
+
+def delete_orphan_spools(cutoff_ts):
+    from .utils.upload_spool import spool_path
+
+    spool_dir = settings.RECORD_UPLOAD_SPOOL_DIR
+    try:
+        names = os.listdir(spool_dir)
+    except FileNotFoundError:
+        return 0
+
+    live = {
+        os.path.basename(spool_path(upload_id))
+        for upload_id in UploadSession.objects.values_list("upload_id", flat=True).iterator()
+    }
+    deleted_count = 0
+    for name in names:
+        path = os.path.join(spool_dir, name)
+        if not name.endswith(".part") or name in live:
+            continue
+        try:
+            if os.path.getmtime(path) < cutoff_ts:
+                os.remove(path)
+                deleted_count += 1
+        except FileNotFoundError:
+            pass
+    return deleted_count
+
+
+def run_batch():
+    """
+    정리 작업을 한 번 돌린다.
+    runserver(RUN_MAIN) 에서는 MeetingsConfig 의 배치 스레드가, gunicorn 배포에서는
+    cron 의 `python manage.py run_batch` 가 호출한다.
+    """
+    deleted = delete_expired_s3_files()
+    if deleted > 0:
+        print(f"[배치] 삭제된 파일 수: {deleted}")
+    else:
+        print("[배치] 삭제할 파일 없음")
+
+    stale = delete_stale_upload_sessions()
+    if stale > 0:
+        print(f"[배치] 정리된 미완료 업로드: {stale}")
+
+    from google_calendar.batch import delete_expired_oauth_states
+    swept = delete_expired_oauth_states()
+    if swept > 0:
+        print(f"[배치] 만료된 OAuth state 삭제: {swept}")
@@ -0,0 +1,84 @@
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# 요청 처리 경로에서 늦게 로드되어야 하는 무거운 패키지
+HEAVY_PACKAGES = ["docx", "reportlab", "boto3", "botocore", "requests", "googleapiclient"]
+
+
+def run_importtime(module: str):
+    """
+    새 인터프리터에서 django.setup() 후 module 을 import 하며 `python -X importtime` 결과를 읽는다.
+    반환: module import 중에 새로 로드된 (level, 모듈명, cumulative_us) 목록과 module 의 cumulative_us
+    """
+    code = f"import django; django.setup(); import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(settings.BASE_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        level = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        entries.append((level, raw_name.strip(), int(cumulative_us)))
+
+    # 자식 모듈이 부모보다 먼저 출력되므로, 대상 모듈 바로 앞의 최상위 항목 이후가 대상 모듈의 하위 import 다.
+    target_idx = max(
+        (i for i, (level, name, _) in enumerate(entries) if level == 0 and name == module),
+        default=None,
+    )
+    if target_idx is None:
+        return [], 0
+    first_idx = max(
+        (i for i, (level, _, _) in enumerate(entries[:target_idx]) if level == 0),
+        default=-1,
+    ) + 1
+    return entries[first_idx:target_idx], entries[target_idx][2]
+
+
+class Command(BaseCommand):
+    help = "python -X importtime 으로 모듈 import 비용(cumulative)과 무거운 패키지 로드 여부를 측정한다."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            default=["meetings.views"],
+            help="측정할 모듈 (기본: meetings.views)",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값 출력)")
+        parser.add_argument("--top", type=int, default=10, help="cumulative 기준 상위 N개 하위 모듈 출력")
+
+    def handle(self, *args, **opts):
+        for module in opts["modules"]:
+            runs = [run_importtime(module) for _ in range(max(1, opts["repeat"]))]
+            cumulative = [cum for _, cum in runs]
+            children = runs[-1][0]
+
+            self.stdout.write(
+                f"[{module}] cumulative median {statistics.median(cumulative) / 1000:.1f}ms "
+                f"(min {min(cumulative) / 1000:.1f}ms, max {max(cumulative) / 1000:.1f}ms, n={len(runs)})"
+            )
+
+            loaded = sorted({
+                name.split(".")[0] for _, name, _ in children
+                if name.split(".")[0] in HEAVY_PACKAGES
+            })
+            self.stdout.write(f"  함께 로드된 무거운 패키지: {', '.join(loaded) if loaded else '없음'}")
+
+            heaviest = sorted(
+                ((name, cum) for level, name, cum in children if level == 1),
+                key=lambda item: item[1],
+                reverse=True,
+            )[: opts["top"]]
+            for name, cum in heaviest:
+                self.stdout.write(f"  {cum / 1000:8.1f}ms  {name}")
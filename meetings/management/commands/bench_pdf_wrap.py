@@ -0,0 +1,101 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from reportlab.pdfbase import pdfmetrics
+
+from meetings.utils.minutes_export import KOREAN_FONT_NAME, get_glyph_widths
+
+WORDS = [
+    "회의", "안건", "검토", "결과", "일정", "공유", "담당자", "마케팅", "예산", "출시",
+    "디자인", "시안", "확정", "다음", "주까지", "보고서", "작성", "고객", "피드백", "반영",
+]
+
+
+def legacy_wrap_line(line: str, max_width: float, font_size: int = 10):
+    """기존 minutes_download 의 줄바꿈 (비교용으로 그대로 보존)"""
+    font = KOREAN_FONT_NAME
+    words = line.split()
+    if not words:
+        return [""]
+    lines_local = []
+    current = words[0]
+    for word in words[1:]:
+        candidate = f"{current} {word}"
+        if pdfmetrics.stringWidth(candidate, font, font_size) <= max_width:
+            current = candidate
+        else:
+            lines_local.append(current)
+            current = word
+    if pdfmetrics.stringWidth(current, font, font_size) > max_width:
+        tmp = current
+        while pdfmetrics.stringWidth(tmp, font, font_size) > max_width:
+            cut = len(tmp)
+            while cut > 0 and pdfmetrics.stringWidth(tmp[:cut], font, font_size) > max_width:
+                cut -= 1
+            if cut <= 0:
+                break
+            lines_local.append(tmp[:cut])
+            tmp = tmp[cut:]
+        if tmp:
+            lines_local.append(tmp)
+    else:
+        lines_local.append(current)
+    return lines_local
+
+
+def build_transcript(rng: random.Random, lines: int, words_per_line: int, long_every: int):
+    """
+    '화자: 발화' 형태의 긴 전문을 만든다.
+    long_every 줄마다 띄어쓰기 없는 긴 문장을 넣어 강제 분리 경로도 측정한다.
+    """
+    result = []
+    for i in range(lines):
+        if long_every and i % long_every == 0:
+            text = "".join(rng.choice(WORDS) for _ in range(words_per_line))
+        else:
+            text = " ".join(rng.choice(WORDS) for _ in range(words_per_line))
+        result.append(f"SPEAKER_{i % 4:02d}: {text}")
+    return result
+
+
+class Command(BaseCommand):
+    help = "회의록 PDF 줄바꿈: 기존(stringWidth 반복) 방식과 글자 폭 표 방식의 속도를 비교한다."
+    # URL 체크가 meetings.views 를 import 하면 폰트가 미리 등록되어 표 생성 시간이 측정되지 않는다.
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lines", type=int, default=2000, help="전문 줄 수")
+        parser.add_argument("--words", type=int, default=60, help="줄당 단어 수")
+        parser.add_argument("--long-every", type=int, default=10, help="N줄마다 띄어쓰기 없는 줄 삽입 (0이면 없음)")
+        parser.add_argument("--width", type=float, default=485.0, help="줄 폭(pt), 기본값은 A4 본문 폭")
+        parser.add_argument("--font-size", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **opts):
+        # 폰트 등록 + 글자 폭 표 생성 (측정 대상에서 제외)
+        started = time.perf_counter()
+        glyph_widths = get_glyph_widths()
+        table_ms = (time.perf_counter() - started) * 1000
+
+        rng = random.Random(opts["seed"])
+        transcript = build_transcript(rng, opts["lines"], opts["words"], opts["long_every"])
+        total_chars = sum(len(ln) for ln in transcript)
+        width = opts["width"]
+        font_size = opts["font_size"]
+
+        started = time.perf_counter()
+        legacy = [legacy_wrap_line(ln, width, font_size) for ln in transcript]
+        legacy_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        wrapped = [glyph_widths.wrap_line(ln, width, font_size) for ln in transcript]
+        table_s = time.perf_counter() - started
+
+        same = sum(1 for a, b in zip(legacy, wrapped) if a == b)
+
+        self.stdout.write(f"입력: {len(transcript)}줄 / {total_chars:,}자, 폭 {width}pt, {font_size}pt")
+        self.stdout.write(f"글자 폭 표 생성(폰트 등록 포함): {table_ms:.1f}ms")
+        self.stdout.write(f"기존 방식   : {legacy_s * 1000:10.1f}ms")
+        self.stdout.write(f"글자 폭 표  : {table_s * 1000:10.1f}ms  (x{legacy_s / max(table_s, 1e-9):.1f})")
+        self.stdout.write(f"결과 동일한 줄: {same}/{len(transcript)}")
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from meetings.utils.fake_runpod import FakeRunpod, make_fake_server
+
+
+class Command(BaseCommand):
+    help = (
+        "RunPod STT/SLLM 서버 대신 쓸 로컬 가짜 추론 서버를 띄운다. (/health, /stt, /inference) "
+        "RUNPOD_BASE_URL 을 출력된 주소로 설정하면 실제 파드 없이 파이프라인을 돌려 볼 수 있다."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8001)
+        parser.add_argument("--stt-latency", type=float, default=1.0, help="/stt 요청당 지연(초)")
+        parser.add_argument("--sllm-latency", type=float, default=1.0, help="/inference 요청당 지연(초)")
+        parser.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 무작위 최대값(초)")
+        parser.add_argument("--failure-rate", type=float, default=0.0, help="요청 실패 확률 (0~1)")
+        parser.add_argument("--segments", type=int, default=20, help="/stt 응답 발화 수")
+        parser.add_argument("--segment-words", type=int, default=12, help="발화당 단어 수")
+        parser.add_argument("--speakers", type=int, default=3)
+        parser.add_argument("--tasks", type=int, default=3, help="/inference 응답 태스크 수")
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument("--verbose-log", action="store_true", help="요청마다 접근 로그 출력")
+
+    def handle(self, *args, **opts):
+        app = FakeRunpod(
+            stt_latency=opts["stt_latency"],
+            sllm_latency=opts["sllm_latency"],
+            jitter=opts["jitter"],
+            failure_rate=opts["failure_rate"],
+            segments=opts["segments"],
+            segment_words=opts["segment_words"],
+            speakers=opts["speakers"],
+            tasks=opts["tasks"],
+            seed=opts["seed"],
+        )
+        server = make_fake_server(app, opts["host"], opts["port"], quiet=not opts["verbose_log"])
+        self.stdout.write(f"fake runpod listening: RUNPOD_BASE_URL=http://{opts['host']}:{server.server_port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f"요청 수: {app.counts}")
@@ -0,0 +1,258 @@
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from meetings.models import Attendee, Meeting, Task
+from meetings.utils.fake_runpod import WORDS
+from users.models import Dept, User
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서지현준우하윤도예은수빈태영진호성연주원"
+DOMAINS = ["마케팅", "IT", "디자인", "회계", ""]
+PLACES = ["대회의실", "소회의실 A", "소회의실 B", "화상회의", "라운지"]
+DUE_TEXTS = ["이번 주 금요일", "다음 주 월요일", "다음 주까지", "월말", "분기 말"]
+
+
+def fake_name(index: int) -> str:
+    """사용자 번호로 정해지는 이름 (같은 번호면 항상 같은 이름)"""
+    return (
+        SURNAMES[index % len(SURNAMES)]
+        + GIVEN[(index // len(SURNAMES)) % len(GIVEN)]
+        + GIVEN[(index // (len(SURNAMES) * len(GIVEN))) % len(GIVEN)]
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "벤치마크/프로파일링용 가짜 데이터(부서, 사용자, 회의, 참석자, 할 일)를 bulk_create 로 대량 생성한다. "
+        "같은 --seed/--end-date 이면 같은 데이터가 만들어지고, --scale 로 10배/100배 규모를 만든다. "
+        "생성된 데이터는 --prefix 로 구분하며 --clear 로 지운다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--depts", type=int, default=20, help="부서 수")
+        parser.add_argument("--users", type=int, default=2000, help="사용자 수 (--scale 배)")
+        parser.add_argument("--meetings", type=int, default=20000, help="회의 수 (--scale 배)")
+        parser.add_argument("--scale", type=float, default=1.0, help="사용자/회의 수에 곱할 배수 (예: 10, 100)")
+        parser.add_argument("--attendees", type=int, default=5, help="회의당 평균 참석자 수 (±2)")
+        parser.add_argument("--tasks", type=int, default=3, help="회의당 평균 할 일 수 (0 ~ 2배)")
+        parser.add_argument("--transcript-kb", type=float, default=4.0, help="회의록 원문(transcript) 평균 크기(KB, UTF-8)")
+        parser.add_argument("--days", type=int, default=365, help="회의를 흩뿌릴 기간(일). --end-date 까지")
+        parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                            help="마지막 회의 날짜 (YYYY-MM-DD, 기본: 오늘). 고정하면 날짜까지 재현된다")
+        parser.add_argument("--private-ratio", type=float, default=0.1, help="비공개 회의 비율 (0~1)")
+        parser.add_argument("--batch-size", type=int, default=1000, help="bulk_create 한 번에 넣을 회의 수")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--prefix", default="fake-", help="생성 데이터 구분용 사용자 ID/부서명 접두어")
+        parser.add_argument("--password", default="fakepass1", help="생성 사용자 공통 비밀번호")
+        parser.add_argument("--clear", action="store_true", help="같은 접두어로 만든 기존 데이터를 먼저 지운다")
+        parser.add_argument("--clear-only", action="store_true", help="지우기만 하고 새로 만들지 않는다")
+
+    # ===== 정리 =====
+
+    def _clear(self, prefix):
+        host_ids = User.objects.filter(user_id__startswith=prefix).values("user_id")
+        # Meeting.host 가 PROTECT 라 회의(참석자/할 일은 CASCADE)를 먼저 지운다
+        meetings, _ = Meeting.objects.filter(host_id__in=host_ids).delete()
+        users, _ = User.objects.filter(user_id__startswith=prefix).delete()
+        Dept.objects.filter(dept_name__startswith=prefix).delete()
+        self.stdout.write(f"기존 데이터 삭제: 회의 등 {meetings}행, 사용자 등 {users}행")
+
+    # ===== 생성 =====
+
+    def _create_depts(self, prefix, count):
+        depts = Dept.objects.bulk_create([Dept(dept_name=f"{prefix}부서{i:03d}") for i in range(count)])
+        if any(d.pk is None for d in depts):
+            # bulk_create 가 PK 를 돌려주지 않는 DB 면 이름으로 다시 읽는다
+            by_name = dict(Dept.objects.filter(dept_name__startswith=prefix).values_list("dept_name", "dept_id"))
+            for d in depts:
+                d.pk = by_name[d.dept_name]
+        return [d.pk for d in depts]
+
+    def _create_users(self, prefix, count, dept_ids, password, batch_size, rng):
+        """사용자를 부서에 고르게 나누고 부서별 사용자 ID 목록과 이름 사전을 돌려준다"""
+        hashed = make_password(password)   # 해시는 한 번만 계산해 모든 사용자에 쓴다
+        members = {dept_id: [] for dept_id in dept_ids}
+        names = {}
+        batch = []
+        for i in range(count):
+            user_id = f"{prefix}u{i:06d}"
+            dept_id = dept_ids[i % len(dept_ids)]
+            names[user_id] = fake_name(i)
+            members[dept_id].append(user_id)
+            batch.append(User(
+                user_id=user_id,
+                dept_id=dept_id,
+                name=names[user_id],
+                password=hashed,
+                work_part=rng.choice(["dev", "design", "sales", "ops"]),
+                birth_date=date(1970, 1, 1) + timedelta(days=rng.randrange(365 * 35)),
+                admin_yn=False,
+            ))
+            if len(batch) >= batch_size:
+                User.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            User.objects.bulk_create(batch)
+        return members, names
+
+    def _transcript(self, rng, speakers, target_bytes):
+        """STT 결과와 같은 [{"화자": "발화"}, ...] JSON 을 target_bytes 근처 크기로 만든다"""
+        segments = []
+        size = 2
+        while size < target_bytes:
+            text = " ".join(rng.choices(WORDS, k=rng.randint(6, 24))) + "."
+            segment = {rng.choice(speakers): text}
+            segments.append(segment)
+            # 한글 3바이트 + 키/따옴표/구분자 (대략치로 충분)
+            size += len(text.encode("utf-8")) + len(segment) * 20
+        return json.dumps(segments, ensure_ascii=False)
+
+    def _summary(self, rng, count):
+        agendas = [
+            {
+                "agenda": " ".join(rng.choices(WORDS, k=3)),
+                "agenda_description": " ".join(rng.choices(WORDS, k=8)),
+                "summary": [" ".join(rng.choices(WORDS, k=12)) + "." for _ in range(3)],
+            }
+            for _ in range(count)
+        ]
+        return json.dumps({"agendas": agendas}, ensure_ascii=False, indent=2)
+
+    def _build_meeting(self, rng, opts, host_id, attendee_ids, names, start, span_minutes):
+        speakers = [names[uid] for uid in [host_id] + attendee_ids]
+        target = int(opts["transcript_kb"] * 1024 * rng.uniform(0.5, 1.5))
+        meet_at = start + timedelta(minutes=rng.randrange(span_minutes) // 30 * 30)
+        return Meeting(
+            host_id=host_id,
+            title=" ".join(rng.choices(WORDS, k=rng.randint(2, 5))) + " 회의",
+            meet_date_time=meet_at,
+            place=rng.choice(PLACES),
+            transcript=self._transcript(rng, speakers, target),
+            summary=self._summary(rng, rng.randint(1, 4)),
+            meeting_notes="<p>" + " ".join(rng.choices(WORDS, k=60)) + "</p>",
+            domain=rng.choice(DOMAINS),
+            private_yn=rng.random() < opts["private_ratio"],
+            transcript_status="done",
+        )
+
+    def _pick_attendees(self, rng, host_id, host_dept, members, all_users, average):
+        """평균 ±2 명, 대부분 주최자 부서에서 고르고 일부는 다른 부서에서"""
+        if average <= 0:
+            return []
+        count = rng.randint(max(1, average - 2), average + 2)
+        picked = set()
+        same_dept = members[host_dept]
+        for _ in range(count * 3):
+            if len(picked) >= count:
+                break
+            pool = same_dept if rng.random() < 0.7 else all_users
+            uid = rng.choice(pool)
+            if uid != host_id:
+                picked.add(uid)
+        return sorted(picked)
+
+    def _tasks_for(self, rng, meeting, attendee_ids, names, average):
+        tasks = []
+        for _ in range(rng.randint(0, average * 2)):
+            assignee_id = rng.choice(attendee_ids) if attendee_ids and rng.random() < 0.8 else None
+            due_date = meeting.meet_date_time.date() + timedelta(days=rng.randint(1, 30))
+            content = {
+                "description": " ".join(rng.choices(WORDS, k=rng.randint(4, 10))),
+                "due": rng.choice(DUE_TEXTS),
+                "due_date": due_date.isoformat(),
+            }
+            if assignee_id:
+                content["assignee"] = names[assignee_id]
+            tasks.append(Task(
+                meeting_id=meeting.pk,
+                assignee_id=assignee_id,
+                task_content=json.dumps(content, ensure_ascii=False),
+                due_date=due_date,
+            ))
+        return tasks
+
+    def handle(self, *args, **opts):
+        prefix = opts["prefix"]
+        if not prefix:
+            raise CommandError("--prefix 는 비울 수 없습니다. (정리할 때 생성 데이터를 구분하는 데 씀)")
+        if len(prefix) + 7 > User._meta.get_field("user_id").max_length:
+            raise CommandError("--prefix 가 너무 깁니다.")
+
+        if opts["clear"] or opts["clear_only"]:
+            self._clear(prefix)
+            if opts["clear_only"]:
+                return
+        elif User.objects.filter(user_id__startswith=prefix).exists():
+            raise CommandError(f"'{prefix}' 접두어 데이터가 이미 있습니다. --clear 로 지우고 다시 만드세요.")
+
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise CommandError("bulk_create 로 만든 회의의 PK 를 돌려주는 DB(PostgreSQL, SQLite 등)에서만 쓸 수 있습니다.")
+
+        n_depts = max(1, opts["depts"])
+        n_users = max(2, int(opts["users"] * opts["scale"]))
+        n_meetings = max(0, int(opts["meetings"] * opts["scale"]))
+        batch_size = max(1, opts["batch_size"])
+        rng = random.Random(opts["seed"])
+
+        end_date = opts["end_date"] or date.today()
+        days = max(1, opts["days"])
+        start = datetime.combine(end_date - timedelta(days=days - 1), datetime.min.time()) + timedelta(hours=9)
+        span_minutes = (days - 1) * 24 * 60 + 9 * 60   # 마지막 날은 18시까지
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            dept_ids = self._create_depts(prefix, n_depts)
+            members, names = self._create_users(prefix, n_users, dept_ids, opts["password"], batch_size * 5, rng)
+        self.stdout.write(f"부서 {n_depts}개, 사용자 {n_users}명 ({time.perf_counter() - started:.1f}초)")
+
+        all_users = list(names)
+        dept_of = {uid: dept_id for dept_id, uids in members.items() for uid in uids}
+        totals = {"meetings": 0, "attendees": 0, "tasks": 0, "transcript_bytes": 0}
+
+        for batch_start in range(0, n_meetings, batch_size):
+            count = min(batch_size, n_meetings - batch_start)
+            meetings, attendee_lists = [], []
+            for _ in range(count):
+                host_id = rng.choice(all_users)
+                attendee_ids = self._pick_attendees(rng, host_id, dept_of[host_id], members, all_users, opts["attendees"])
+                meetings.append(self._build_meeting(rng, opts, host_id, attendee_ids, names, start, span_minutes))
+                attendee_lists.append(attendee_ids)
+
+            with transaction.atomic():
+                Meeting.objects.bulk_create(meetings)
+                attendees = [
+                    Attendee(meeting_id=m.pk, user_id=uid)
+                    for m, attendee_ids in zip(meetings, attendee_lists)
+                    for uid in attendee_ids
+                ]
+                tasks = [
+                    task
+                    for m, attendee_ids in zip(meetings, attendee_lists)
+                    for task in self._tasks_for(rng, m, attendee_ids, names, opts["tasks"])
+                ]
+                Attendee.objects.bulk_create(attendees, batch_size=batch_size * 5)
+                Task.objects.bulk_create(tasks, batch_size=batch_size * 5)
+
+            totals["meetings"] += count
+            totals["attendees"] += len(attendees)
+            totals["tasks"] += len(tasks)
+            totals["transcript_bytes"] += sum(len(m.transcript.encode("utf-8")) for m in meetings)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"회의 {totals['meetings']}/{n_meetings} "
+                f"(참석자 {totals['attendees']}, 할 일 {totals['tasks']}) {elapsed:.1f}초"
+            )
+
+        elapsed = time.perf_counter() - started
+        avg_kb = totals["transcript_bytes"] / totals["meetings"] / 1024 if totals["meetings"] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 부서 {n_depts}, 사용자 {n_users}, 회의 {totals['meetings']} (원문 평균 {avg_kb:.1f}KB), "
+            f"참석자 {totals['attendees']}, 할 일 {totals['tasks']} — {elapsed:.1f}초. "
+            f"로그인: {prefix}u000000 / {opts['password']}"
+        ))
@@ -0,0 +1,298 @@
+import contextlib
+import datetime
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest import mock
+
+import numpy as np
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+from meetings.models import Meeting, S3File
+from meetings.utils import s3_upload
+from meetings.utils.audio import _to_pcm16, wav_header
+from meetings.utils.fake_runpod import FakeRunpod, serve_in_thread
+from meetings.utils.fake_s3 import FakeS3
+from users.models import Dept, User
+
+STAGES = ["create", "upload", "stt", "sllm", "minutes_save", "minutes_download"]
+USER_PREFIX = "loadtest-"
+DEPT_NAME = "부하테스트"
+
+
+class StageFailed(Exception):
+    def __init__(self, stage, status, body):
+        super().__init__(f"{stage}: HTTP {status} {body[:200]}")
+        self.stage = stage
+
+
+class StageStats:
+    """단계별 소요 시간/실패 수와 요청 구간 (스레드 공용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.elapsed = {stage: [] for stage in STAGES}
+        self.failed = {stage: 0 for stage in STAGES}
+        self.intervals = {stage: [] for stage in STAGES}
+
+    def add(self, stage, started, finished, ok):
+        with self._lock:
+            self.intervals[stage].append((started, finished))
+            if ok:
+                self.elapsed[stage].append(finished - started)
+            else:
+                self.failed[stage] += 1
+
+    def busy_seconds(self, stage):
+        """그 단계 요청이 하나라도 진행 중이던 시간의 합 (겹치는 구간은 한 번만)"""
+        busy = 0.0
+        end = None
+        for started, finished in sorted(self.intervals[stage]):
+            if end is None or started > end:
+                busy += finished - started
+                end = finished
+            elif finished > end:
+                busy += finished - end
+                end = finished
+        return busy
+
+
+def _percentile(sorted_values, p):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(np.ceil(p / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def build_wav(seconds: float, sample_rate: int, seed: int) -> bytes:
+    """말(진폭이 변하는 톤)과 무음이 번갈아 나오는 합성 녹음. 업로드 시 변환/발화 구간 검출 경로를 그대로 탄다."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * sample_rate)
+    t = np.arange(n) / sample_rate
+    envelope = (np.sin(2 * np.pi * t / 8) > -0.3).astype(np.float32)   # 약 8초 주기로 말/쉼
+    voice = 0.3 * np.sin(2 * np.pi * 220 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    noise = 0.002 * rng.standard_normal(n)
+    return wav_header(n, sample_rate) + _to_pcm16(voice * envelope + noise)
+
+
+class Command(BaseCommand):
+    help = (
+        "회의 생성 → 녹음 업로드 → STT → SLLM → 회의록 저장/다운로드 전체 흐름을 동시에 여러 건 돌려 "
+        "단계별 p50/p95/p99 지연과 처리량을 측정한다. S3 는 메모리 가짜, 추론 서버는 fake_runpod(또는 --runpod-url)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--meetings", type=int, default=20, help="처리할 회의 수")
+        parser.add_argument("--concurrency", type=int, default=4, help="동시에 진행할 회의 수")
+        parser.add_argument("--users", type=int, default=10, help="주최자/참석자로 쓸 가짜 사용자 수")
+        parser.add_argument("--audio-seconds", type=float, default=120.0, help="합성 녹음 길이(초)")
+        parser.add_argument("--sample-rate", type=int, default=48000, help="합성 녹음 샘플레이트 (16000 이 아니면 업로드 시 변환)")
+        parser.add_argument("--fmt", default="pdf", choices=["pdf", "docx"], help="회의록 다운로드 형식")
+        parser.add_argument("--runpod-url", default="", help="이미 떠 있는 추론 서버 주소. 비우면 가짜 서버를 띄운다.")
+        parser.add_argument("--stt-latency", type=float, default=0.5, help="가짜 /stt 지연(초)")
+        parser.add_argument("--sllm-latency", type=float, default=0.5, help="가짜 /inference 지연(초)")
+        parser.add_argument("--jitter", type=float, default=0.2, help="가짜 서버 지연 무작위 폭(초)")
+        parser.add_argument("--failure-rate", type=float, default=0.0, help="가짜 서버 실패 확률 (0~1)")
+        parser.add_argument("--segments", type=int, default=40, help="가짜 /stt 응답 발화 수")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--json", metavar="PATH", default="",
+            help="결과를 JSON 으로 이 파일에 저장. '-' 이면 표준 출력으로 내보내고 실행 중 뷰의 print 는 표준 오류로 돌린다.",
+        )
+        parser.add_argument("--keep", action="store_true", help="만든 사용자/회의를 지우지 않음")
+
+    # ===== 데이터 준비 / 정리 =====
+
+    def _create_users(self, count):
+        dept, _ = Dept.objects.get_or_create(dept_name=DEPT_NAME)
+        users = [
+            User(
+                user_id=f"{USER_PREFIX}{i:03d}",
+                dept=dept,
+                name=f"부하{i:03d}",
+                password="!",
+                work_part="loadtest",
+                birth_date=datetime.date(1990, 1, 1),
+                admin_yn=False,
+            )
+            for i in range(count)
+        ]
+        User.objects.bulk_create(users, ignore_conflicts=True)
+        return [u.user_id for u in users]
+
+    def _cleanup(self, user_ids):
+        meetings = Meeting.objects.filter(host_id__in=user_ids)
+        s3_keys = list(meetings.exclude(record_url=None).values_list("record_url_id", flat=True))
+        meetings.delete()
+        S3File.objects.filter(s3_key__in=s3_keys).delete()
+        User.objects.filter(user_id__in=user_ids).delete()
+
+    # ===== 회의 하나의 전체 흐름 =====
+
+    def _client(self, user_id):
+        client = Client()
+        session = client.session
+        session["login_user_id"] = user_id
+        session.save()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        return client
+
+    def _step(self, stats, stage, call, ok_status=(200,)):
+        started = time.perf_counter()
+        res = call()
+        ok = res.status_code in ok_status
+        stats.add(stage, started, time.perf_counter(), ok)
+        if not ok:
+            body = res.content.decode("utf-8", "replace")
+            try:
+                data = json.loads(body)
+                body = str(data.get("message") or data.get("error") or body)
+            except (ValueError, AttributeError):
+                pass
+            raise StageFailed(stage, res.status_code, body)
+        return res
+
+    def _run_pipeline(self, n, host_id, attendee_ids, wav, opts, stats):
+        client = self._client(host_id)
+
+        res = self._step(stats, "create", lambda: client.post("/meetings/new/", {
+            "title": f"부하 테스트 회의 {n}",
+            "meet_date_time": "2026-01-05T10:00",
+            "place": "회의실",
+            "attendees": attendee_ids,
+            "domains": "IT",
+        }), ok_status=(302,))
+        meeting_id = int(res["Location"].rstrip("/").split("/")[-2])
+
+        self._step(stats, "upload", lambda: client.post(
+            f"/meetings/{meeting_id}/upload/",
+            {"file": SimpleUploadedFile(f"loadtest-{n}.wav", wav, content_type="audio/wav")},
+        ))
+        self._step(stats, "stt", lambda: client.get(f"/meetings/{meeting_id}/transcript/prepare/"))
+        self._step(stats, "sllm", lambda: client.get(f"/meetings/{meeting_id}/sllm/prepare/"))
+        self._step(stats, "minutes_save", lambda: client.post(
+            f"/meetings/{meeting_id}/minutes/save/",
+            json.dumps({"content": f"<p>부하 테스트 회의록 {n}</p>"}),
+            content_type="application/json",
+        ))
+        self._step(stats, "minutes_download", lambda: client.get(f"/meetings/{meeting_id}/minutes/download/{opts['fmt']}/"))
+
+    # ===== 실행 =====
+
+    def handle(self, *args, **opts):
+        user_ids = self._create_users(max(2, opts["users"]))
+        wav = build_wav(opts["audio_seconds"], opts["sample_rate"], opts["seed"])
+
+        server = None
+        runpod_url = opts["runpod_url"]
+        if not runpod_url:
+            fake = FakeRunpod(
+                stt_latency=opts["stt_latency"],
+                sllm_latency=opts["sllm_latency"],
+                jitter=opts["jitter"],
+                failure_rate=opts["failure_rate"],
+                segments=opts["segments"],
+                seed=opts["seed"],
+            )
+            server, runpod_url = serve_in_thread(fake)
+
+        fake_s3 = FakeS3()
+        stats = StageStats()
+        errors = []
+        # JSON 을 표준 출력으로 낼 때는 뷰들의 print 가 섞이지 않게 한다. (self.stdout 은 원래 표준 출력 그대로)
+        quiet = contextlib.redirect_stdout(sys.stderr) if opts["json"] == "-" else contextlib.nullcontext()
+        try:
+            with quiet, override_settings(
+                RUNPOD_BASE_URL=runpod_url,
+                ALLOWED_HOSTS=["testserver"],
+            ), mock.patch.object(s3_upload, "_s3_client", fake_s3):
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=opts["concurrency"]) as pool:
+                    futures = []
+                    for n in range(opts["meetings"]):
+                        host_id = user_ids[n % len(user_ids)]
+                        attendees = [user_ids[(n + k) % len(user_ids)] for k in (1, 2)]
+                        futures.append(pool.submit(self._run_pipeline, n, host_id, attendees, wav, opts, stats))
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            errors.append(str(e))
+                wall = time.perf_counter() - started
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            if not opts["keep"]:
+                self._cleanup(user_ids)
+
+        self._report(stats, errors, wall, len(wav), fake_s3, opts)
+
+    def _report(self, stats, errors, wall, wav_size, fake_s3, opts):
+        rows = []
+        for stage in STAGES:
+            values = sorted(stats.elapsed[stage])
+            busy = stats.busy_seconds(stage)
+            rows.append({
+                "stage": stage,
+                "ok": len(values),
+                "failed": stats.failed[stage],
+                "p50_ms": _ms(_percentile(values, 50)),
+                "p95_ms": _ms(_percentile(values, 95)),
+                "p99_ms": _ms(_percentile(values, 99)),
+                "max_ms": _ms(values[-1] if values else None),
+                "busy_sec": round(busy, 2),
+                # 그 단계가 실제로 돌던 시간 기준 처리량 (전체 시간으로 나누면 모든 단계가 같은 값이 된다)
+                "per_sec": round(len(values) / busy, 2) if busy else None,
+            })
+        completed = rows[-1]["ok"]
+        summary = {
+            "meetings": opts["meetings"],
+            "concurrency": opts["concurrency"],
+            "wall_sec": round(wall, 2),
+            "completed": completed,
+            "meetings_per_min": round(completed / wall * 60, 2) if wall else None,
+            "wav_bytes": wav_size,
+            "s3_bytes_stored": fake_s3.total_bytes,
+            "stages": rows,
+            "errors": errors[:20],
+        }
+        if opts["json"] == "-":
+            self.stdout.write(json.dumps(summary, ensure_ascii=False, indent=2))
+            return
+        if opts["json"]:
+            with open(opts["json"], "w", encoding="utf-8") as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        self.stdout.write(
+            f"회의 {opts['meetings']}건 / 동시 {opts['concurrency']}건 / 녹음 {opts['audio_seconds']:.0f}초 "
+            f"({wav_size / 1024 / 1024:.1f} MiB) / 총 {wall:.2f}초"
+        )
+        self.stdout.write(f"{'stage':<18}{'ok':>6}{'fail':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'req/s':>8}")
+        for row in rows:
+            self.stdout.write(
+                f"{row['stage']:<18}{row['ok']:>6}{row['failed']:>6}"
+                + "".join(f"{_fmt_ms(row[k]):>10}" for k in ("p50_ms", "p95_ms", "p99_ms", "max_ms"))
+                + f"{_fmt(row['per_sec']):>8}"
+            )
+        self.stdout.write(f"완료 {completed}건, 분당 {summary['meetings_per_min']}건")
+        for message in errors[:5]:
+            self.stdout.write(self.style.WARNING(f"실패: {message}"))
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _fmt(value):
+    return "-" if value is None else str(value)
+
+
+def _fmt_ms(value):
+    return "-" if value is None else f"{value:.0f}ms"
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from meetings.batch import run_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 S3 파일, 오래된 미완료 분할 업로드(스풀 파일 포함), 만료된 OAuth state 를 한 번 정리한다. "
+        "gunicorn 배포에서는 배치 스레드가 돌지 않으므로 cron 으로 1시간마다 실행한다."
+    )
+
+    def handle(self, *args, **opts):
+        run_batch()
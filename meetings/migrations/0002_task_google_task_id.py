@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='google_task_id',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0003_upload_session'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='s3file',
+            name='file_size',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='s3file',
+            name='original_s3_key',
+            field=models.CharField(blank=True, max_length=512, null=True),
+        ),
+        migrations.AddField(
+            model_name='s3file',
+            name='original_size',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0004_s3file_sizes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='s3file',
+            name='duration',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='s3file',
+            name='speech_regions',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='s3file',
+            name='stripped_s3_key',
+            field=models.CharField(blank=True, max_length=512, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0005_s3file_speech_regions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.IntegerField()),
+                ('source_key', models.CharField(max_length=512)),
+                ('s3_key', models.CharField(blank=True, default='', max_length=512)),
+                ('start_sec', models.FloatField()),
+                ('end_sec', models.FloatField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('error', 'Error')], default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('segments', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_chunks', to='meetings.meeting')),
+            ],
+            options={
+                'db_table': 'transcript_chunk_tbl',
+                'ordering': ['index'],
+                'unique_together': {('meeting', 'index')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-20 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0006_transcript_chunk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='transcript_claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
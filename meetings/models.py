@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 
 class Meeting(models.Model):
@@ -43,6 +45,8 @@ class Meeting(models.Model):
         default="pending",
     )
     transcript_error = models.TextField(blank=True, default="")
+    # 전사를 가져간 시각 (meetings.utils.stt.claim_transcription). 멈춘 전사를 한 요청만 다시 가져가도록 조건에 쓴다.
+    transcript_claimed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "meeting_tbl"
@@ -90,6 +94,9 @@ class Task(models.Model):
     task_content = models.TextField(null=True, blank=True)
     due_date = models.DateField(null=True, blank=True)
 
+    # 구글 Tasks 로 내보낸 경우 해당 태스크 ID (다시 내보내면 새로 만들지 않고 수정)
+    google_task_id = models.CharField(max_length=255, null=True, blank=True)
+
     class Meta:
         db_table = "task_tbl"
 
@@ -101,9 +108,137 @@ class S3File(models.Model):
     s3_key = models.CharField(max_length=512, primary_key=True)
     original_name = models.CharField(max_length=255)
     delete_at = models.DateTimeField()      # 삭제 예정 시각
+    # 저장된 객체 크기 / 업로드 받은 원본 크기 (16 kHz mono 로 변환했으면 둘이 다름)
+    file_size = models.BigIntegerField(null=True, blank=True)
+    original_size = models.BigIntegerField(null=True, blank=True)
+    # RECORD_KEEP_ORIGINAL 로 함께 보관한 원본 객체 키
+    original_s3_key = models.CharField(max_length=512, null=True, blank=True)
+    # 녹음 길이(초)와 발화 구간 [[start, end], ...] (원본 기준 초, meetings.utils.vad)
+    duration = models.FloatField(null=True, blank=True)
+    speech_regions = models.JSONField(null=True, blank=True)
+    # RECORD_STRIP_SILENCE 로 만든 무음 제거본 키. 시각은 vad.to_original_time 으로 원본 기준으로 환산
+    stripped_s3_key = models.CharField(max_length=512, null=True, blank=True)
 
     class Meta:
         db_table = "s3_file"
 
     def __str__(self):
-        return self.s3_key
\ No newline at end of file
+        return self.s3_key
+
+class UploadSession(models.Model):
+    """
+    녹음 파일 분할 업로드 세션.
+    조각은 서버 임시 파일(스풀)의 index * chunk_size 위치에 기록되고,
+    complete 시 S3 에 올린 뒤 S3File / Meeting.record_url 로 연결된다.
+    """
+    STATUS_UPLOADING = "uploading"
+    STATUS_COMPLETING = "completing"
+    STATUS_DONE = "done"
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, "Uploading"),
+        (STATUS_COMPLETING, "Completing"),
+        (STATUS_DONE, "Done"),
+    ]
+
+    upload_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    meeting = models.ForeignKey(
+        Meeting,
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+    )
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+    )
+    original_name = models.CharField(max_length=255)
+    total_size = models.BigIntegerField()
+    chunk_size = models.IntegerField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_UPLOADING)
+    s3_file = models.ForeignKey(
+        S3File,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column="s3_key",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        db_table = "upload_session_tbl"
+
+    @property
+    def total_chunks(self) -> int:
+        return max(1, -(-self.total_size // self.chunk_size))
+
+    def expected_chunk_size(self, index: int) -> int:
+        """index 번째 조각의 크기 (마지막 조각만 짧을 수 있음)"""
+        return min(self.chunk_size, self.total_size - index * self.chunk_size)
+
+    def __str__(self):
+        return f"[{self.meeting_id}] {self.upload_id} ({self.status})"
+
+
+class UploadChunk(models.Model):
+    session = models.ForeignKey(
+        UploadSession,
+        on_delete=models.CASCADE,
+        related_name="chunks",
+    )
+    index = models.IntegerField()
+    size = models.IntegerField()
+    sha256 = models.CharField(max_length=64)
+    received_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "upload_chunk_tbl"
+        unique_together = ("session", "index")
+
+    def __str__(self):
+        return f"{self.session_id} #{self.index}"
+
+
+class TranscriptChunk(models.Model):
+    """
+    긴 녹음을 무음 경계에서 나눈 STT 조각 (meetings.utils.stt).
+    start_sec/end_sec 는 원본 녹음 기준이며, 조각 음성(s3_key)에는 그 구간 전체가
+    (RECORD_STRIP_SILENCE 이면 그 구간의 발화만) 들어 있다.
+    """
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_DONE = "done"
+    STATUS_ERROR = "error"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PROCESSING, "Processing"),
+        (STATUS_DONE, "Done"),
+        (STATUS_ERROR, "Error"),
+    ]
+
+    meeting = models.ForeignKey(
+        Meeting,
+        on_delete=models.CASCADE,
+        related_name="transcript_chunks",
+    )
+    index = models.IntegerField()
+    # 조각을 만든 녹음(S3File.s3_key). 녹음이 바뀌면 조각을 다시 만든다.
+    source_key = models.CharField(max_length=512)
+    # 조각 음성 객체 키. 발화가 없는 구간이면 빈 값
+    s3_key = models.CharField(max_length=512, blank=True, default="")
+    start_sec = models.FloatField()
+    end_sec = models.FloatField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    # [{speaker: text}, ...]
+    segments = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "transcript_chunk_tbl"
+        unique_together = ("meeting", "index")
+        ordering = ["index"]
+
+    def __str__(self):
+        return f"[{self.meeting_id}] #{self.index} ({self.status})"
@@ -1,3 +1,593 @@
-from django.test import TestCase
+"""
+뷰별 쿼리 수 회귀 테스트.
 
-# Create your tests here.
+회의 N건 × 참석자 M명 × 할 일 K건 데이터를 크기를 바꿔 가며 만들고, 목록/상세/회의록/내보내기 뷰의
+쿼리 수가 정해 둔 값과 같은지 assertNumQueries 로 확인한다. 크기가 커져도 같은 값이어야 하므로
+회의/참석자/할 일마다 쿼리가 하나씩 늘어나는(N+1) 변경은 여기서 실패한다.
+파일 뒤쪽에는 회의록 작업자, 녹음 분할 업로드, STT 조각 전사 등의 동작 테스트를 함께 둔다.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.middleware import SESSION_TOUCH_KEY
+from meetings.models import Attendee, Meeting, S3File, Task, TranscriptChunk, UploadSession
+from meetings.utils import renderer, stt
+from meetings.utils.minutes_export import minutes_filename
+from users.models import Dept, User
+
+# (회의 수 N, 회의당 참석자 수 M, 회의당 할 일 수 K) — 작은 크기와 큰 크기에서 쿼리 수가 같아야 한다
+SIZES = [(2, 2, 2), (12, 6, 8)]
+
+# 회의록은 요청 스레드에서 렌더링하고, 정적 파일은 collectstatic manifest 없이 찾는다
+query_test_settings = override_settings(
+    MINUTES_RENDER_WORKERS=0,
+    ALLOWED_HOSTS=["testserver"],
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+)
+
+
+# ===== 데이터 팩토리 =====
+
+def make_dept(name="개발팀"):
+    return Dept.objects.create(dept_name=name)
+
+
+def make_users(dept, count, prefix, admin=False):
+    users = [
+        User(
+            user_id=f"{prefix}{i:03d}",
+            dept=dept,
+            name=f"{prefix}-사용자{i:03d}",
+            password="!",
+            work_part="dev",
+            birth_date=date(1990, 1, 1),
+            admin_yn=admin,
+        )
+        for i in range(count)
+    ]
+    User.objects.bulk_create(users)
+    return users
+
+
+def make_transcript(lines, speakers=("화자1", "화자2")):
+    """STT 결과와 같은 [{"화자": "발화"}, ...] JSON (줄마다 수십 바이트)"""
+    return json.dumps(
+        [{speakers[i % len(speakers)]: f"{i}번째 발화입니다. 회의 내용을 정리합니다."} for i in range(lines)],
+        ensure_ascii=False,
+    )
+
+
+def make_meetings(host, attendees, count, tasks=0, when=None, private=False, transcript_lines=20):
+    """
+    host 가 주최하고 attendees 가 참석한 회의 count 건과 회의마다 할 일 tasks 건을 만든다.
+    when 을 주지 않으면 오늘 09:00 부터(today_meetings 컨텍스트 프로세서 대상) 1분 간격.
+    """
+    when = when or datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    meetings = Meeting.objects.bulk_create([
+        Meeting(
+            host=host,
+            title=f"회의 {i}",
+            meet_date_time=when + timedelta(minutes=i),
+            place="회의실",
+            transcript=make_transcript(transcript_lines),
+            summary=json.dumps({"agendas": [{"agenda": "안건", "summary": "요약"}]}, ensure_ascii=False),
+            meeting_notes="<p>회의록</p>",
+            private_yn=private,
+            transcript_status="done",
+        )
+        for i in range(count)
+    ])
+    Attendee.objects.bulk_create([
+        Attendee(meeting=m, user=u) for m in meetings for u in attendees
+    ])
+    Task.objects.bulk_create([
+        Task(
+            meeting=m,
+            assignee=attendees[j % len(attendees)] if attendees else None,
+            task_content=json.dumps({"description": f"할 일 {j}", "due": "다음 주"}, ensure_ascii=False),
+            due_date=date.today() + timedelta(days=j),
+        )
+        for m in meetings for j in range(tasks)
+    ])
+    return meetings
+
+
+def make_dataset(n, m, k, prefix, dept=None, **kwargs):
+    """부서 하나에 주최자 1명 + 참석자 m명, 회의 n건 × 할 일 k건"""
+    dept = dept or make_dept(f"{prefix}부서")
+    host, *attendees = make_users(dept, m + 1, prefix)
+    meetings = make_meetings(host, attendees, n, tasks=k, **kwargs)
+    return host, attendees, meetings
+
+
+class QueryCountTestCase(TestCase):
+    def login(self, user, admin=False):
+        session = self.client.session
+        session["login_user_id"] = user.user_id
+        session["login_user_name"] = user.name
+        session["login_user_admin"] = admin
+        # SessionTouchMiddleware 가 첫 요청에서 세션을 다시 저장하지 않도록 방금 연장한 것으로 둔다
+        session[SESSION_TOUCH_KEY] = int(time.time())
+        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+    def get(self, url, status=200, **extra):
+        res = self.client.get(url, **extra)
+        self.assertEqual(res.status_code, status, url)
+        if getattr(res, "streaming", False):
+            # 스트리밍 응답은 본문을 다 읽어야 쿼리가 끝난다
+            b"".join(res.streaming_content)
+        return res
+
+
+@query_test_settings
+class MeetingListQueryTests(QueryCountTestCase):
+    def test_list_all(self):
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                host, _, _ = make_dataset(n, m, k, prefix=f"all{i}-")
+                self.login(host)
+                with self.assertNumQueries(9):
+                    self.get("/meetings/list/all/")
+
+    def test_list_mine(self):
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                host, _, _ = make_dataset(n, m, k, prefix=f"mine{i}-")
+                self.login(host)
+                with self.assertNumQueries(9):
+                    self.get("/meetings/list/mine/")
+
+    def test_list_dept(self):
+        dept = make_dept()
+        viewer = make_users(dept, 1, prefix="viewer-")[0]
+        self.login(viewer)
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                make_dataset(n, m, k, prefix=f"dept{i}-", dept=dept)
+                with self.assertNumQueries(9):
+                    self.get("/meetings/list/dept/")
+
+
+@query_test_settings
+class MeetingDetailQueryTests(QueryCountTestCase):
+    def assertConstantQueries(self, expected, url_format, status=200):
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                host, _, meetings = make_dataset(n, m, k, prefix=f"d{i}-", transcript_lines=20 * m)
+                self.login(host)
+                with self.assertNumQueries(expected):
+                    self.get(url_format.format(meeting_id=meetings[-1].meeting_id), status=status)
+
+    def test_detail(self):
+        self.assertConstantQueries(19, "/meetings/{meeting_id}/detail")
+
+    def test_transcript_page(self):
+        self.assertConstantQueries(12, "/meetings/{meeting_id}/transcript/")
+
+    def test_transcript_api(self):
+        self.assertConstantQueries(2, "/meetings/{meeting_id}/transcript_api/")
+
+    def test_record_page(self):
+        self.assertConstantQueries(13, "/meetings/{meeting_id}/record/")
+
+    def test_stt_rendering_page(self):
+        self.assertConstantQueries(7, "/meetings/{meeting_id}/rendering/stt/")
+
+    def test_sllm_rendering_page(self):
+        self.assertConstantQueries(7, "/meetings/{meeting_id}/rendering/sllm/")
+
+    def test_transcript_progress(self):
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                host, _, meetings = make_dataset(n, m, k, prefix=f"p{i}-")
+                meeting = meetings[-1]
+                Meeting.objects.filter(pk=meeting.pk).update(transcript_status="processing")
+                TranscriptChunk.objects.bulk_create([
+                    TranscriptChunk(
+                        meeting=meeting,
+                        source_key=f"rec/{meeting.pk}.wav",
+                        index=c,
+                        s3_key=f"rec/{meeting.pk}.wav.chunk{c:03d}.wav",
+                        start_sec=c * 600.0,
+                        end_sec=(c + 1) * 600.0,
+                        status="done" if c % 2 == 0 else "pending",
+                        segments=[{"화자1": "발화"}] * 5 if c % 2 == 0 else None,
+                    )
+                    for c in range(k)
+                ])
+                self.login(host)
+                with self.assertNumQueries(6):
+                    self.get(f"/meetings/{meeting.pk}/transcript/progress/")
+
+    def test_transcript_endpoints_require_view_permission(self):
+        host, attendees, meetings = make_dataset(1, 2, 0, prefix="perm-")
+        private = make_meetings(host, attendees[:1], 1, private=True)[0]
+        same_dept = make_users(host.dept, 1, prefix="perm-colleague-")[0]
+        other_dept = make_users(make_dept("다른부서"), 1, prefix="perm-other-")[0]
+        TranscriptChunk.objects.create(
+            meeting=meetings[0], source_key="rec/a.wav", index=0, s3_key="rec/a.wav.chunk000.wav",
+            start_sec=0, end_sec=600, status="done", segments=[{"화자1": "비공개 발화"}],
+        )
+
+        for kind in ("progress", "prepare"):
+            with self.subTest(kind=kind):
+                url = f"/meetings/{meetings[0].pk}/transcript/{kind}/"
+                self.client.logout()
+                self.get(url, status=401)
+
+                self.login(other_dept)
+                res = self.get(url, status=403)
+                self.assertNotIn("segments", res.json())
+
+                # 공개 회의는 참석자와 같은 부서면 볼 수 있지만 비공개 회의는 주최자/참석자만
+                self.login(same_dept)
+                self.get(url)
+                self.get(f"/meetings/{private.pk}/transcript/{kind}/", status=403)
+                self.login(attendees[0])
+                self.get(f"/meetings/{private.pk}/transcript/{kind}/")
+
+
+@query_test_settings
+class MinutesExportQueryTests(QueryCountTestCase):
+    def test_minutes_download(self):
+        for fmt in ("pdf", "docx"):
+            for i, (n, m, k) in enumerate(SIZES):
+                with self.subTest(fmt=fmt, n=n, m=m, k=k):
+                    host, _, meetings = make_dataset(n, m, k, prefix=f"{fmt}{i}-")
+                    self.login(host)
+                    with self.assertNumQueries(2):
+                        self.get(f"/meetings/{meetings[-1].meeting_id}/minutes/download/{fmt}/")
+
+    def test_minutes_bulk_download(self):
+        dept = make_dept()
+        admin = make_users(dept, 1, prefix="admin-", admin=True)[0]
+        self.login(admin, admin=True)
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                make_dataset(n, m, k, prefix=f"bulk{i}-", dept=dept)
+                with self.assertNumQueries(3):
+                    self.get(f"/meetings/minutes/bulk/docx/?dept_id={dept.dept_id}")
+
+
+class GenerateFakeDataTests(TestCase):
+    ARGS = ["--depts", "3", "--users", "30", "--meetings", "40", "--batch-size", "15", "--end-date", "2026-01-31"]
+
+    def generate(self, *extra):
+        call_command("generate_fake_data", *self.ARGS, *extra, stdout=StringIO())
+        return (
+            list(Meeting.objects.order_by("meeting_id").values_list("host_id", "meet_date_time", "transcript")),
+            list(Task.objects.order_by("task_id").values_list("assignee_id", "task_content")),
+        )
+
+    def test_same_seed_same_data(self):
+        meetings, tasks = self.generate()
+        self.assertEqual(len(meetings), 40)
+        self.assertEqual(User.objects.filter(user_id__startswith="fake-").count(), 30)
+        self.assertTrue(Attendee.objects.exists())
+        self.assertTrue(all(date(2025, 2, 1) <= m[1].date() <= date(2026, 1, 31) for m in meetings))
+
+        self.assertEqual(self.generate("--clear"), (meetings, tasks))
+        self.assertNotEqual(self.generate("--clear", "--seed", "1")[0], meetings)
+
+    def test_clear_only(self):
+        self.generate()
+        call_command("generate_fake_data", "--clear-only", stdout=StringIO())
+        self.assertFalse(Meeting.objects.exists())
+        self.assertFalse(User.objects.filter(user_id__startswith="fake-").exists())
+        self.assertFalse(Dept.objects.filter(dept_name__startswith="fake-").exists())
+
+
+class RendererPoolTests(TestCase):
+    def test_discard_ignores_replaced_pool(self):
+        old, current = mock.Mock(_processes={}), mock.Mock(_processes={})
+        with mock.patch.object(renderer, "_pool", current):
+            renderer._discard_pool(old)
+            self.assertIs(renderer._pool, current)
+            old.shutdown.assert_not_called()
+
+            renderer._discard_pool(current)
+            self.assertIsNone(renderer._pool)
+            current.shutdown.assert_called_once()
+
+    def test_render_retries_once_on_broken_pool(self):
+        with mock.patch.object(renderer, "submit_minutes"), \
+                mock.patch.object(renderer, "wait_minutes", side_effect=[renderer.BrokenProcessPool(), b"doc"]):
+            self.assertEqual(renderer.render_minutes("pdf", {}), b"doc")
+
+    @query_test_settings
+    def test_minutes_download_returns_503_when_pool_keeps_breaking(self):
+        dept = make_dept()
+        host, _, meetings = make_dataset(1, 1, 0, prefix="broken-", dept=dept)
+        session = self.client.session
+        session["login_user_id"] = host.user_id
+        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        with mock.patch.object(renderer, "submit_minutes"), \
+                mock.patch.object(renderer, "wait_minutes", side_effect=renderer.BrokenProcessPool()):
+            res = self.client.get(f"/meetings/{meetings[0].meeting_id}/minutes/download/pdf/")
+        self.assertEqual(res.status_code, 503)
+
+
+@query_test_settings
+class UploadSessionTests(QueryCountTestCase):
+    """녹음 분할 업로드: 순서가 뒤섞이거나 중복된 조각, 크기 제한, 완료/재완료/멈춘 마무리 회수"""
+
+    DATA = b"RIFF0123456789abcdefghij"    # 조각 크기 5 → 5개 (마지막 4 bytes)
+
+    def setUp(self):
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        overrides = override_settings(
+            RECORD_UPLOAD_SPOOL_DIR=spool_dir.name,
+            RECORD_UPLOAD_CHUNK_SIZE=5,
+            RECORD_UPLOAD_MAX_SIZE=64,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.host, _, meetings = make_dataset(1, 0, 0, prefix="up-")
+        self.meeting = meetings[0]
+        self.base = f"/meetings/{self.meeting.meeting_id}/upload/sessions/"
+        self.login(self.host)
+        self.uploaded = []
+
+    def create(self, total_size=None):
+        return self.client.post(
+            self.base,
+            json.dumps({"filename": "rec.wav", "total_size": total_size or len(self.DATA)}),
+            content_type="application/json",
+        )
+
+    def put(self, upload_id, index, body=None, **extra):
+        if body is None:
+            body = self.DATA[index * 5:(index + 1) * 5]
+        return self.client.put(
+            f"{self.base}{upload_id}/chunks/{index}/", body,
+            content_type="application/octet-stream", **extra,
+        )
+
+    def fake_upload(self, spool, original_filename, delete_after_seconds):
+        self.uploaded.append(spool.read())
+        key = f"tests/rec-{len(self.uploaded)}.wav"
+        S3File.objects.create(s3_key=key, original_name=original_filename, delete_at=datetime(2099, 1, 1))
+        return key
+
+    def complete(self, upload_id):
+        with mock.patch("meetings.utils.s3_upload.upload_raw_fileobj", side_effect=self.fake_upload):
+            return self.client.post(f"{self.base}{upload_id}/complete/")
+
+    def test_out_of_order_and_duplicate_chunks(self):
+        upload_id = self.create().json()["upload_id"]
+        for index in (4, 1, 3, 1, 0):
+            self.assertEqual(self.put(upload_id, index).status_code, 200)
+        # 같은 체크섬으로 다시 보낸 조각은 다시 쓰지 않는다
+        digest = hashlib.sha256(self.DATA[15:20]).hexdigest()
+        self.assertEqual(self.put(upload_id, 3, HTTP_X_CHUNK_SHA256=digest).status_code, 200)
+
+        res = self.client.get(f"{self.base}{upload_id}/")
+        self.assertEqual(res.json()["received"], [0, 1, 3, 4])
+        res = self.complete(upload_id)
+        self.assertEqual(res.status_code, 409)
+        self.assertEqual(res.json()["missing"], [2])
+
+        self.assertEqual(self.put(upload_id, 2).status_code, 200)
+        res = self.complete(upload_id)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(self.uploaded, [self.DATA])
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.record_url_id, res.json()["record_url"])
+        self.assertFalse(os.path.exists(os.path.join(settings.RECORD_UPLOAD_SPOOL_DIR, f"{upload_id}.part")))
+
+        # 완료 후 다시 호출해도 같은 결과, 조각은 더 받지 않는다
+        self.assertEqual(self.complete(upload_id).json()["record_url"], res.json()["record_url"])
+        self.assertEqual(len(self.uploaded), 1)
+        self.assertEqual(self.put(upload_id, 0).status_code, 409)
+
+    def test_size_limits(self):
+        self.assertEqual(self.create(total_size=65).status_code, 400)
+        upload_id = self.create().json()["upload_id"]
+        self.assertEqual(self.put(upload_id, 5).status_code, 400)
+        self.assertEqual(self.put(upload_id, 0, body=b"123456").status_code, 400)
+        self.assertEqual(self.put(upload_id, 4, body=b"12345").status_code, 400)
+        self.assertEqual(self.put(upload_id, 0, body=b"12345", HTTP_X_CHUNK_SHA256="0" * 64).status_code, 400)
+        self.assertEqual(self.client.get(f"{self.base}{upload_id}/").json()["received"], [])
+
+    def test_failed_completion_can_retry(self):
+        upload_id = self.create().json()["upload_id"]
+        for index in range(5):
+            self.put(upload_id, index)
+        with mock.patch("meetings.utils.s3_upload.upload_raw_fileobj", side_effect=RuntimeError("boom")):
+            self.assertEqual(self.client.post(f"{self.base}{upload_id}/complete/").status_code, 500)
+        self.assertEqual(UploadSession.objects.get(pk=upload_id).status, UploadSession.STATUS_UPLOADING)
+        self.assertEqual(self.complete(upload_id).status_code, 200)
+
+    @override_settings(RECORD_UPLOAD_COMPLETE_TIMEOUT=600)
+    def test_stuck_completion_is_reclaimed_after_timeout(self):
+        upload_id = self.create().json()["upload_id"]
+        for index in range(5):
+            self.put(upload_id, index)
+        # 마무리하던 작업자가 죽은 상태
+        UploadSession.objects.filter(pk=upload_id).update(status=UploadSession.STATUS_COMPLETING)
+        self.assertEqual(self.complete(upload_id).status_code, 409)
+
+        UploadSession.objects.filter(pk=upload_id).update(
+            updated_at=timezone.now() - timedelta(seconds=601)
+        )
+        res = self.complete(upload_id)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(self.uploaded, [self.DATA])
+
+    def test_run_batch_removes_stale_sessions_and_orphan_spools(self):
+        stale_id = self.create().json()["upload_id"]
+        live_id = self.create().json()["upload_id"]
+        UploadSession.objects.filter(pk=stale_id).update(
+            updated_at=timezone.now() - timedelta(seconds=settings.RECORD_UPLOAD_SESSION_TTL + 1)
+        )
+        spool_dir = settings.RECORD_UPLOAD_SPOOL_DIR
+        orphan = os.path.join(spool_dir, "orphan.part")
+        open(orphan, "wb").close()
+        old = time.time() - settings.RECORD_UPLOAD_SESSION_TTL - 1
+        os.utime(orphan, (old, old))
+
+        with mock.patch("meetings.batch.delete_expired_s3_files", return_value=0):
+            call_command("run_batch", stdout=StringIO())
+        self.assertFalse(UploadSession.objects.filter(pk=stale_id).exists())
+        self.assertEqual(sorted(os.listdir(spool_dir)), [f"{live_id}.part"])
+
+
+class SttChunkTests(TestCase):
+    """긴 녹음 조각 전사: 조각 계획, 실패한 조각만 다시 보내기, 이어 붙이기, 전사 시작 표시"""
+
+    def setUp(self):
+        self.host, _, meetings = make_dataset(1, 0, 0, prefix="stt-", transcript_lines=0)
+        self.meeting = meetings[0]
+
+    def make_chunks(self, *bounds, **fields):
+        return TranscriptChunk.objects.bulk_create([
+            TranscriptChunk(
+                meeting=self.meeting, index=i, source_key="rec.wav", s3_key=f"rec.wav.chunk{i:03d}.wav",
+                start_sec=start, end_sec=end, **fields,
+            )
+            for i, (start, end) in enumerate(bounds)
+        ])
+
+    def test_plan_cuts_in_silence(self):
+        regions = [[0, 40], [50, 70], [75, 95], [130, 150]]
+        # 50~100 초 사이 무음 가운데 중 가장 늦은 곳(72.5)에서 자르고, 무음이 없으면 목표 길이에서 자른다
+        self.assertEqual(stt.plan_chunks(150, regions, 100), [(0.0, 72.5), (72.5, 150)])
+        self.assertEqual(stt.plan_chunks(250, None, 100), [(0.0, 100.0), (100.0, 200.0), (200.0, 250)])
+        self.assertEqual(stt.plan_chunks(80, regions, 100), [(0.0, 80)])
+
+    def test_chunk_keeps_silence_unless_stripping(self):
+        regions = [[10, 20], [30, 40]]
+        with override_settings(RECORD_STRIP_SILENCE=False):
+            self.assertEqual(stt._chunk_spans(regions, 0, 50), [[0, 50]])
+        with override_settings(RECORD_STRIP_SILENCE=True):
+            self.assertEqual(stt._chunk_spans(regions, 0, 50), [[10, 20], [30, 40]])
+            self.assertEqual(stt._chunk_spans(regions, 45, 50), [])
+        self.assertEqual(stt._chunk_spans(None, 0, 50), [[0, 50]])
+
+    @override_settings(STT_CHUNK_MAX_ATTEMPTS=2)
+    def test_run_chunks_retries_only_failed(self):
+        chunks = self.make_chunks((0, 10), (10, 20), (20, 30))
+        TranscriptChunk.objects.filter(pk=chunks[0].pk).update(
+            status=TranscriptChunk.STATUS_DONE, segments=[{"SPEAKER_00": "완료"}]
+        )
+        chunks = list(TranscriptChunk.objects.filter(meeting=self.meeting))
+        sent = []
+
+        def transcribe(url):
+            sent.append(url)
+            if url.endswith("chunk001.wav") and sent.count(url) == 1:
+                raise stt.SttError("일시 오류")
+            return [{"SPEAKER_00": url}]
+
+        with mock.patch("meetings.utils.s3_upload.get_presigned_url", side_effect=lambda key: key), \
+                mock.patch.object(stt, "_transcribe", side_effect=transcribe):
+            stt.run_chunks(chunks)
+
+        self.assertEqual(sorted(sent), ["rec.wav.chunk001.wav", "rec.wav.chunk001.wav", "rec.wav.chunk002.wav"])
+        rows = list(TranscriptChunk.objects.filter(meeting=self.meeting))
+        self.assertEqual([c.status for c in rows], [TranscriptChunk.STATUS_DONE] * 3)
+        self.assertEqual([c.attempts for c in rows], [0, 2, 1])
+
+        # 다음 호출에서는 완료된 조각을 다시 보내지 않는다
+        with mock.patch.object(stt, "_transcribe") as transcribe_again:
+            stt.run_chunks(rows)
+        transcribe_again.assert_not_called()
+
+    def test_stitch_separates_speakers_per_chunk(self):
+        chunks = self.make_chunks((0, 600.5), (600.5, 3725), segments=None)
+        chunks[0].segments = [{"SPEAKER_00": "안녕하세요"}, {"SPEAKER_01": "네"}]
+        chunks[1].segments = [{"SPEAKER_00": "다음 안건"}]
+        self.assertEqual(stt.stitch_segments(reversed(chunks)), [
+            {"SPEAKER_00 (00:00~)": "안녕하세요"},
+            {"SPEAKER_01 (00:00~)": "네"},
+            {"SPEAKER_00 (10:00~)": "다음 안건"},
+        ])
+        # 조각이 하나면 라벨을 그대로 둔다
+        self.assertEqual(stt.stitch_segments(chunks[:1]), chunks[0].segments)
+
+    @override_settings(STT_STALE_SECONDS=600)
+    def test_claim_is_exclusive(self):
+        meeting_id = self.meeting.pk
+        self.assertTrue(stt.claim_transcription(meeting_id))
+        # 첫 요청이 아직 녹음을 내려받고 자르는 중(조각 없음)이어도 두 번째 요청은 가져가지 못한다
+        self.assertFalse(stt.claim_transcription(meeting_id))
+
+        # 가져간 지 오래됐지만 조각이 최근에 바뀌었으면 진행 중
+        self.make_chunks((0, 10))
+        Meeting.objects.filter(pk=meeting_id).update(
+            transcript_claimed_at=timezone.now() - timedelta(seconds=601)
+        )
+        self.assertFalse(stt.claim_transcription(meeting_id))
+
+        # 조각 변화도 없으면 멈춘 것으로 보고 한 요청만 다시 가져간다
+        TranscriptChunk.objects.filter(meeting_id=meeting_id).update(
+            updated_at=timezone.now() - timedelta(seconds=601)
+        )
+        self.assertTrue(stt.claim_transcription(meeting_id))
+        self.assertFalse(stt.claim_transcription(meeting_id))
+
+
+class FakeRenderPool:
+    """
+    ProcessPoolExecutor 대신 쓰는 풀. slow 에 든 회의는 끝나지 않고, 나머지는
+    queued=True 면 대기(취소 가능), 아니면 바로 완료된다. shutdown(cancel_futures=True) 는 대기 중 작업을 취소한다.
+    """
+
+    def __init__(self, slow=(), queued=False):
+        self.slow = set(slow)
+        self.queued = queued
+        self.futures = []
+        self._processes = {}
+
+    def submit(self, fn, fmt, payload):
+        future = Future()
+        if payload["meeting_id"] not in self.slow and not self.queued:
+            future.set_result(f"doc-{payload['meeting_id']}".encode())
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        if cancel_futures:
+            for future in self.futures:
+                future.cancel()
+
+
+@override_settings(MINUTES_RENDER_WORKERS=1, MINUTES_RENDER_TIMEOUT=0.05)
+class MinutesZipRetryTests(TestCase):
+    def test_queued_documents_are_retried_after_another_times_out(self):
+        pools = [FakeRenderPool(slow={1}, queued=True), FakeRenderPool()]
+        payloads = [{"meeting_id": i} for i in (1, 2, 3)]
+        with mock.patch.object(renderer, "_pool", None), \
+                mock.patch.object(renderer, "ProcessPoolExecutor", side_effect=pools):
+            data = b"".join(renderer.stream_minutes_zip(payloads, "pdf"))
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            names = zf.namelist()
+            errors = zf.read("errors.txt").decode()
+            self.assertEqual(zf.read(minutes_filename(2, "pdf")), b"doc-2")
+            self.assertEqual(zf.read(minutes_filename(3, "pdf")), b"doc-3")
+        self.assertEqual(len(names), 3)
+        # 시간 초과된 회의만 실패로 남고, 같은 풀에서 대기하다 취소된 회의는 새 풀에서 만들어진다
+        self.assertIn("meeting_1", errors)
+        self.assertNotIn("meeting_2", errors)
+        self.assertTrue(pools[0].futures[1].cancelled())
@@ -8,15 +8,21 @@ from .views import (
     MeetingTranscriptView,
     MeetingDetailView,
     meeting_record_upload,
+    meeting_upload_session_create,
+    meeting_upload_session_status,
+    meeting_upload_chunk,
+    meeting_upload_session_complete,
     meeting_audio_download,
     meeting_record_url_set,
     meeting_summary,
     MeetingSttRenderingView,
     MeetingSllmRenderingView,
     meeting_transcript_prepare,
+    meeting_transcript_progress,
     meeting_sllm_prepare,
     meeting_transcript_save,
     minutes_download,
+    minutes_bulk_download,
     minutes_save,
     meeting_transcript_api,
     tasks_save,
@@ -28,11 +34,16 @@ urlpatterns = [
     path("new/", MeetingCreateView.as_view(), name="meeting_create"),
     path("<int:meeting_id>/record/", MeetingRecordView.as_view(), name="meeting_record"),
     path("<int:meeting_id>/upload/", meeting_record_upload, name="meeting_upload"),
+    path("<int:meeting_id>/upload/sessions/", meeting_upload_session_create, name="upload_session_create"),
+    path("<int:meeting_id>/upload/sessions/<uuid:upload_id>/", meeting_upload_session_status, name="upload_session_status"),
+    path("<int:meeting_id>/upload/sessions/<uuid:upload_id>/chunks/<int:index>/", meeting_upload_chunk, name="upload_chunk"),
+    path("<int:meeting_id>/upload/sessions/<uuid:upload_id>/complete/", meeting_upload_session_complete, name="upload_session_complete"),
     path("<int:meeting_id>/record_url/set/", meeting_record_url_set, name="meeting_record_url_set"),
 
     path("<int:meeting_id>/rendering/stt/", MeetingSttRenderingView.as_view(), name="rendering_stt"),
     path("<int:meeting_id>/rendering/sllm/", MeetingSllmRenderingView.as_view(), name="rendering_sllm"),
     path("<int:meeting_id>/transcript/prepare/", meeting_transcript_prepare, name="meeting_transcript_prepare"),
+    path("<int:meeting_id>/transcript/progress/", meeting_transcript_progress, name="meeting_transcript_progress"),
     path("<int:meeting_id>/sllm/prepare/", meeting_sllm_prepare, name="meeting_sllm_prepare"),
 
     path("<int:meeting_id>/transcript/", MeetingTranscriptView.as_view(), name="meeting_transcript"),
@@ -45,6 +56,7 @@ urlpatterns = [
     path("<int:meeting_id>/minutes/save/", minutes_save, name="minutes_save"),
     path("<int:meeting_id>/minutes/download/<str:fmt>/", minutes_download, name="minutes_download"),
     path("<int:meeting_id>/tasks/save/", tasks_save, name="tasks_save"),
+    path("minutes/bulk/<str:fmt>/", minutes_bulk_download, name="minutes_bulk_download"),
 
     path("list/all/", MeetingListAllView.as_view(), name="list_all"),
     path("list/mine/", MeetingListMineView.as_view(), name="list_mine"),
@@ -0,0 +1,250 @@
+import struct
+import tempfile
+
+import numpy as np
+
+# STT 입력 형식: 16 kHz / mono / 16-bit PCM
+TARGET_SAMPLE_RATE = 16000
+# 한 번에 읽어 변환하는 프레임 수 (메모리 사용량 상한)
+BLOCK_FRAMES = 65536
+WAV_HEADER_SIZE = 44
+
+_FORMAT_PCM = 1
+_FORMAT_FLOAT = 3
+_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class UnsupportedAudio(ValueError):
+    """WAV 로 읽을 수 없거나 지원하지 않는 형식"""
+
+
+def read_wav_header(f) -> dict:
+    """
+    RIFF 청크를 따라가 fmt 정보를 읽고 data 청크 시작 위치에서 멈춘다.
+    반환: {"format", "channels", "sample_rate", "block_align", "bits", "data_size"}
+    data_size 가 None 이면 파일 끝까지가 data 이다. (녹음 중 스트리밍으로 만든 WAV)
+    """
+    riff = f.read(12)
+    if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+        raise UnsupportedAudio("WAV(RIFF) 파일이 아닙니다.")
+
+    fmt = None
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            raise UnsupportedAudio("data 청크가 없습니다.")
+        chunk_id = head[:4]
+        size = struct.unpack("<I", head[4:])[0]
+
+        if chunk_id == b"fmt ":
+            body = f.read(size + (size & 1))
+            if len(body) < 16:
+                raise UnsupportedAudio("fmt 청크가 올바르지 않습니다.")
+            fmt_tag, channels, rate, _, block_align, bits = struct.unpack("<HHIIHH", body[:16])
+            if fmt_tag == _FORMAT_EXTENSIBLE and len(body) >= 26:
+                # WAVE_FORMAT_EXTENSIBLE 은 SubFormat GUID 앞 2바이트가 실제 형식
+                fmt_tag = struct.unpack("<H", body[24:26])[0]
+            fmt = {
+                "format": fmt_tag,
+                "channels": channels,
+                "sample_rate": rate,
+                "block_align": block_align,
+                "bits": bits,
+            }
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise UnsupportedAudio("fmt 청크가 data 보다 뒤에 있습니다.")
+            _check_format(fmt)
+            data_size = None if size in (0, 0xFFFFFFFF) else size
+            return {**fmt, "data_size": data_size}
+        else:
+            # LIST 등 부가 청크는 건너뛴다.
+            f.read(size + (size & 1))
+
+
+def _check_format(fmt: dict):
+    supported = (
+        (fmt["format"] == _FORMAT_PCM and fmt["bits"] in (8, 16, 24, 32))
+        or (fmt["format"] == _FORMAT_FLOAT and fmt["bits"] in (32, 64))
+    )
+    if not supported or fmt["channels"] < 1 or fmt["sample_rate"] < 1:
+        raise UnsupportedAudio(
+            f"지원하지 않는 WAV 형식입니다. (format={fmt['format']}, bits={fmt['bits']})"
+        )
+    if fmt["block_align"] != fmt["channels"] * fmt["bits"] // 8:
+        raise UnsupportedAudio("WAV block_align 값이 올바르지 않습니다.")
+
+
+def needs_transcode(header: dict, target_rate: int = TARGET_SAMPLE_RATE) -> bool:
+    return not (
+        header["format"] == _FORMAT_PCM
+        and header["bits"] == 16
+        and header["channels"] == 1
+        and header["sample_rate"] == target_rate
+    )
+
+
+def _to_float(raw: bytes, header: dict) -> np.ndarray:
+    """프레임 바이트를 [-1, 1] float32 로 바꾸고 채널 평균으로 mono 로 합친다."""
+    bits = header["bits"]
+    if header["format"] == _FORMAT_FLOAT:
+        samples = np.frombuffer(raw, dtype="<f4" if bits == 32 else "<f8").astype(np.float32)
+    elif bits == 8:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif bits == 16:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif bits == 24:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 8388608.0
+    else:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+
+    channels = header["channels"]
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    return samples
+
+
+def _lowpass_taps(src_rate: int, dst_rate: int) -> np.ndarray:
+    """
+    다운샘플 전 에일리어싱 방지용 windowed-sinc FIR.
+    차단 주파수는 목표 나이퀴스트의 90%.
+    """
+    ratio = src_rate / dst_rate
+    num_taps = 16 * int(np.ceil(ratio)) * 2 + 1
+    cutoff = 0.9 * (dst_rate / 2) / src_rate
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.blackman(num_taps)
+    return (taps / taps.sum()).astype(np.float64)
+
+
+class _Resampler:
+    """
+    블록 단위 스트리밍 리샘플러.
+    - 다운샘플이면 FFT overlap-save 로 저역 통과 필터를 먼저 적용
+    - 출력 k 번째 샘플은 입력 위치 k * src/dst 를 선형 보간 (정수 연산으로 위치를 계산해 누적 오차 없음)
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int):
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.taps = _lowpass_taps(src_rate, dst_rate) if src_rate > dst_rate else None
+        self._fir_tail = np.zeros(0 if self.taps is None else len(self.taps) - 1)
+        self._taps_fft = {}
+        self._carry = np.zeros(0)   # 직전 블록의 마지막 샘플 (블록 경계 보간용)
+        self._base = 0              # _carry[0] 의 전체 입력 기준 위치
+        self._out_count = 0
+
+    def _filter(self, x: np.ndarray) -> np.ndarray:
+        if self.taps is None:
+            return x
+        buf = np.concatenate([self._fir_tail, x])
+        self._fir_tail = buf[len(buf) - len(self._fir_tail):]
+        nfft = 1 << (len(buf) - 1).bit_length()
+        taps_fft = self._taps_fft.get(nfft)
+        if taps_fft is None:
+            taps_fft = self._taps_fft[nfft] = np.fft.rfft(self.taps, nfft)
+        y = np.fft.irfft(np.fft.rfft(buf, nfft) * taps_fft, nfft)
+        return y[len(self.taps) - 1:len(buf)]
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        if self.src_rate == self.dst_rate:
+            return x
+        z = np.concatenate([self._carry, self._filter(x.astype(np.float64))])
+        if len(z) < 2:
+            self._carry = z
+            return np.zeros(0)
+
+        # 보간에 다음 샘플이 필요하므로 z 의 마지막 샘플 위치 미만까지만 출력
+        last = self._base + len(z) - 1
+        k_end = -(-last * self.dst_rate // self.src_rate)
+        ks = np.arange(self._out_count, k_end, dtype=np.int64)
+        num = ks * self.src_rate - self._base * self.dst_rate
+        idx = num // self.dst_rate
+        frac = (num % self.dst_rate) / self.dst_rate
+        out = z[idx] * (1.0 - frac) + z[idx + 1] * frac
+
+        self._out_count = k_end
+        self._carry = z[-1:]
+        self._base = last
+        return out
+
+
+def _to_pcm16(x: np.ndarray) -> bytes:
+    return (np.clip(np.rint(x * 32767.0), -32768, 32767).astype("<i2")).tobytes()
+
+
+def wav_header(frames: int, sample_rate: int) -> bytes:
+    data_size = frames * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, _FORMAT_PCM, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size,
+    )
+
+
+def transcode_wav(src, dst, header: dict, target_rate: int = TARGET_SAMPLE_RATE,
+                  block_frames: int = BLOCK_FRAMES) -> int:
+    """
+    read_wav_header 로 data 시작까지 읽은 src 를 target_rate mono 16-bit WAV 로 dst 에 쓴다.
+    dst 는 마지막에 헤더 크기를 고쳐 쓰므로 seek 가능해야 한다. 반환: 출력 프레임 수
+    """
+    resampler = _Resampler(header["sample_rate"], target_rate)
+    block_align = header["block_align"]
+    remaining = header["data_size"]
+    pending = b""
+    frames = 0
+
+    dst.write(wav_header(0, target_rate))
+    while remaining is None or remaining > 0:
+        want = block_frames * block_align
+        if remaining is not None:
+            want = min(want, remaining)
+        raw = src.read(want)
+        if not raw:
+            break
+        if remaining is not None:
+            remaining -= len(raw)
+        raw = pending + raw
+        usable = len(raw) - len(raw) % block_align
+        pending = raw[usable:]
+        if not usable:
+            continue
+        out = resampler.process(_to_float(raw[:usable], header))
+        dst.write(_to_pcm16(out))
+        frames += len(out)
+
+    dst.seek(0)
+    dst.write(wav_header(frames, target_rate))
+    dst.seek(0, 2)
+    return frames
+
+
+def normalize_wav(src, target_rate: int = TARGET_SAMPLE_RATE):
+    """
+    src(WAV 파일 객체)를 target_rate mono 16-bit PCM 으로 바꾼 임시 파일을 반환한다.
+    - 이미 그 형식이면 None 을 반환하고 src 는 원래 위치로 되돌린다.
+    - 반환된 임시 파일은 처음 위치로 되감겨 있으며 close() 하면 삭제된다.
+    - 읽을 수 없는 형식이면 UnsupportedAudio (src 위치는 되돌린다)
+    """
+    start = src.tell()
+    try:
+        header = read_wav_header(src)
+    except UnsupportedAudio:
+        src.seek(start)
+        raise
+    if not needs_transcode(header, target_rate):
+        src.seek(start)
+        return None
+
+    out = tempfile.TemporaryFile()
+    try:
+        transcode_wav(src, out, header, target_rate)
+    except Exception:
+        out.close()
+        raise
+    out.seek(0)
+    return out
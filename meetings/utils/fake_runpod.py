@@ -0,0 +1,156 @@
+import json
+import random
+import threading
+import time
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+# 가짜 발화/요약에 쓰는 단어
+WORDS = [
+    "회의", "안건", "검토", "결과", "일정", "공유", "담당자", "마케팅", "예산", "출시",
+    "디자인", "시안", "확정", "다음", "주까지", "보고서", "작성", "고객", "피드백", "반영",
+]
+
+
+class FakeRunpod:
+    """
+    RunPod 추론 서버(/health, /stt, /inference)를 흉내 내는 WSGI 앱.
+    실제 서버와 같은 응답 형식을 돌려주며 지연/실패율/응답 크기를 조절할 수 있다.
+
+    - stt_latency / sllm_latency: 요청당 기본 지연(초), jitter 만큼 무작위로 더함
+    - failure_rate: /stt, /inference 요청이 500 으로 실패할 확률 (0~1)
+    - segments / segment_words: /stt 응답 발화 수와 발화당 단어 수
+    - tasks: /inference 응답 태스크 수
+    """
+
+    def __init__(self, stt_latency=0.0, sllm_latency=0.0, jitter=0.0, failure_rate=0.0,
+                 segments=20, segment_words=12, speakers=3, tasks=3, seed=None):
+        self.stt_latency = stt_latency
+        self.sllm_latency = sllm_latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.segments = segments
+        self.segment_words = segment_words
+        self.speakers = speakers
+        self.tasks = tasks
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {"health": 0, "stt": 0, "inference": 0, "failed": 0}
+
+    # ===== 응답 본문 =====
+
+    def _words(self, n: int) -> str:
+        return " ".join(self._rng.choice(WORDS) for _ in range(n))
+
+    def stt_body(self, audio_url: str) -> dict:
+        with self._lock:
+            full_text = [
+                {f"SPEAKER_{i % max(self.speakers, 1):02d}": self._words(self.segment_words)}
+                for i in range(self.segments)
+            ]
+        return {"success": True, "data": {"audio_url": audio_url, "full_text": full_text}}
+
+    def inference_body(self, transcript: str, domain) -> dict:
+        with self._lock:
+            agendas = [
+                {"agenda_title": self._words(3), "agenda_summary": self._words(20)}
+                for _ in range(max(1, self.tasks))
+            ]
+            full_tasks = [
+                {"description": self._words(6), "assignee": "", "due": "다음 주 금요일"}
+                for _ in range(self.tasks)
+            ]
+        return {
+            "success": True,
+            "data": {
+                "domain": domain,
+                "full_summary": {"agendas": agendas},
+                "full_tasks": full_tasks,
+            },
+        }
+
+    # ===== WSGI =====
+
+    def _sleep(self, base: float):
+        with self._lock:
+            extra = self._rng.uniform(0, self.jitter) if self.jitter else 0.0
+        if base + extra > 0:
+            time.sleep(base + extra)
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.failure_rate
+
+    def _count(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+
+    def __call__(self, environ, start_response):
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "").rstrip("/")
+
+        if path == "/health" and method == "GET":
+            self._count("health")
+            return self._json(start_response, 200, {"status": "ok"})
+
+        if path not in ("/stt", "/inference"):
+            return self._json(start_response, 404, {"success": False, "message": "not found"})
+        if method != "POST":
+            return self._json(start_response, 405, {"success": False, "message": "method not allowed"})
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            payload = json.loads(environ["wsgi.input"].read(length) or b"{}")
+        except ValueError:
+            return self._json(start_response, 400, {"success": False, "message": "invalid json"})
+
+        name = path.lstrip("/")
+        self._count(name)
+        self._sleep(self.stt_latency if name == "stt" else self.sllm_latency)
+        if self._should_fail():
+            self._count("failed")
+            return self._json(start_response, 500, {"success": False, "message": f"{name} simulated failure"})
+
+        if name == "stt":
+            if not payload.get("audio_url"):
+                return self._json(start_response, 400, {"success": False, "message": "audio_url is required"})
+            return self._json(start_response, 200, self.stt_body(payload["audio_url"]))
+        return self._json(
+            start_response, 200,
+            self.inference_body(payload.get("transcript", ""), payload.get("domain", [])),
+        )
+
+    @staticmethod
+    def _json(start_response, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}.get(status, "Error")
+        start_response(
+            f"{status} {reason}",
+            [("Content-Type", "application/json; charset=utf-8"), ("Content-Length", str(len(data)))],
+        )
+        return [data]
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def make_fake_server(app: FakeRunpod, host="127.0.0.1", port=0, quiet=True):
+    """요청마다 스레드를 쓰는 WSGI 서버. port=0 이면 빈 포트를 고른다."""
+    handler = _QuietHandler if quiet else WSGIRequestHandler
+    return make_server(host, port, app, server_class=_ThreadingWSGIServer, handler_class=handler)
+
+
+def serve_in_thread(app: FakeRunpod, host="127.0.0.1", port=0):
+    """
+    테스트/부하 측정용으로 백그라운드 스레드에서 서버를 띄운다.
+    반환: (server, base_url). 끝나면 server.shutdown(); server.server_close()
+    """
+    server = make_fake_server(app, host, port)
+    threading.Thread(target=server.serve_forever, name="fake-runpod", daemon=True).start()
+    return server, f"http://{host}:{server.server_port}/"
@@ -0,0 +1,39 @@
+import threading
+
+
+class FakeS3:
+    """
+    부하 측정/로컬 실행용 메모리 S3 클라이언트.
+    meetings 에서 쓰는 boto3 S3 메서드(upload_fileobj, download_fileobj, generate_presigned_url,
+    delete_object)만 흉내 낸다. boto3.client(...) 대신 이 객체가 반환되도록 바꿔 끼워 쓴다.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        # boto3.client 자리에 그대로 넣을 수 있도록 호출하면 자기 자신을 반환
+        return self
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None):
+        data = Fileobj.read()
+        with self._lock:
+            self.objects[Key] = data
+
+    def download_fileobj(self, Bucket, Key, Fileobj):
+        with self._lock:
+            data = self.objects[Key]
+        Fileobj.write(data)
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn=3600):
+        return f"fake-s3://{Params['Bucket']}/{Params['Key']}"
+
+    def delete_object(self, Bucket, Key):
+        with self._lock:
+            self.objects.pop(Key, None)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self.objects.values())
@@ -0,0 +1,606 @@
+import math
+import re
+from io import BytesIO
+from pathlib import Path
+from typing import Dict
+
+from django.conf import settings
+from django.utils.html import strip_tags
+from docx import Document
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+from meetings.utils.pdf_layout import GlyphWidthTable
+
+# 한글 폰트 등록 (맑은 고딕 사용)
+KOREAN_FONT_NAME = settings.KOREAN_FONT_NAME
+
+MINUTES_CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+# 폰트 등록 시 함께 만드는 글자 폭 표 (줄바꿈 계산용)
+_glyph_widths = None
+
+
+def _register_korean_font():
+    """
+    PDF를 처음 만들 때 호출된다. (모듈 import 시점에는 TTF 파일을 읽지 않는다)
+    reportlab 은 문서에 실제로 쓰인 글자만 서브셋으로 임베드하므로
+    폰트 전체가 PDF에 들어가지는 않는다.
+    """
+    global _glyph_widths
+
+    # 이미 등록되어 있으면 바로 종료
+    if KOREAN_FONT_NAME in pdfmetrics.getRegisteredFontNames():
+        if _glyph_widths is None:
+            _glyph_widths = GlyphWidthTable(KOREAN_FONT_NAME)
+        return
+
+    font_path: Path = settings.KOREAN_FONT_PATH
+
+    if not font_path.exists():
+        raise FileNotFoundError(f"Korean font file not found: {font_path}")
+
+    pdfmetrics.registerFont(TTFont(KOREAN_FONT_NAME, str(font_path)))
+    _glyph_widths = GlyphWidthTable(KOREAN_FONT_NAME)
+
+
+def get_glyph_widths() -> GlyphWidthTable:
+    _register_korean_font()
+    return _glyph_widths
+
+
+def parse_minutes_sections(html: str) -> Dict[str, str]:
+    """
+    meeting.meeting_notes 에 저장된 HTML에서 data-minutes-section 별 텍스트 추출
+    """
+    if not html:
+        return {}
+
+    pattern = re.compile(
+        r'<div[^>]*data-minutes-section="(?P<key>[^"]+)"[^>]*>(?P<body>.*?)</div>',
+        re.DOTALL | re.IGNORECASE,
+    )
+
+    sections: Dict[str, str] = {}
+    for match in pattern.finditer(html):
+        key = match.group("key")
+        body_html = match.group("body")
+        text = strip_tags(body_html).replace("&nbsp;", " ")
+        lines = [ln.rstrip() for ln in text.splitlines()]
+        text_clean = "\n".join(ln for ln in lines if ln.strip())
+        sections[key] = text_clean
+
+    return sections
+
+def extract_major_agenda(html: str) -> str:
+    """
+    회의록 HTML 안에서 '주요안건' 행 아래 minutes-editbox 내용을 우선 추출
+    """
+    if not html:
+        return ""
+
+    pattern = re.compile(
+        r'<th[^>]*>\s*주요안건\s*</th>.*?<div[^>]*class="[^"]*minutes-editbox[^"]*"[^>]*>(?P<body>.*?)</div>',
+        re.DOTALL | re.IGNORECASE,
+    )
+    match = pattern.search(html)
+    if not match:
+        return ""
+
+    text = strip_tags(match.group("body")).replace("&nbsp;", " ").strip()
+    return text
+
+
+def collect_minutes_payload(meeting, attendees) -> dict:
+    """
+    회의록 생성에 필요한 값만 뽑아 dict로 직렬화한다.
+    ORM 객체를 넘기지 않으므로 별도 프로세스에서도 그대로 문서를 만들 수 있다.
+    attendees: user/user__dept 가 select_related 된 Attendee 목록
+    """
+    if getattr(meeting, "host", None):
+        host_name = meeting.host.name
+    else:
+        host_name = getattr(meeting, "responsible_name", "")
+
+    return {
+        "meeting_id": meeting.meeting_id,
+        "title": meeting.title or "",
+        "meet_date_time": (
+            meeting.meet_date_time.strftime("%Y.%m.%d %H:%M")
+            if meeting.meet_date_time
+            else ""
+        ),
+        "place": meeting.place or "",
+        "host_name": host_name,
+        "meeting_notes": meeting.meeting_notes or "",
+        "summary": meeting.summary or "",
+        "transcript": meeting.transcript or "",
+        "attendees": [
+            {
+                "dept_name": a.user.dept.dept_name if a.user.dept else "",
+                "name": a.user.name,
+            }
+            for a in attendees
+        ],
+    }
+
+
+def minutes_filename(meeting_id, fmt: str) -> str:
+    return f"meeting_{meeting_id}_minutes.{fmt}"
+
+
+def _clean_section(text: str, header_keywords) -> str:
+    if not text:
+        return ""
+    lines = [ln.rstrip() for ln in text.splitlines()]
+    while lines and not lines[0].strip():
+        lines.pop(0)
+
+    if lines:
+        first = lines[0].replace(" ", "")
+        if all(keyword in first for keyword in header_keywords):
+            lines.pop(0)
+
+    return "\n".join(lines).strip()
+
+
+def _minutes_context(payload: dict) -> dict:
+    """
+    payload(회의록 HTML 등)에서 PDF/DOCX 공통으로 쓰는 섹션 텍스트를 계산한다.
+    """
+    meeting_notes = payload["meeting_notes"]
+    sections = parse_minutes_sections(meeting_notes)
+
+    contents_text = _clean_section(sections.get("contents", ""), ["회의", "내용"])
+    results_text = _clean_section(sections.get("results", ""), ["회의", "결과"])
+    todos_text = _clean_section(sections.get("todos", ""), ["해야", "할", "일"])
+    base_text = _clean_section(sections.get("base", ""), ["기본", "정보"])
+
+    main_agenda = extract_major_agenda(meeting_notes)
+    if not main_agenda and base_text:
+        for ln in base_text.splitlines():
+            if ln.strip():
+                main_agenda = ln.strip()
+                break
+    if not main_agenda and contents_text:
+        for ln in contents_text.splitlines():
+            if ln.strip():
+                main_agenda = ln.strip()
+                break
+
+    if meeting_notes:
+        raw_html = (
+            meeting_notes
+            .replace("<br>", "\n")
+            .replace("<br/>", "\n")
+            .replace("<br />", "\n")
+        )
+        text_body = strip_tags(raw_html).replace("&nbsp;", " ")
+    elif payload["summary"]:
+        text_body = payload["summary"]
+    elif payload["transcript"]:
+        text_body = payload["transcript"]
+    else:
+        text_body = "회의 내용이 아직 등록되지 않았습니다."
+
+    return {
+        "sections": sections,
+        "contents_text": contents_text,
+        "results_text": results_text,
+        "todos_text": todos_text,
+        "main_agenda": main_agenda,
+        "text_body": text_body,
+    }
+
+
+def build_minutes_pdf(payload: dict) -> bytes:
+    _register_korean_font()
+
+    ctx = _minutes_context(payload)
+    sections = ctx["sections"]
+    contents_text = ctx["contents_text"]
+    results_text = ctx["results_text"]
+    todos_text = ctx["todos_text"]
+    main_agenda = ctx["main_agenda"]
+
+    has_base = "base" in sections
+    has_contents = "contents" in sections
+    has_results = "results" in sections
+    has_todos = "todos" in sections
+    has_attendees_section = "attendees" in sections
+
+    agenda = payload["title"]
+    meeting_dt_str = payload["meet_date_time"]
+    place = payload["place"]
+    host_name = payload["host_name"]
+    attendees_count = len(payload["attendees"])
+
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=A4)
+
+    width, height = A4
+    x_margin = 50
+    top_margin = height - 50
+    bottom_margin = 40
+    line_height = 14
+
+    font = KOREAN_FONT_NAME
+
+    glyph_widths = get_glyph_widths()
+
+    def wrap_line_by_width(line: str, max_width: float, font_size: int = 10):
+        """
+        주어진 폭 안에 단어 단위로 줄바꿈. 너무 긴 단어는 폭에 맞게 강제 분리.
+        """
+        return glyph_widths.wrap_line(line, max_width, font_size)
+
+    def draw_page_border(top_y, bottom_y):
+        p.line(x_left, top_y, x_left, bottom_y)
+        p.line(x_right, top_y, x_right, bottom_y)
+
+    def start_new_page():
+        nonlocal current_top, table_top_y
+        p.setFont(font, 11)
+        current_top = top_margin
+        table_top_y = current_top
+
+    def finalize_current_page(outer_bottom_value):
+        draw_page_border(table_top_y, outer_bottom_value)
+
+    y = top_margin
+    p.setFont(font, 18)
+    p.drawString(x_margin, y, payload["title"] or "회의록")
+    y -= 40
+
+    p.setFont(font, 11)
+    x_left = x_margin
+    x_right = width - x_margin
+
+    header_row_h = 24
+    label_row_h = 24
+    contents_h = 200
+    results_h = 200
+    todos_h = 150
+    attend_header_h = 24
+    attend_row_h = 24
+
+    rows_per_side = max(4, math.ceil(attendees_count / 2))
+    attend_rows_h = rows_per_side * attend_row_h
+
+    table_top_y = y
+    current_top = table_top_y
+
+    center_x = (x_left + x_right) / 2.0
+
+    if has_base:
+        label_w = 80
+        right_w = 120
+        x_label = x_left + label_w
+        x_right_block = x_right - right_w
+
+        header_top = current_top
+
+        for i in range(5):
+            y_line = header_top - header_row_h * i
+            p.line(x_left, y_line, x_right, y_line)
+
+        p.line(x_left, header_top, x_left, header_top - 4 * header_row_h)
+        p.line(x_right, header_top, x_right, header_top - 4 * header_row_h)
+
+        p.line(x_label, header_top, x_label, header_top - header_row_h)
+        p.line(x_label, header_top - header_row_h, x_label, header_top - 2 * header_row_h)
+        p.line(x_label, header_top - 2 * header_row_h, x_label, header_top - 3 * header_row_h)
+        p.line(x_label, header_top - 3 * header_row_h, x_label, header_top - 4 * header_row_h)
+
+        p.line(x_right_block, header_top - header_row_h, x_right_block, header_top - 3 * header_row_h)
+
+        def header_text_y(row_idx: int) -> float:
+            return header_top - header_row_h * row_idx - header_row_h + 8
+
+        y_row1 = header_text_y(0)
+        p.drawString(x_left + 5, y_row1, "제 목")
+        p.drawString(x_left + 5 + 80, y_row1, agenda)
+
+        y_row2 = header_text_y(1)
+        p.drawString(x_left + 5, y_row2, "일 시")
+        p.drawString(x_left + 5 + 80, y_row2, meeting_dt_str)
+        host_label = "주최자명"
+        if host_name:
+            host_label += f" {host_name}"
+        p.drawString(x_right_block + 5, y_row2, host_label)
+
+        y_row3 = header_text_y(2)
+        p.drawString(x_left + 5, y_row3, "장 소")
+        p.drawString(x_left + 5 + 80, y_row3, place)
+        p.drawString(x_right_block + 5, y_row3, f"참석인원  {attendees_count}")
+
+        y_row4 = header_text_y(3)
+        p.drawString(x_left + 5, y_row4, "주요안건")
+        if main_agenda:
+            agenda_box_width = x_right - (x_left + 80) - 10
+            agenda_lines = wrap_line_by_width(main_agenda, agenda_box_width, font_size=11)
+            agenda_y = y_row4
+            for line in agenda_lines:
+                p.drawString(x_left + 5 + 80, agenda_y, line)
+                agenda_y -= line_height
+
+        current_top = header_top - 4 * header_row_h
+    else:
+        current_top = y
+
+    if has_contents:
+        contents_title_top = current_top
+        contents_title_bottom = contents_title_top - label_row_h
+        p.line(x_left, contents_title_bottom, x_right, contents_title_bottom)
+        p.drawCentredString(center_x, contents_title_bottom + 8, "회의 내용")
+
+        contents_box_top = contents_title_bottom
+        contents_box_bottom = contents_box_top - contents_h
+        p.line(x_left, contents_box_bottom, x_right, contents_box_bottom)
+
+        current_top = contents_box_bottom
+    else:
+        contents_box_top = contents_box_bottom = None
+
+    if has_results:
+        results_title_top = current_top
+        results_title_bottom = results_title_top - label_row_h
+        p.line(x_left, results_title_bottom, x_right, results_title_bottom)
+        p.drawCentredString(center_x, results_title_bottom + 8, "회의 결과")
+
+        results_box_top = results_title_bottom
+        results_box_bottom = results_box_top - results_h
+        p.line(x_left, results_box_bottom, x_right, results_box_bottom)
+
+        current_top = results_box_bottom
+    else:
+        results_box_top = results_box_bottom = None
+
+    if has_todos:
+        todos_title_top = current_top
+        todos_title_bottom = todos_title_top - label_row_h
+        p.line(x_left, todos_title_bottom, x_right, todos_title_bottom)
+        p.drawCentredString(center_x, todos_title_bottom + 8, "해야 할 일")
+
+        todos_box_top = todos_title_bottom
+        todos_box_bottom = todos_box_top - todos_h
+        p.line(x_left, todos_box_bottom, x_right, todos_box_bottom)
+
+        current_top = todos_box_bottom
+    else:
+        todos_box_top = todos_box_bottom = None
+
+    p.setFont(font, 10)
+
+    def draw_multiline_in_box(text, x_left_box, x_right_box, top_y, bottom_y):
+        usable_width = (x_right_box - x_left_box) - 10  # 좌우 여백 5씩 확보
+        y_pos = top_y - 14
+        for raw_line in (text or "").splitlines():
+            wrapped = wrap_line_by_width(raw_line, usable_width)
+            for line in wrapped:
+                if not line and len(wrapped) == 1:
+                    continue
+                if y_pos < bottom_y + line_height:
+                    return
+                p.drawString(x_left_box + 5, y_pos, line)
+                y_pos -= line_height
+
+    if has_contents and contents_box_top is not None:
+        draw_multiline_in_box(
+            contents_text,
+            x_left,
+            x_right,
+            contents_box_top,
+            contents_box_bottom,
+        )
+
+    if has_results and results_box_top is not None:
+        draw_multiline_in_box(
+            results_text,
+            x_left,
+            x_right,
+            results_box_top,
+            results_box_bottom,
+        )
+
+    if has_todos and todos_box_top is not None:
+        draw_multiline_in_box(
+            todos_text,
+            x_left,
+            x_right,
+            todos_box_top,
+            todos_box_bottom,
+        )
+
+    p.setFont(font, 11)
+
+    if has_attendees_section or not sections:
+        attend_label_top = current_top
+        attend_label_bottom = attend_label_top - label_row_h
+        attend_block_height = label_row_h + attend_header_h + attend_rows_h
+
+        if attend_label_top - attend_block_height < bottom_margin:
+            outer_bottom = current_top
+            finalize_current_page(outer_bottom)
+            p.showPage()
+            start_new_page()
+            attend_label_top = current_top
+            attend_label_bottom = attend_label_top - label_row_h
+
+        p.line(x_left, attend_label_bottom, x_right, attend_label_bottom)
+        p.drawCentredString(center_x, attend_label_bottom + 8, "참석자")
+
+        attend_header_top = attend_label_bottom
+        attend_header_bottom = attend_header_top - attend_header_h
+        p.line(x_left, attend_header_bottom, x_right, attend_header_bottom)
+
+        col_w = (x_right - x_left) / 6.0
+        x_cols = [x_left + col_w * i for i in range(7)]
+
+        attend_table_bottom = attend_header_bottom - attend_rows_h
+        for xv in x_cols:
+            p.line(xv, attend_header_top, xv, attend_table_bottom)
+
+        header_y = attend_header_bottom + 5
+        p.drawString(x_cols[0] + 5, header_y, "소 속")
+        p.drawString(x_cols[1] + 5, header_y, "성 명")
+        p.drawString(x_cols[2] + 5, header_y, "서 명")
+        p.drawString(x_cols[3] + 5, header_y, "소 속")
+        p.drawString(x_cols[4] + 5, header_y, "성 명")
+        p.drawString(x_cols[5] + 5, header_y, "서 명")
+
+        row_top = attend_header_bottom
+        for _ in range(rows_per_side):
+            row_top -= attend_row_h
+            p.line(x_left, row_top, x_right, row_top)
+
+        outer_bottom = attend_table_bottom
+    else:
+        outer_bottom = current_top
+
+    finalize_current_page(outer_bottom)
+
+    if has_attendees_section or not sections:
+        attendees_list = payload["attendees"]
+        rows_per_side = max(4, math.ceil(len(attendees_list) / 2))
+        col_w = (x_right - x_left) / 6.0
+        x_cols = [x_left + col_w * i for i in range(7)]
+        for row_idx in range(rows_per_side):
+            row_text_y = attend_header_bottom - attend_row_h * row_idx - attend_row_h + 5
+
+            left_idx = row_idx
+            if left_idx < len(attendees_list):
+                att = attendees_list[left_idx]
+                dept = att["dept_name"]
+                name = att["name"]
+                p.drawString(x_cols[0] + 5, row_text_y, dept)
+                p.drawString(x_cols[1] + 5, row_text_y, name)
+            p.drawString(x_cols[2] + 5, row_text_y, "(인)")
+
+            right_idx = row_idx + rows_per_side
+            if right_idx < len(attendees_list):
+                att = attendees_list[right_idx]
+                dept = att["dept_name"]
+                name = att["name"]
+                p.drawString(x_cols[3] + 5, row_text_y, dept)
+                p.drawString(x_cols[4] + 5, row_text_y, name)
+            p.drawString(x_cols[5] + 5, row_text_y, "(인)")
+
+    p.showPage()
+    p.save()
+
+    pdf_value = buffer.getvalue()
+    buffer.close()
+
+    return pdf_value
+
+
+def build_minutes_docx(payload: dict) -> bytes:
+    ctx = _minutes_context(payload)
+    contents_text = ctx["contents_text"]
+    results_text = ctx["results_text"]
+    todos_text = ctx["todos_text"]
+    main_agenda = ctx["main_agenda"]
+    text_body = ctx["text_body"]
+
+    agenda = payload["title"]
+    meeting_dt_str = payload["meet_date_time"]
+    place = payload["place"]
+    host_name = payload["host_name"]
+    attendees_count = len(payload["attendees"])
+
+    doc = Document()
+    doc.add_heading(payload["title"] or "회의록", level=1)
+
+    info_rows = [
+        ("제목", agenda or "-"),
+        ("일시", meeting_dt_str or "-"),
+        ("장소", place or "-"),
+        ("주최자", host_name or "-"),
+        ("주요안건", main_agenda or "-"),
+        ("참석자 수", str(attendees_count)),
+    ]
+    info_table = doc.add_table(rows=len(info_rows), cols=2)
+    info_table.style = "Table Grid"
+    for idx, (label, value) in enumerate(info_rows):
+        cells = info_table.rows[idx].cells
+        cells[0].text = label
+        cells[1].text = value
+
+    def add_doc_section(title: str, text: str):
+        cleaned = (text or "").strip()
+        if not cleaned:
+            return
+        doc.add_paragraph("")
+        doc.add_heading(title, level=2)
+        for ln in cleaned.splitlines():
+            doc.add_paragraph(ln)
+
+    add_doc_section("회의 내용", contents_text)
+    add_doc_section("회의 결과", results_text)
+    add_doc_section("해야 할 일", todos_text)
+
+    doc.add_paragraph("")
+    doc.add_heading("참석자", level=2)
+    attendees_list = payload["attendees"]
+    if attendees_list:
+        rows = max(1, math.ceil(len(attendees_list) / 2))
+        table = doc.add_table(rows=rows + 1, cols=4)
+        table.style = "Table Grid"
+        header_cells = table.rows[0].cells
+        header_cells[0].text = "소 속"
+        header_cells[1].text = "성 명"
+        header_cells[2].text = "소 속"
+        header_cells[3].text = "성 명"
+
+        for row_idx in range(rows):
+            row_cells = table.rows[row_idx + 1].cells
+            left_idx = row_idx
+            if left_idx < len(attendees_list):
+                att = attendees_list[left_idx]
+                dept = att["dept_name"]
+                name = att["name"]
+                row_cells[0].text = dept
+                row_cells[1].text = name
+            right_idx = row_idx + rows
+            if right_idx < len(attendees_list):
+                att = attendees_list[right_idx]
+                dept = att["dept_name"]
+                name = att["name"]
+                row_cells[2].text = dept
+                row_cells[3].text = name
+    else:
+        doc.add_paragraph("참석자 정보가 없습니다.")
+
+    if not payload["meeting_notes"] and text_body:
+        doc.add_paragraph("")
+        doc.add_heading("회의 내용", level=2)
+        for line in text_body.splitlines():
+            doc.add_paragraph(line)
+
+    buf = BytesIO()
+    doc.save(buf)
+    buf.seek(0)
+
+    return buf.getvalue()
+
+
+MINUTES_BUILDERS = {
+    "pdf": build_minutes_pdf,
+    "docx": build_minutes_docx,
+}
+
+
+def build_minutes(fmt: str, payload: dict) -> bytes:
+    """
+    fmt(pdf/docx)에 맞는 회의록 파일 bytes를 만든다.
+    최상위 함수라서 meetings.utils.renderer 의 프로세스 풀에 그대로 넘길 수 있다.
+    """
+    return MINUTES_BUILDERS[fmt](payload)
+
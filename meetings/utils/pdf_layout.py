@@ -0,0 +1,76 @@
+from reportlab.pdfbase import pdfmetrics
+
+
+class GlyphWidthTable:
+    """
+    등록된 TTF 폰트의 글자별 폭(1/1000 em)을 한 번만 읽어 둔 표.
+    pdfmetrics.stringWidth 는 호출마다 문자열 전체를 다시 합산하므로,
+    줄바꿈처럼 같은 글자의 폭을 반복해서 묻는 곳에서는 이 표를 쓴다.
+    """
+
+    def __init__(self, font_name: str):
+        face = pdfmetrics.getFont(font_name).face
+        self.font_name = font_name
+        self.default_width = face.defaultWidth
+        self._widths = {chr(cp): w for cp, w in face.charWidths.items()}
+
+    def char_width(self, ch: str):
+        return self._widths.get(ch, self.default_width)
+
+    def text_units(self, text: str):
+        get = self._widths.get
+        dw = self.default_width
+        return sum(get(ch, dw) for ch in text)
+
+    def string_width(self, text: str, font_size: float) -> float:
+        """pdfmetrics.stringWidth 와 같은 값(pt)을 반환한다."""
+        return 0.001 * font_size * self.text_units(text)
+
+    def wrap_line(self, line: str, max_width: float, font_size: float = 10):
+        """
+        주어진 폭 안에 단어 단위로 줄바꿈. 폭보다 긴 단어는 글자 단위로 강제 분리.
+        각 글자의 폭을 한 번씩만 더하므로 줄 길이에 선형이다.
+        """
+        words = line.split()
+        if not words:
+            return [""]
+
+        def fits(units) -> bool:
+            return 0.001 * font_size * units <= max_width
+
+        space_units = self.char_width(" ")
+        lines = []
+        current = []
+        current_units = 0
+
+        for word in words:
+            word_units = self.text_units(word)
+            if current:
+                candidate_units = current_units + space_units + word_units
+                if fits(candidate_units):
+                    current.append(" ")
+                    current.append(word)
+                    current_units = candidate_units
+                    continue
+                lines.append("".join(current))
+
+            if fits(word_units):
+                current = [word]
+                current_units = word_units
+                continue
+
+            # 한 줄에 들어가지 않는 단어: 들어가는 만큼씩 잘라 내고 남은 부분은 다음 단어와 이어 붙인다.
+            start = 0
+            piece_units = 0
+            for idx, ch in enumerate(word):
+                w = self.char_width(ch)
+                if idx > start and not fits(piece_units + w):
+                    lines.append(word[start:idx])
+                    start = idx
+                    piece_units = 0
+                piece_units += w
+            current = [word[start:]]
+            current_units = piece_units
+
+        lines.append("".join(current))
+        return lines
@@ -0,0 +1,185 @@
+import multiprocessing
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+from meetings.utils.minutes_export import (
+    _register_korean_font,
+    build_minutes,
+    minutes_filename,
+)
+
+
+class RenderTimeout(Exception):
+    """회의록 생성이 MINUTES_RENDER_TIMEOUT 초를 넘긴 경우"""
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker():
+    # 자식 프로세스가 뜰 때 한 번만 폰트를 등록해 두고 이후 작업에서 재사용한다.
+    try:
+        _register_korean_font()
+    except FileNotFoundError:
+        # initializer 가 실패하면 풀 전체가 깨지므로 여기서는 넘어가고,
+        # 폰트가 필요한 PDF 생성 시점에 build_minutes_pdf 가 같은 오류를 낸다. (DOCX는 영향 없음)
+        pass
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # gunicorn 워커는 배치 스레드 등을 띄우므로 fork 대신 spawn 으로 자식을 만든다.
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.MINUTES_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool):
+    """
+    멈춘 문서가 있는 풀을 버리고 자식 프로세스를 종료한다.
+    다음 요청에서 _get_pool() 이 새 풀을 만든다.
+    pool 이 이미 교체된 풀이면(다른 요청이 먼저 버리고 새로 만든 경우) 아무것도 하지 않는다.
+    """
+    global _pool
+    with _pool_lock:
+        if pool is None or _pool is not pool:
+            return
+        _pool = None
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for proc in processes:
+        proc.terminate()
+
+
+def submit_minutes(fmt: str, payload: dict) -> Future:
+    """
+    회의록 생성을 프로세스 풀에 넘기고 Future 를 반환한다.
+    MINUTES_RENDER_WORKERS 가 0 이면 현재 스레드에서 바로 만든다. (개발/테스트용)
+    """
+    if settings.MINUTES_RENDER_WORKERS <= 0:
+        future = Future()
+        try:
+            future.set_result(build_minutes(fmt, payload))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    pool = _get_pool()
+    try:
+        future = pool.submit(build_minutes, fmt, payload)
+    except (BrokenProcessPool, RuntimeError):
+        # 자식 프로세스가 죽었거나 이미 종료된 풀이면 새로 만들어 한 번 더 시도
+        _discard_pool(pool)
+        pool = _get_pool()
+        future = pool.submit(build_minutes, fmt, payload)
+    # 시간 초과/풀 깨짐 시 이 작업이 돌던 풀만 버리도록 기록해 둔다
+    future.render_pool = pool
+    return future
+
+
+def wait_minutes(future: Future, timeout=None) -> bytes:
+    if timeout is None:
+        timeout = settings.MINUTES_RENDER_TIMEOUT
+    pool = getattr(future, "render_pool", None)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        _discard_pool(pool)
+        raise RenderTimeout(f"회의록 생성이 {timeout}초를 초과했습니다.")
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+    except CancelledError:
+        # 다른 작업의 시간 초과로 풀이 버려지며(cancel_futures) 대기 중이던 작업이 취소된 경우.
+        # 풀이 깨진 경우와 같이 호출한 쪽에서 새 풀로 한 번 더 시도하게 한다.
+        raise BrokenProcessPool("회의록 생성 풀이 교체되어 대기 중이던 작업이 취소되었습니다.")
+
+
+def render_minutes(fmt: str, payload: dict, timeout=None) -> bytes:
+    """
+    회의록 하나를 만든다. 다른 요청의 시간 초과로 풀이 종료되어 BrokenProcessPool 이 나면(대기 중 취소 포함)
+    새 풀에서 한 번 더 시도하고, 그래도 실패하면 BrokenProcessPool 을 그대로 올린다.
+    """
+    try:
+        return wait_minutes(submit_minutes(fmt, payload), timeout)
+    except BrokenProcessPool:
+        return wait_minutes(submit_minutes(fmt, payload), timeout)
+
+
+class _ZipStream:
+    """
+    zipfile 이 쓰는 바이트를 잠시 모아 두는 쓰기 전용 버퍼.
+    seek 이 없으므로 zipfile 은 data descriptor 방식으로 순차 기록한다.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_minutes_zip(payloads, fmt: str):
+    """
+    payloads(collect_minutes_payload 결과)를 렌더러 풀에서 문서로 만들고
+    요청한 순서대로 ZIP 에 기록하며 조각(bytes)을 yield 한다.
+    동시에 떠 있는 작업은 워커 수의 2배로 제한해 메모리 사용량을 일정하게 유지한다.
+    """
+    buf = _ZipStream()
+    failed = []
+    max_pending = max(1, settings.MINUTES_RENDER_WORKERS) * 2
+
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        pending = deque()
+
+        def write_oldest():
+            payload, future = pending.popleft()
+            meeting_id = payload["meeting_id"]
+            try:
+                try:
+                    data = wait_minutes(future)
+                except BrokenProcessPool:
+                    # 다른 작업의 시간 초과로 풀이 종료되었거나 대기 중 취소된 경우 새 풀에서 한 번 더 시도
+                    data = wait_minutes(submit_minutes(fmt, payload))
+            except Exception as e:
+                failed.append(f"meeting_{meeting_id}: {e}")
+                return
+            zf.writestr(minutes_filename(meeting_id, fmt), data)
+
+        for payload in payloads:
+            pending.append((payload, submit_minutes(fmt, payload)))
+            if len(pending) >= max_pending:
+                write_oldest()
+                yield buf.pop()
+
+        while pending:
+            write_oldest()
+            yield buf.pop()
+
+        if failed:
+            zf.writestr("errors.txt", "\n".join(failed))
+
+    # close() 시점에 기록되는 central directory
+    yield buf.pop()
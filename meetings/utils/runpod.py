@@ -1,18 +1,26 @@
 import requests
 from django.conf import settings
 
+from core.metrics import track_external
 
-url = f"https://{settings.POD_ID}-8000.proxy.runpod.net/"
+
+def _base_url():
+    # 호출 시점에 읽어야 설정 변경(fake 서버, override_settings)이 반영된다.
+    url = settings.RUNPOD_BASE_URL
+    return url if url.endswith("/") else url + "/"
 
 def runpod_health():
-    res = requests.get(url + "health") 
+    with track_external("runpod"):
+        res = requests.get(_base_url() + "health")
     return res.status_code
 
-def get_stt(presigned_url):
-    res = requests.post(
-        url + "stt",
-        json={'audio_url': presigned_url}
-    )
+def get_stt(presigned_url, timeout=None):
+    with track_external("runpod"):
+        res = requests.post(
+            _base_url() + "stt",
+            json={'audio_url': presigned_url},
+            timeout=timeout,
+        )
     return res
 
 def get_sllm(transcript, domain=""):
@@ -26,11 +34,12 @@ def get_sllm(transcript, domain=""):
     else:
         domain_payload = []
 
-    res = requests.post(
-        url + "inference",
-        json={
-            'transcript': transcript,
-            'domain': domain_payload
-        }
-    )
+    with track_external("runpod"):
+        res = requests.post(
+            _base_url() + "inference",
+            json={
+                'transcript': transcript,
+                'domain': domain_payload
+            }
+        )
     return res
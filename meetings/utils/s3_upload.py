@@ -1,11 +1,13 @@
 import uuid
 import io
+import tempfile
 import boto3
 from datetime import timedelta
 from botocore.config import Config
 from django.conf import settings
 from django.utils import timezone
 
+from core.metrics import track_external
 from meetings.models import S3File
 
 CONTENT_TYPE_MAP = {
@@ -15,25 +17,91 @@ CONTENT_TYPE_MAP = {
 BUCKET_NAME=settings.AWS_STORAGE_BUCKET_NAME
 REGION_NAME = settings.AWS_S3_REGION_NAME
 
-def upload_raw_file_bytes(file_bytes: bytes, original_filename: str, delete_after_seconds: int) -> str:
-    s3 = boto3.client("s3", 
+def _s3_client():
+    return boto3.client("s3", 
         region_name=REGION_NAME,
         endpoint_url=f"https://s3.{REGION_NAME}.amazonaws.com",
         config=Config(signature_version='s3v4')
     )
+
+def upload_raw_file_bytes(file_bytes: bytes, original_filename: str, delete_after_seconds: int) -> str:
+    return upload_raw_fileobj(io.BytesIO(file_bytes), original_filename, delete_after_seconds)
+
+def _put(s3, file_obj, s3_key: str, content_type: str):
+    with track_external("s3"):
+        s3.upload_fileobj(
+            Fileobj=file_obj,
+            Bucket=BUCKET_NAME,
+            Key=s3_key,
+            ExtraArgs={"ContentType": content_type},
+        )
+
+def upload_raw_fileobj(file_obj, original_filename: str, delete_after_seconds: int) -> str:
+    """
+    파일 객체를 그대로 S3 에 올린다. (upload_fileobj 가 조각 단위로 읽어 멀티파트로 전송)
+    분할 업로드의 스풀 파일처럼 큰 파일도 메모리에 한 번에 올리지 않는다.
+    WAV 는
+    - RECORD_NORMALIZE_AUDIO: STT 입력 형식(16 kHz mono)으로 바꿔 올림
+    - RECORD_KEEP_ORIGINAL: 받은 원본도 <s3_key>.orig.wav 로 함께 보관
+    - RECORD_DETECT_SPEECH: 발화 구간을 찾아 S3File.speech_regions 에 기록
+    - RECORD_STRIP_SILENCE: 발화 구간만 이어 붙인 <s3_key>.speech.wav 를 함께 올림 (STT 입력용)
+    file_obj 는 seek 가능해야 한다.
+    """
+    from meetings.utils.audio import UnsupportedAudio, normalize_wav
+    from meetings.utils.vad import detect_speech, strip_silence, worth_stripping
+
+    s3 = _s3_client()
     ext = original_filename.split(".")[-1].lower()
     s3_key = f"tests/{uuid.uuid4()}.{ext}"
 
     content_type = CONTENT_TYPE_MAP.get(ext, "application/octet-stream")
-    file_obj = io.BytesIO(file_bytes)
-
-    # 업로드
-    s3.upload_fileobj(
-        Fileobj=file_obj,
-        Bucket=BUCKET_NAME,
-        Key=s3_key,
-        ExtraArgs={"ContentType": content_type},
-    )
+
+    start = file_obj.tell()
+    original_size = file_obj.seek(0, io.SEEK_END) - start
+    file_obj.seek(start)
+
+    normalized = None
+    if ext == "wav" and settings.RECORD_NORMALIZE_AUDIO:
+        try:
+            normalized = normalize_wav(file_obj)
+        except UnsupportedAudio as e:
+            # 읽을 수 없는 WAV 는 받은 그대로 저장하고 STT 서버에 맡긴다.
+            print(f"[UPLOAD] 오디오 변환 생략: {original_filename} ({e})")
+    pcm = file_obj if normalized is None else normalized
+
+    speech = None
+    if ext == "wav" and settings.RECORD_DETECT_SPEECH:
+        try:
+            speech = detect_speech(pcm)
+        except UnsupportedAudio:
+            # 16 kHz mono 가 아닌 파일(변환 생략)은 구간 검출도 건너뛴다.
+            speech = None
+
+    original_s3_key = None
+    stripped_s3_key = None
+    try:
+        if normalized is None:
+            file_size = original_size
+        else:
+            file_size = normalized.seek(0, io.SEEK_END)
+            normalized.seek(0)
+
+        # 업로드
+        _put(s3, pcm, s3_key, content_type)
+
+        if normalized is not None and settings.RECORD_KEEP_ORIGINAL:
+            original_s3_key = f"{s3_key}.orig.{ext}"
+            file_obj.seek(start)
+            _put(s3, file_obj, original_s3_key, content_type)
+
+        if settings.RECORD_STRIP_SILENCE and worth_stripping(speech):
+            pcm.seek(0 if normalized is not None else start)
+            with strip_silence(pcm, speech["regions"]) as stripped:
+                stripped_s3_key = f"{s3_key}.speech.{ext}"
+                _put(s3, stripped, stripped_s3_key, content_type)
+    finally:
+        if normalized is not None:
+            normalized.close()
 
     # 2) delete_at 계산
     delete_at = timezone.now() + timedelta(seconds=delete_after_seconds)
@@ -43,19 +111,37 @@ def upload_raw_file_bytes(file_bytes: bytes, original_filename: str, delete_afte
         s3_key=s3_key,
         original_name=original_filename,
         delete_at=delete_at,
+        file_size=file_size,
+        original_size=original_size,
+        original_s3_key=original_s3_key,
+        duration=speech["duration"] if speech else None,
+        speech_regions=speech["regions"] if speech else None,
+        stripped_s3_key=stripped_s3_key,
     )
     # 다운로드 s3_key 반환
     return s3_key
 
 def get_presigned_url(s3_key: str, expires_seconds: int = 60 * 60 * 48) -> str:
-    s3 = boto3.client("s3", 
-        region_name=REGION_NAME,
-        endpoint_url=f"https://s3.{REGION_NAME}.amazonaws.com",
-        config=Config(signature_version='s3v4')
-    )
+    s3 = _s3_client()
     presigned_url = s3.generate_presigned_url(
         ClientMethod="get_object",
         Params={"Bucket": BUCKET_NAME, "Key": s3_key},
         ExpiresIn=expires_seconds,
     )
-    return presigned_url
\ No newline at end of file
+    return presigned_url
+
+def put_fileobj(file_obj, s3_key: str, content_type: str = "audio/wav"):
+    """S3File 레코드 없이 객체만 올린다. (STT 조각 등 파생 파일용)"""
+    _put(_s3_client(), file_obj, s3_key, content_type)
+
+def download_to_tempfile(s3_key: str):
+    """S3 객체를 임시 파일로 받아 처음 위치로 되감아 반환한다. (close() 하면 삭제)"""
+    out = tempfile.TemporaryFile()
+    try:
+        with track_external("s3"):
+            _s3_client().download_fileobj(Bucket=BUCKET_NAME, Key=s3_key, Fileobj=out)
+    except Exception:
+        out.close()
+        raise
+    out.seek(0)
+    return out
@@ -0,0 +1,332 @@
+import ast
+import bisect
+import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from core.metrics import track_external
+from meetings.models import Meeting, TranscriptChunk
+
+
+class SttError(Exception):
+    """STT 서버가 실패 응답을 주었거나 전사하지 못한 조각이 남은 경우"""
+
+
+# 조각 STT 요청을 보내는 스레드 풀 (프로세스 공용이라 동시에 여러 회의가 전사돼도 STT_MAX_CONCURRENCY 를 넘지 않음)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=settings.STT_MAX_CONCURRENCY,
+                thread_name_prefix="stt-chunk",
+            )
+        return _pool
+
+
+def plan_chunks(duration: float, regions, chunk_seconds: float) -> list:
+    """
+    [0, duration] 을 chunk_seconds 안팎의 구간 [(start, end), ...] 으로 나눈다.
+    자르는 위치는 발화 구간 사이 무음의 가운데 중 (목표 길이의 절반 ~ 목표 길이) 범위에서 가장 늦은 곳이고,
+    그 범위에 무음이 없으면 목표 길이에서 그대로 자른다.
+    """
+    regions = regions or []
+    cuts = [(prev_end + next_start) / 2 for (_, prev_end), (next_start, _) in zip(regions, regions[1:])]
+
+    bounds = []
+    start = 0.0
+    while duration - start > chunk_seconds:
+        lo = bisect.bisect_left(cuts, start + chunk_seconds / 2)
+        hi = bisect.bisect_right(cuts, start + chunk_seconds)
+        cut = round(cuts[hi - 1] if hi > lo else start + chunk_seconds, 3)
+        bounds.append((start, cut))
+        start = cut
+    bounds.append((start, duration))
+    return bounds
+
+
+def _clip_regions(regions, start: float, end: float) -> list:
+    clipped = []
+    for region_start, region_end in regions:
+        s, e = max(region_start, start), min(region_end, end)
+        if e > s:
+            clipped.append([s, e])
+    return clipped
+
+
+def _chunk_spans(regions, start: float, end: float) -> list:
+    """
+    조각에 담을 구간. 발화 구간은 자르는 위치를 고르는 데만 쓰고 조각에는 [start, end] 전체를 담는다.
+    RECORD_STRIP_SILENCE 일 때만 발화 구간만 담는다. (발화 구간 정보가 없으면 조각 전체)
+    """
+    if regions is None or not settings.RECORD_STRIP_SILENCE:
+        return [[start, end]]
+    return _clip_regions(regions, start, end)
+
+
+def as_segments(full_text) -> list:
+    """
+    STT 응답의 full_text 를 [{speaker: text}, ...] 로 맞춘다.
+    리스트, JSON/파이썬 리터럴 문자열, '화자: 내용' 평문을 모두 받는다.
+    """
+    parsed = full_text
+    if isinstance(full_text, str):
+        try:
+            parsed = json.loads(full_text)
+        except ValueError:
+            try:
+                parsed = ast.literal_eval(full_text)
+            except (ValueError, SyntaxError):
+                parsed = None
+    if isinstance(parsed, list):
+        return [segment for segment in parsed if isinstance(segment, dict)]
+
+    segments = []
+    for line in str(full_text or "").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        speaker, sep, text = line.partition(":")
+        if sep and speaker.strip() and text.strip():
+            segments.append({speaker.strip(): text.strip()})
+        else:
+            segments.append({"발화자": line})
+    return segments
+
+
+def _new_chunks(meeting, s3_obj, duration: float, regions) -> list:
+    rows = []
+    for index, (start, end) in enumerate(plan_chunks(duration, regions, settings.STT_CHUNK_SECONDS)):
+        row = TranscriptChunk(
+            meeting=meeting,
+            index=index,
+            source_key=s3_obj.s3_key,
+            start_sec=start,
+            end_sec=end,
+        )
+        if not _chunk_spans(regions, start, end):
+            # 무음을 빼고 보낼 때 발화가 없는 구간은 보낼 필요가 없다.
+            row.status = TranscriptChunk.STATUS_DONE
+            row.segments = []
+        rows.append(row)
+    return TranscriptChunk.objects.bulk_create(rows)
+
+
+def _usable_regions(regions):
+    # 발화를 하나도 못 찾았으면 검출이 틀렸을 수 있으므로 전체를 보낸다.
+    return regions if regions else None
+
+
+def _cut_chunks(meeting, s3_obj, chunks) -> list:
+    """
+    녹음을 내려받아 음성이 아직 없는 조각을 잘라 <s3_key>.chunkNNN.wav 로 올린다.
+    chunks 가 비어 있으면(길이 정보 없는 녹음) 내려받은 파일로 조각 계획부터 세운다.
+    """
+    from meetings.utils.audio import UnsupportedAudio, normalize_wav
+    from meetings.utils.s3_upload import download_to_tempfile, put_fileobj
+    from meetings.utils.vad import detect_speech, strip_silence
+
+    raw = download_to_tempfile(s3_obj.s3_key)
+    normalized = None
+    try:
+        try:
+            normalized = normalize_wav(raw)
+            pcm = raw if normalized is None else normalized
+            speech = detect_speech(pcm)
+        except UnsupportedAudio:
+            # 자를 수 없는 형식은 원본 하나를 통째로 보낸다.
+            TranscriptChunk.objects.filter(meeting=meeting).delete()
+            return TranscriptChunk.objects.bulk_create([
+                TranscriptChunk(
+                    meeting=meeting, index=0, source_key=s3_obj.s3_key,
+                    s3_key=s3_obj.s3_key, start_sec=0, end_sec=s3_obj.duration or 0,
+                )
+            ])
+
+        regions = s3_obj.speech_regions
+        if regions is None and settings.RECORD_DETECT_SPEECH:
+            regions = speech["regions"]
+        regions = _usable_regions(regions)
+        if not chunks:
+            chunks = _new_chunks(meeting, s3_obj, speech["duration"], regions)
+
+        for chunk in chunks:
+            if chunk.s3_key or chunk.status == TranscriptChunk.STATUS_DONE:
+                continue
+            key = f"{s3_obj.s3_key}.chunk{chunk.index:03d}.wav"
+            with strip_silence(pcm, _chunk_spans(regions, chunk.start_sec, chunk.end_sec)) as piece:
+                put_fileobj(piece, key)
+            chunk.s3_key = key
+            chunk.save(update_fields=["s3_key", "updated_at"])
+        return chunks
+    finally:
+        raw.close()
+        if normalized is not None:
+            normalized.close()
+
+
+def ensure_chunks(meeting, s3_obj) -> list:
+    """
+    회의 녹음의 STT 조각 목록. 같은 녹음으로 만든 조각이 있으면 이어서 쓴다.
+    - 길이/발화 구간을 알면(업로드 시 기록) 조각 행부터 만들고 음성은 그다음에 자른다.
+    - STT_CHUNK_SECONDS 이하의 녹음은 자르지 않고 저장된 파일(무음 제거본 우선)을 그대로 보낸다.
+    """
+    chunks = list(TranscriptChunk.objects.filter(meeting=meeting))
+    if chunks and any(c.source_key != s3_obj.s3_key for c in chunks):
+        # 녹음이 바뀌었으면 예전 조각은 버린다. (예전 조각 음성은 예전 S3File 만료 때 함께 삭제)
+        TranscriptChunk.objects.filter(meeting=meeting).delete()
+        chunks = []
+
+    if not chunks and s3_obj.duration is not None:
+        if s3_obj.duration <= settings.STT_CHUNK_SECONDS:
+            return TranscriptChunk.objects.bulk_create([
+                TranscriptChunk(
+                    meeting=meeting, index=0, source_key=s3_obj.s3_key,
+                    s3_key=s3_obj.stripped_s3_key or s3_obj.s3_key,
+                    start_sec=0, end_sec=s3_obj.duration,
+                )
+            ])
+        chunks = _new_chunks(meeting, s3_obj, s3_obj.duration, _usable_regions(s3_obj.speech_regions))
+
+    if not chunks or any(not c.s3_key and c.status != TranscriptChunk.STATUS_DONE for c in chunks):
+        chunks = _cut_chunks(meeting, s3_obj, chunks)
+    return chunks
+
+
+def _transcribe(presigned_url) -> list:
+    """풀 스레드에서 실행. 조각 하나를 STT 로 보내고 발화 목록을 반환한다."""
+    from meetings.utils.runpod import get_stt
+
+    res = get_stt(presigned_url, timeout=settings.STT_REQUEST_TIMEOUT)
+    try:
+        body = res.json()
+    except ValueError:
+        body = {}
+    if res.status_code != 200 or not isinstance(body, dict) or not body.get("success"):
+        message = (body.get("message") or body.get("error")) if isinstance(body, dict) else None
+        raise SttError(message or f"STT 응답 오류 (HTTP {res.status_code}): {res.text[:300]}")
+    return as_segments(body["data"]["full_text"])
+
+
+def run_chunks(chunks) -> list:
+    """
+    완료되지 않은 조각만 스레드 풀로 동시에 보내고, 실패한 조각은 STT_CHUNK_MAX_ATTEMPTS 번까지 다시 보낸다.
+    조각 상태는 끝나는 대로 호출 스레드에서 DB 에 반영한다. (진행률 조회용)
+    """
+    from meetings.utils.s3_upload import get_presigned_url
+
+    pool = _get_pool()
+    running = {}
+    tries = {}
+
+    def submit(chunk):
+        tries[chunk.pk] = tries.get(chunk.pk, 0) + 1
+        chunk.attempts += 1
+        try:
+            # boto3 클라이언트 생성은 스레드 안전하지 않으므로 URL 은 호출 스레드에서 만든다.
+            presigned_url = get_presigned_url(chunk.s3_key)
+        except Exception as e:
+            chunk.status = TranscriptChunk.STATUS_ERROR
+            chunk.error = f"음성 URL 생성 중 오류: {e}"
+            chunk.save(update_fields=["status", "attempts", "error", "updated_at"])
+            return
+        chunk.status = TranscriptChunk.STATUS_PROCESSING
+        chunk.save(update_fields=["status", "attempts", "updated_at"])
+        running[pool.submit(_transcribe, presigned_url)] = chunk
+
+    for chunk in chunks:
+        if chunk.status != TranscriptChunk.STATUS_DONE:
+            submit(chunk)
+
+    while running:
+        # 요청은 풀 스레드의 STT 응답을 기다리는 동안 멈춰 있으므로 그 시간을 runpod 대기로 잰다.
+        with track_external("runpod"):
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            chunk = running.pop(future)
+            try:
+                chunk.segments = future.result()
+                chunk.status = TranscriptChunk.STATUS_DONE
+                chunk.error = ""
+            except Exception as e:
+                chunk.status = TranscriptChunk.STATUS_ERROR
+                chunk.error = str(e)[:2000]
+            chunk.save(update_fields=["segments", "status", "error", "updated_at"])
+            if chunk.status == TranscriptChunk.STATUS_ERROR and tries[chunk.pk] < settings.STT_CHUNK_MAX_ATTEMPTS:
+                submit(chunk)
+    return chunks
+
+
+def _clock(sec: float) -> str:
+    total = int(sec or 0)
+    hours, rest = divmod(total, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def chunk_speaker(speaker: str, chunk) -> str:
+    """조각 안의 화자 라벨에 조각의 원본 기준 시작 시각을 붙인다. (예: SPEAKER_00 (10:00~))"""
+    return f"{speaker} ({_clock(chunk.start_sec)}~)"
+
+
+def stitch_segments(chunks) -> list:
+    """
+    조각 순서대로 발화 목록을 이어 붙인다.
+    화자 라벨은 조각마다 STT 가 따로 붙이므로(조각 0 과 조각 3 의 SPEAKER_00 은 다른 사람일 수 있음)
+    조각이 여럿이면 chunk_speaker 로 조각별 라벨을 만들어 전문 화면에서 따로 이름을 지정하게 한다.
+    """
+    chunks = sorted(chunks, key=lambda c: c.index)
+    if len(chunks) == 1:
+        return list(chunks[0].segments or [])
+
+    segments = []
+    for chunk in chunks:
+        for segment in chunk.segments or []:
+            segments.append({chunk_speaker(speaker, chunk): text for speaker, text in segment.items()})
+    return segments
+
+
+def claim_transcription(meeting_id) -> bool:
+    """
+    전사를 시작한다고 표시한다. 다른 요청이 진행 중이면 False.
+    진행 중 표시가 있어도 가져간 지 STT_STALE_SECONDS 가 지났고 그동안 조각 변화가 없으면(서버 재시작 등) 다시 가져온다.
+    가져간 시각(transcript_claimed_at)을 조건으로 한 번의 update 로 처리하므로 동시에 불러도 한 요청만 True.
+    """
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=settings.STT_STALE_SECONDS)
+    recent_chunks = TranscriptChunk.objects.filter(meeting_id=OuterRef("pk"), updated_at__gte=cutoff)
+    stale = (
+        (Q(transcript_claimed_at__isnull=True) | Q(transcript_claimed_at__lt=cutoff))
+        & ~Exists(recent_chunks)
+    )
+    claimed = (
+        Meeting.objects.filter(pk=meeting_id)
+        .filter(~Q(transcript_status="processing") | stale)
+        .update(transcript_status="processing", transcript_error="", transcript_claimed_at=now)
+    )
+    return bool(claimed)
+
+
+def transcribe_meeting(meeting, s3_obj) -> str:
+    """
+    녹음을 조각 단위로 전사하고 이어 붙인 transcript(JSON 문자열)를 반환한다.
+    전사하지 못한 조각이 남으면 SttError. 완료된 조각은 다음 호출에서 다시 보내지 않는다.
+    """
+    chunks = run_chunks(ensure_chunks(meeting, s3_obj))
+    failed = [c for c in chunks if c.status != TranscriptChunk.STATUS_DONE]
+    if failed:
+        raise SttError(
+            f"전체 {len(chunks)}개 구간 중 {len(failed)}개 구간 전사에 실패했습니다. ({failed[0].error})"
+        )
+    return json.dumps(stitch_segments(chunks), ensure_ascii=False)
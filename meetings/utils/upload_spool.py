@@ -0,0 +1,58 @@
+import hashlib
+import os
+
+from django.conf import settings
+
+# 요청 본문을 읽어 스풀에 쓰는 단위 (조각 하나를 메모리에 통째로 올리지 않기 위함)
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class ChunkSizeMismatch(Exception):
+    """요청 본문 길이가 조각의 기대 크기와 다른 경우"""
+
+
+def spool_path(upload_id) -> str:
+    return os.path.join(settings.RECORD_UPLOAD_SPOOL_DIR, f"{upload_id}.part")
+
+
+def create_spool(upload_id):
+    os.makedirs(settings.RECORD_UPLOAD_SPOOL_DIR, exist_ok=True)
+    with open(spool_path(upload_id), "wb"):
+        pass
+
+
+def spool_exists(upload_id) -> bool:
+    return os.path.exists(spool_path(upload_id))
+
+
+def open_spool(upload_id):
+    return open(spool_path(upload_id), "rb")
+
+
+def write_chunk(upload_id, offset: int, stream, expected_size: int) -> str:
+    """
+    stream(요청 본문)을 READ_BLOCK_SIZE 단위로 읽어 스풀의 offset 위치에 쓰고 sha256 을 반환한다.
+    조각마다 위치가 정해져 있으므로 같은 조각을 다시 보내도(재시도) 결과가 같다.
+    스풀이 없으면(정리됨) FileNotFoundError.
+    """
+    digest = hashlib.sha256()
+    written = 0
+    with open(spool_path(upload_id), "r+b") as f:
+        f.seek(offset)
+        while written < expected_size:
+            block = stream.read(min(READ_BLOCK_SIZE, expected_size - written))
+            if not block:
+                break
+            f.write(block)
+            digest.update(block)
+            written += len(block)
+    if written != expected_size or stream.read(1):
+        raise ChunkSizeMismatch(f"조각 크기가 올바르지 않습니다. (기대값 {expected_size} bytes)")
+    return digest.hexdigest()
+
+
+def remove_spool(upload_id):
+    try:
+        os.remove(spool_path(upload_id))
+    except FileNotFoundError:
+        pass
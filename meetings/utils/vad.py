@@ -0,0 +1,180 @@
+import tempfile
+
+import numpy as np
+
+from meetings.utils.audio import (
+    BLOCK_FRAMES,
+    TARGET_SAMPLE_RATE,
+    UnsupportedAudio,
+    needs_transcode,
+    read_wav_header,
+    wav_header,
+)
+
+# 에너지 계산 프레임 길이(초)
+FRAME_SEC = 0.03
+# 잡음 바닥(프레임 에너지 하위 10%)보다 이만큼(dB) 크면 음성으로 본다.
+NOISE_PERCENTILE = 10
+MARGIN_DB = 10.0
+# 잡음 바닥이 아주 낮아도(디지털 무음) 이 값(dBFS) 이하는 음성으로 보지 않는다.
+MIN_THRESHOLD_DBFS = -55.0
+# 이보다 짧은 무음은 발화 사이 쉼으로 보고 이어 붙인다. / 이보다 짧은 소리는 잡음으로 버린다.
+MIN_SILENCE_SEC = 1.0
+MIN_SPEECH_SEC = 0.25
+# 말 앞뒤가 잘리지 않도록 구간 양쪽에 붙이는 여유(초). MIN_SILENCE_SEC 의 절반보다 작아야 겹치지 않는다.
+PAD_SEC = 0.3
+# 발화 비율이 이보다 높으면 무음 제거 파일을 따로 만들 이득이 적다.
+STRIP_MAX_SPEECH_RATIO = 0.9
+
+
+def _open_pcm16(f) -> dict:
+    header = read_wav_header(f)
+    if needs_transcode(header, TARGET_SAMPLE_RATE):
+        raise UnsupportedAudio("음성 구간 검출은 16 kHz mono 16-bit WAV 만 지원합니다.")
+    return header
+
+
+def _frame_energies(f, header: dict, frame_len: int):
+    """프레임별 평균 제곱 에너지(dBFS) 배열과 전체 샘플 수. 블록 단위로 읽어 메모리를 제한한다."""
+    energies = []
+    carry = np.zeros(0, dtype=np.float32)
+    total = 0
+    remaining = header["data_size"]
+    while remaining is None or remaining > 0:
+        want = BLOCK_FRAMES * 2 if remaining is None else min(BLOCK_FRAMES * 2, remaining)
+        raw = f.read(want)
+        if not raw:
+            break
+        if remaining is not None:
+            remaining -= len(raw)
+        raw = raw[:len(raw) - len(raw) % 2]
+        x = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+        total += len(x)
+        x = np.concatenate([carry, x])
+        n = len(x) // frame_len
+        carry = x[n * frame_len:]
+        if n:
+            frames = x[:n * frame_len].reshape(n, frame_len)
+            energies.append(10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10))
+    if len(carry):
+        energies.append(10.0 * np.log10(np.array([np.mean(carry * carry)]) + 1e-10))
+    if not energies:
+        return np.zeros(0), total
+    return np.concatenate(energies), total
+
+
+def _speech_mask_to_regions(mask: np.ndarray, frame_sec: float, duration: float) -> list:
+    if not mask.any():
+        return []
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    # 짧은 쉼은 이어 붙이기
+    gaps = starts[1:] - ends[:-1]
+    keep = gaps * frame_sec >= MIN_SILENCE_SEC
+    starts = np.concatenate([starts[:1], starts[1:][keep]])
+    ends = np.concatenate([ends[:-1][keep], ends[-1:]])
+
+    # 짧은 소리(클릭, 기침 등) 버리기
+    long_enough = (ends - starts) * frame_sec >= MIN_SPEECH_SEC
+    starts, ends = starts[long_enough], ends[long_enough]
+
+    start_sec = np.maximum(starts * frame_sec - PAD_SEC, 0.0)
+    end_sec = np.minimum(ends * frame_sec + PAD_SEC, duration)
+    return [[round(float(s), 3), round(float(e), 3)] for s, e in zip(start_sec, end_sec)]
+
+
+def detect_speech(f) -> dict:
+    """
+    16 kHz mono 16-bit WAV 파일 객체에서 에너지 기반으로 발화 구간을 찾는다.
+    반환: {"duration": 전체 길이(초), "regions": [[start, end], ...]} (원본 기준 초)
+    f 의 위치는 호출 전으로 되돌린다.
+    """
+    start = f.tell()
+    try:
+        header = _open_pcm16(f)
+        rate = header["sample_rate"]
+        frame_len = int(rate * FRAME_SEC)
+        energies, total = _frame_energies(f, header, frame_len)
+    finally:
+        f.seek(start)
+
+    duration = total / rate
+    if not len(energies):
+        return {"duration": round(duration, 3), "regions": []}
+
+    noise_floor = float(np.percentile(energies, NOISE_PERCENTILE))
+    threshold = max(noise_floor + MARGIN_DB, MIN_THRESHOLD_DBFS)
+    regions = _speech_mask_to_regions(energies > threshold, frame_len / rate, duration)
+    return {"duration": round(duration, 3), "regions": regions}
+
+
+def speech_ratio(speech: dict) -> float:
+    if not speech or not speech["duration"]:
+        return 1.0
+    spoken = sum(end - start for start, end in speech["regions"])
+    return spoken / speech["duration"]
+
+
+def worth_stripping(speech: dict) -> bool:
+    return bool(speech and speech["regions"]) and speech_ratio(speech) <= STRIP_MAX_SPEECH_RATIO
+
+
+def offset_map(regions) -> list:
+    """
+    무음을 뺀 파일 기준 시각을 원본 시각으로 되돌리기 위한 표.
+    [[stripped_start, original_start, length], ...] (구간을 순서대로 이어 붙인 기준)
+    """
+    table = []
+    stripped = 0.0
+    for start, end in regions:
+        table.append([round(stripped, 3), start, round(end - start, 3)])
+        stripped += end - start
+    return table
+
+
+def to_original_time(t: float, regions) -> float:
+    """무음을 뺀 파일의 t 초가 원본 녹음의 몇 초인지 반환한다."""
+    original = t
+    for stripped_start, original_start, length in offset_map(regions):
+        if t < stripped_start + length:
+            return original_start + max(0.0, t - stripped_start)
+        original = original_start + length
+    return original
+
+
+def strip_silence(f, regions):
+    """
+    regions 만 이어 붙인 16 kHz mono WAV 임시 파일을 반환한다. (처음 위치로 되감김, close() 하면 삭제)
+    f 는 seek 가능해야 하며 위치는 호출 전으로 되돌린다.
+    """
+    start = f.tell()
+    out = tempfile.TemporaryFile()
+    try:
+        header = _open_pcm16(f)
+        rate = header["sample_rate"]
+        data_start = f.tell()
+        frames = 0
+        out.write(wav_header(0, rate))
+        for region_start, region_end in regions:
+            first = int(region_start * rate)
+            count = int(region_end * rate) - first
+            f.seek(data_start + first * 2)
+            while count > 0:
+                raw = f.read(min(BLOCK_FRAMES, count) * 2)
+                if not raw:
+                    break
+                raw = raw[:len(raw) - len(raw) % 2]
+                out.write(raw)
+                frames += len(raw) // 2
+                count -= len(raw) // 2
+        out.seek(0)
+        out.write(wav_header(frames, rate))
+        out.seek(0)
+    except Exception:
+        out.close()
+        raise
+    finally:
+        f.seek(start)
+    return out
@@ -8,56 +8,26 @@ from django.shortcuts import get_object_or_404
 from django.http import JsonResponse, HttpResponse, Http404, StreamingHttpResponse
 from django.urls import reverse
 
-from .models import Meeting, Attendee, Task, S3File
+from .models import Meeting, Attendee, Task, S3File, UploadSession, UploadChunk, TranscriptChunk
 from django.contrib import messages
 from django.db import transaction
+from django.conf import settings
 
 
-from meetings.utils.s3_upload import upload_raw_file_bytes, get_presigned_url
-from meetings.utils.runpod import get_stt, get_sllm
+# S3(boto3) / 추론 서버(requests) / 문서 생성(docx, reportlab) 모듈은 import 비용이 커서
+# 컨텍스트 프로세서(today_meetings) 때문에 이 모듈이 로드될 때 함께 올라오지 않도록
+# 실제로 쓰는 뷰 안에서 import 한다.
 
-from django.views.decorators.http import require_GET, require_POST
+from django.views.decorators.http import require_GET, require_POST, require_http_methods
 from datetime import date, datetime, timedelta
 from django.utils import timezone
 
-from io import BytesIO
-from docx import Document
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from django.utils.html import strip_tags, escape
+from django.utils.html import escape
 import json
-import math
 import re
 import ast
-from typing import Dict
-import requests
 from urllib.parse import quote
 
-from django.conf import settings
-from pathlib import Path
-import boto3
-from botocore.config import Config
-
-# 한글 폰트 등록 (맑은 고딕 사용)
-KOREAN_FONT_NAME = settings.KOREAN_FONT_NAME
-
-def _register_korean_font():
-    # 이미 등록되어 있으면 바로 종료
-    if KOREAN_FONT_NAME in pdfmetrics.getRegisteredFontNames():
-        return
-
-    font_path: Path = settings.KOREAN_FONT_PATH
-
-    if not font_path.exists():
-        raise FileNotFoundError(f"Korean font file not found: {font_path}")
-
-    pdfmetrics.registerFont(TTFont(KOREAN_FONT_NAME, str(font_path)))
-
-# 모듈 import 시 한 번 호출
-_register_korean_font()
-
 def _resolve_s3_file(meeting: Meeting):
     """
     meeting.record_url_id에는 presigned URL 또는 s3_key가 들어올 수 있다.
@@ -848,7 +818,7 @@ class MeetingRecordView(LoginRequiredSessionMixin, TemplateView):
 
         context["attendees"] = (
             meeting.attendees
-                   .select_related("user")  # Attendee.user
+                   .select_related("user", "user__dept")  # 템플릿에서 user.dept.dept_name 표시
                    .all()
         )
 
@@ -1217,6 +1187,9 @@ class MeetingDetailView(LoginRequiredSessionMixin, TemplateView):
 
 @require_GET
 def meeting_audio_download(request, meeting_id):
+    import requests
+    from meetings.utils.s3_upload import get_presigned_url
+
     meeting = (
         Meeting.objects.select_related("record_url", "host")
         .prefetch_related("attendees__user__dept")
@@ -1306,7 +1279,13 @@ def meeting_audio_download(request, meeting_id):
     )
     return response
 
+# 녹음 업로드 후 S3 객체 보관 기간 (48시간 뒤 삭제)
+RECORD_DELETE_AFTER_SECONDS = 172800
+
+
 def meeting_record_upload(request, meeting_id):
+    from meetings.utils.s3_upload import upload_raw_fileobj
+
     # 1) 메소드 체크
     if request.method != "POST":
         return JsonResponse({"error": "Invalid method"}, status=405)
@@ -1328,13 +1307,12 @@ def meeting_record_upload(request, meeting_id):
             status=400,
         )
 
-    # 5) 유틸 호출
-    file_bytes = uploaded_file.read()
+    # 5) 유틸 호출 (큰 파일은 임시 파일로 받아지므로 bytes 로 읽지 않고 그대로 넘긴다)
     try:
-        record_url = upload_raw_file_bytes(
-            file_bytes=file_bytes,
+        record_url = upload_raw_fileobj(
+            uploaded_file,
             original_filename=filename,
-            delete_after_seconds=172800, # 48시간 뒤 삭제
+            delete_after_seconds=RECORD_DELETE_AFTER_SECONDS,
             # delete_after_seconds=3600, # 테스트용 1시간 뒤 삭제
         )
     except Exception as e:
@@ -1354,6 +1332,218 @@ def meeting_record_upload(request, meeting_id):
     })
 
 
+def _can_upload_record(meeting: Meeting, user_id) -> bool:
+    """녹음 파일은 주최자 또는 참석자만 올릴 수 있다."""
+    if str(meeting.host_id) == str(user_id):
+        return True
+    return Attendee.objects.filter(meeting=meeting, user_id=user_id).exists()
+
+
+def _upload_session_payload(session: UploadSession) -> dict:
+    received = sorted(session.chunks.values_list("index", flat=True))
+    return {
+        "ok": True,
+        "upload_id": str(session.upload_id),
+        "status": session.status,
+        "chunk_size": session.chunk_size,
+        "total_size": session.total_size,
+        "total_chunks": session.total_chunks,
+        "received": received,
+        "record_url": session.s3_file_id or "",
+    }
+
+
+def _get_upload_session(request, meeting_id, upload_id):
+    """(session, None) 또는 (None, 오류 응답). 세션을 만든 사용자만 접근할 수 있다."""
+    login_user_id = request.session.get("login_user_id")
+    if not login_user_id:
+        return None, JsonResponse({"ok": False, "error": "로그인이 필요합니다."}, status=401)
+
+    session = (
+        UploadSession.objects.select_related("meeting")
+        .filter(pk=upload_id, meeting_id=meeting_id)
+        .first()
+    )
+    if not session or str(session.user_id) != str(login_user_id):
+        return None, JsonResponse({"ok": False, "error": "업로드 세션을 찾을 수 없습니다."}, status=404)
+    return session, None
+
+
+@require_POST
+def meeting_upload_session_create(request, meeting_id):
+    """
+    녹음 파일 분할 업로드 세션 생성.
+    body: {"filename": "...wav", "total_size": int}
+    응답의 chunk_size 단위로 잘라 PUT .../chunks/<index>/ 로 보낸 뒤 complete 를 호출한다.
+    """
+    from meetings.utils.upload_spool import create_spool
+
+    login_user_id = request.session.get("login_user_id")
+    if not login_user_id:
+        return JsonResponse({"ok": False, "error": "로그인이 필요합니다."}, status=401)
+
+    meeting = get_object_or_404(Meeting, pk=meeting_id)
+    if not _can_upload_record(meeting, login_user_id):
+        return JsonResponse(
+            {"ok": False, "error": "녹음 파일을 업로드할 권한이 없습니다."},
+            status=403,
+        )
+
+    try:
+        payload = json.loads(request.body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return JsonResponse({"ok": False, "error": "Invalid JSON"}, status=400)
+
+    filename = (payload.get("filename") or "").strip()
+    if filename.split(".")[-1].lower() != "wav":
+        return JsonResponse({"ok": False, "error": "WAV 파일만 업로드 가능합니다."}, status=400)
+
+    total_size = payload.get("total_size")
+    if (
+        not isinstance(total_size, int)
+        or total_size <= 0
+        or total_size > settings.RECORD_UPLOAD_MAX_SIZE
+    ):
+        return JsonResponse({"ok": False, "error": "파일 크기가 올바르지 않습니다."}, status=400)
+
+    session = UploadSession.objects.create(
+        meeting=meeting,
+        user_id=login_user_id,
+        original_name=filename[-255:],
+        total_size=total_size,
+        chunk_size=settings.RECORD_UPLOAD_CHUNK_SIZE,
+    )
+    create_spool(session.upload_id)
+    return JsonResponse(_upload_session_payload(session), status=201)
+
+
+@require_GET
+def meeting_upload_session_status(request, meeting_id, upload_id):
+    """이어 올리기용 조회: 이미 받은 조각 번호(received)와 완료 여부를 돌려준다."""
+    from meetings.utils.upload_spool import spool_exists
+
+    session, error = _get_upload_session(request, meeting_id, upload_id)
+    if error:
+        return error
+    if session.status == UploadSession.STATUS_UPLOADING and not spool_exists(session.upload_id):
+        return JsonResponse({"ok": False, "error": "업로드 세션이 만료되었습니다."}, status=410)
+    return JsonResponse(_upload_session_payload(session))
+
+
+@require_http_methods(["PUT"])
+def meeting_upload_chunk(request, meeting_id, upload_id, index):
+    """
+    index 번째 조각 수신. 본문은 조각 바이트 그대로(application/octet-stream).
+    같은 조각을 다시 보내도 안전하며, X-Chunk-Sha256 이 이미 받은 조각과 같으면 다시 쓰지 않는다.
+    """
+    from meetings.utils.upload_spool import ChunkSizeMismatch, write_chunk
+
+    session, error = _get_upload_session(request, meeting_id, upload_id)
+    if error:
+        return error
+    if session.status != UploadSession.STATUS_UPLOADING:
+        return JsonResponse({"ok": False, "error": "이미 완료된 업로드입니다."}, status=409)
+    if not 0 <= index < session.total_chunks:
+        return JsonResponse({"ok": False, "error": "조각 번호가 올바르지 않습니다."}, status=400)
+
+    expected_size = session.expected_chunk_size(index)
+    claimed = (request.headers.get("X-Chunk-Sha256") or "").lower()
+    if claimed and UploadChunk.objects.filter(session=session, index=index, sha256=claimed).exists():
+        return JsonResponse({"ok": True, "index": index, "size": expected_size, "sha256": claimed})
+
+    try:
+        digest = write_chunk(
+            session.upload_id,
+            index * session.chunk_size,
+            request,
+            expected_size,
+        )
+    except FileNotFoundError:
+        return JsonResponse({"ok": False, "error": "업로드 세션이 만료되었습니다."}, status=410)
+    except ChunkSizeMismatch as e:
+        # 스풀의 해당 구간이 덮어써졌으므로 수신 기록도 지워 다시 받게 한다.
+        UploadChunk.objects.filter(session=session, index=index).delete()
+        return JsonResponse({"ok": False, "error": str(e)}, status=400)
+
+    if claimed and claimed != digest:
+        UploadChunk.objects.filter(session=session, index=index).delete()
+        return JsonResponse({"ok": False, "error": "조각 체크섬이 일치하지 않습니다."}, status=400)
+
+    UploadChunk.objects.update_or_create(
+        session=session,
+        index=index,
+        defaults={"size": expected_size, "sha256": digest},
+    )
+    # 오래된 미완료 세션 정리 기준 시각 갱신
+    UploadSession.objects.filter(pk=session.pk).update(updated_at=timezone.now())
+
+    return JsonResponse({"ok": True, "index": index, "size": expected_size, "sha256": digest})
+
+
+@require_POST
+def meeting_upload_session_complete(request, meeting_id, upload_id):
+    """
+    모든 조각을 받았으면 스풀 파일을 S3 에 올리고 S3File / Meeting.record_url 을 연결한다.
+    이미 완료된 세션에 다시 호출하면 같은 결과를 돌려준다.
+    """
+    from meetings.utils.s3_upload import upload_raw_fileobj
+    from meetings.utils.upload_spool import open_spool, remove_spool
+
+    session, error = _get_upload_session(request, meeting_id, upload_id)
+    if error:
+        return error
+    if session.status == UploadSession.STATUS_DONE:
+        return JsonResponse({"ok": True, "record_url": session.s3_file_id or ""})
+
+    received = set(session.chunks.values_list("index", flat=True))
+    missing = [i for i in range(session.total_chunks) if i not in received]
+    if missing:
+        return JsonResponse(
+            {"ok": False, "error": "받지 못한 조각이 있습니다.", "missing": missing},
+            status=409,
+        )
+
+    # complete 가 동시에 두 번 와도 S3 업로드는 한 번만 한다.
+    # 마무리하던 작업자가 죽어 RECORD_UPLOAD_COMPLETE_TIMEOUT 넘게 COMPLETING 에 머문 세션은 다시 가져간다.
+    # claimed_at 은 이 요청의 소유 표시로, 뒤의 상태 변경은 소유권이 그대로일 때만 반영한다.
+    claimed_at = timezone.now()
+    stale_before = claimed_at - timedelta(seconds=settings.RECORD_UPLOAD_COMPLETE_TIMEOUT)
+    claimed = UploadSession.objects.filter(
+        Q(status=UploadSession.STATUS_UPLOADING)
+        | Q(status=UploadSession.STATUS_COMPLETING, updated_at__lt=stale_before),
+        pk=session.pk,
+    ).update(status=UploadSession.STATUS_COMPLETING, updated_at=claimed_at)
+    if not claimed:
+        return JsonResponse({"ok": False, "error": "업로드를 마무리하는 중입니다."}, status=409)
+    owned = UploadSession.objects.filter(
+        pk=session.pk, status=UploadSession.STATUS_COMPLETING, updated_at=claimed_at
+    )
+
+    try:
+        with open_spool(session.upload_id) as spool:
+            record_url = upload_raw_fileobj(
+                spool,
+                original_filename=session.original_name,
+                delete_after_seconds=RECORD_DELETE_AFTER_SECONDS,
+            )
+    except Exception as e:
+        # 조각은 그대로 남아 있으므로 complete 를 다시 호출할 수 있다.
+        owned.update(status=UploadSession.STATUS_UPLOADING, updated_at=timezone.now())
+        return JsonResponse({"ok": False, "error": f"S3 업로드 중 오류: {str(e)}"}, status=500)
+
+    with transaction.atomic():
+        if not owned.update(status=UploadSession.STATUS_DONE, s3_file_id=record_url):
+            # 너무 오래 걸려 다른 요청이 마무리를 가져갔다. 이번에 올린 파일은 S3File 만료로 정리된다.
+            return JsonResponse({"ok": False, "error": "업로드를 마무리하는 중입니다."}, status=409)
+        session.chunks.all().delete()
+        meeting = session.meeting
+        meeting.record_url_id = record_url
+        meeting.save(update_fields=["record_url"])
+    remove_spool(session.upload_id)
+
+    return JsonResponse({"ok": True, "record_url": record_url})
+
+
 @require_POST
 def meeting_record_url_set(request, meeting_id):
     """
@@ -1458,14 +1648,51 @@ class MeetingSllmRenderingView(LoginRequiredSessionMixin, TemplateView):
         context["meeting_id"] = meeting_id
         return context
 
+def _get_viewable_meeting(request, meeting_id, queryset=None):
+    """
+    (meeting, None) 또는 (None, 오류 응답). 렌딩 페이지의 JSON 엔드포인트용.
+    로그인한 사용자가 상세 화면과 같은 기준(_has_meeting_view_permission)으로 볼 수 있는 회의만 돌려준다.
+    """
+    login_user_id = request.session.get("login_user_id")
+    if not login_user_id:
+        return None, JsonResponse({"status": "error", "message": "로그인이 필요합니다."}, status=401)
+
+    meeting = get_object_or_404(
+        (queryset if queryset is not None else Meeting.objects).prefetch_related(
+            Prefetch("attendees", queryset=Attendee.objects.select_related("user"))
+        ),
+        pk=meeting_id,
+    )
+    login_user_dept_id = (
+        User.objects.filter(user_id=login_user_id).values_list("dept_id", flat=True).first()
+    )
+    if not _has_meeting_view_permission(
+        meeting,
+        list(meeting.attendees.all()),
+        login_user_id,
+        login_user_dept_id,
+    ):
+        return None, JsonResponse(
+            {"status": "error", "message": "회의를 조회할 권한이 없습니다."},
+            status=403,
+        )
+    return meeting, None
+
+
 @require_GET
 def meeting_transcript_prepare(request, meeting_id):
     """
     렌딩 페이지에서 호출하는 엔드포인트.
     - 아직 transcript가 없으면 STT를 돌려서 생성
+      (긴 녹음은 무음 경계에서 나눈 조각을 동시에 전사해 이어 붙임, meetings.utils.stt)
     - 이미 있으면 바로 done 리턴
+    - 다른 요청이 전사 중이면 processing 리턴 (프론트에서 잠시 뒤 다시 호출)
     """
-    meeting = get_object_or_404(Meeting, pk=meeting_id)
+    from meetings.utils.stt import claim_transcription, transcribe_meeting
+
+    meeting, error = _get_viewable_meeting(request, meeting_id)
+    if error:
+        return error
 
     transcript_html = meeting.transcript or ""
 
@@ -1480,70 +1707,97 @@ def meeting_transcript_prepare(request, meeting_id):
                 },
                 status=404,
             )
+        if not claim_transcription(meeting.pk):
+            return JsonResponse({"status": "processing"}, status=202)
+
+        print(f"[STT] meeting_id={meeting_id} s3_key={s3_obj.s3_key} start")
         try:
-            presigned_url = get_presigned_url(s3_obj.s3_key)
+            transcript_html = transcribe_meeting(meeting, s3_obj)
         except Exception as e:
-            return JsonResponse(
-                {
-                    "status": "error",
-                    "message": f"음성 URL 생성 중 오류가 발생했습니다: {e}",
-                },
-                status=500,
+            # 완료된 조각은 남겨 두므로 다시 호출하면 실패한 조각만 전사한다.
+            print(f"[STT] meeting_id={meeting_id} failed: {e}")
+            Meeting.objects.filter(pk=meeting.pk).update(
+                transcript_status="error", transcript_error=str(e)
             )
-
-        print(f"[STT] meeting_id={meeting_id} s3_key={s3_obj.s3_key} presigned_url_generated")
-        try:
-            res = get_stt(presigned_url)
-        except requests.RequestException as e:
             return JsonResponse(
                 {
                     "status": "error",
-                    "message": f"STT 호출 중 통신 오류가 발생했습니다: {e}",
+                    "message": f"전사 처리 중 오류가 발생했습니다: {e}",
                 },
                 status=502,
             )
-        req_url = getattr(getattr(res, "request", None), "url", "")
-        print(f"[STT][response] status={res.status_code} req_url={req_url} body_preview={getattr(res, 'text', '')[:300]}")
-
-        if res.status_code != 200 or not res.json().get("success"):
-            body_preview = ""
-            try:
-                body_preview = res.text[:300]
-            except Exception:
-                body_preview = ""
-
-            message = None
-            try:
-                res_json = res.json()
-                if isinstance(res_json, dict):
-                    message = res_json.get("message") or res_json.get("error")
-            except Exception:
-                res_json = {}
-
-            # 실패 시 프론트에서 메시지 보여줄 수 있도록 에러 내려줌
-            return JsonResponse(
-                {
-                    "status": "error",
-                    "message": message or "전사 처리 중 오류가 발생했습니다.",
-                    "detail": body_preview,
-                },
-                status=500,
-            )
-        res = res.json()
-        transcript_html = res['data']['full_text']
         meeting.transcript = transcript_html
-        meeting.save(update_fields=["transcript"])
+        meeting.transcript_status = "done"
+        meeting.transcript_error = ""
+        meeting.save(update_fields=["transcript", "transcript_status", "transcript_error"])
 
     # 여기까지 왔다면 transcript 는 채워진 상태
     return JsonResponse({"status": "done"})
 
 
+@require_GET
+def meeting_transcript_progress(request, meeting_id):
+    """
+    렌딩 페이지가 전사 중에 주기적으로 부르는 진행률 조회 엔드포인트. (TranscriptChunk 기준)
+    - chunks: 조각별 원본 구간/상태
+    - segments: 완료된 조각의 발화 목록. ?have=0,2 로 이미 받은 조각 번호를 넘기면 그 조각은 빼고 준다.
+    """
+    meeting, error = _get_viewable_meeting(
+        request,
+        meeting_id,
+        Meeting.objects.only("host", "private_yn", "domain", "transcript_status", "transcript_error"),
+    )
+    if error:
+        return error
+
+    have = set()
+    for value in request.GET.get("have", "").split(","):
+        if value.strip().isdigit():
+            have.add(int(value))
+
+    chunks = list(
+        TranscriptChunk.objects.filter(meeting_id=meeting_id)
+        .values("index", "start_sec", "end_sec", "status")
+    )
+    new_done = [
+        c["index"] for c in chunks
+        if c["status"] == TranscriptChunk.STATUS_DONE and c["index"] not in have
+    ]
+    segments = []
+    if new_done:
+        segments = [
+            {
+                "index": c["index"],
+                "start_sec": c["start_sec"],
+                "end_sec": c["end_sec"],
+                "segments": c["segments"] or [],
+            }
+            for c in TranscriptChunk.objects.filter(meeting_id=meeting_id, index__in=new_done)
+            .values("index", "start_sec", "end_sec", "segments")
+        ]
+
+    return JsonResponse(
+        {
+            "status": meeting.transcript_status,
+            "message": meeting.transcript_error if meeting.transcript_status == "error" else "",
+            "total": len(chunks),
+            "done": sum(1 for c in chunks if c["status"] == TranscriptChunk.STATUS_DONE),
+            "failed": sum(1 for c in chunks if c["status"] == TranscriptChunk.STATUS_ERROR),
+            "chunks": chunks,
+            "segments": segments,
+        }
+    )
+
+
 @require_GET
 def meeting_sllm_prepare(request, meeting_id):
     """
     전문(화자 매핑 완료본)을 SLLM에 전달해 요약/태스크를 생성한다.
     렌딩 페이지에서 호출하며, 완료 시 detail 화면으로 넘어간다.
     """
+    import requests
+    from meetings.utils.runpod import get_sllm
+
     meeting = get_object_or_404(Meeting, pk=meeting_id)
 
     transcript_plain = _transcript_to_plain_text(meeting.transcript)
@@ -1688,14 +1942,16 @@ def today_meetings(request):
     today = date.today()
 
     login_user_id = request.session.get("login_user_id")
-    login_user = None
+    if not login_user_id:
+        # 로그인 전 화면(로그인 페이지 등)에서는 볼 수 있는 회의가 없으므로 조회하지 않는다
+        return {"today_meetings": []}
+
     login_user_dept_id = None
-    if login_user_id:
-        try:
-            login_user = User.objects.select_related("dept").get(user_id=login_user_id)
-            login_user_dept_id = getattr(login_user, "dept_id", None)
-        except User.DoesNotExist:
-            login_user = None
+    try:
+        login_user = User.objects.select_related("dept").get(user_id=login_user_id)
+        login_user_dept_id = getattr(login_user, "dept_id", None)
+    except User.DoesNotExist:
+        login_user = None
 
     base_qs = (
         Meeting.objects
@@ -1818,6 +2074,11 @@ def tasks_save(request, meeting_id):
     if tasks_payload is None or not isinstance(tasks_payload, list):
         return JsonResponse({"ok": False, "error": "tasks 형식이 올바르지 않습니다."}, status=400)
 
+    # 삭제 후 재생성하므로 구글 Tasks 로 내보낸 ID 는 기존 태스크 ID 기준으로 이어 붙인다.
+    google_task_ids = dict(
+        meeting.tasks.exclude(google_task_id=None).values_list("task_id", "google_task_id")
+    )
+
     new_tasks = []
     for item in tasks_payload:
         if not isinstance(item, dict):
@@ -1860,12 +2121,18 @@ def tasks_save(request, meeting_id):
             if parsed_due:
                 content_payload["due_date"] = parsed_due.isoformat()
 
+        try:
+            previous_task_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            previous_task_id = None
+
         new_tasks.append(
             Task(
                 meeting=meeting,
                 task_content=json.dumps(content_payload, ensure_ascii=False),
                 assignee=assignee_obj,
                 due_date=parsed_due,
+                google_task_id=google_task_ids.get(previous_task_id),
             )
         )
 
@@ -1877,523 +2144,111 @@ def tasks_save(request, meeting_id):
     return JsonResponse({"ok": True})
 
 
-def parse_minutes_sections(html: str) -> Dict[str, str]:
-    """
-    meeting.meeting_notes 에 저장된 HTML에서 data-minutes-section 별 텍스트 추출
-    """
-    if not html:
-        return {}
-
-    pattern = re.compile(
-        r'<div[^>]*data-minutes-section="(?P<key>[^"]+)"[^>]*>(?P<body>.*?)</div>',
-        re.DOTALL | re.IGNORECASE,
-    )
-
-    sections: Dict[str, str] = {}
-    for match in pattern.finditer(html):
-        key = match.group("key")
-        body_html = match.group("body")
-        text = strip_tags(body_html).replace("&nbsp;", " ")
-        lines = [ln.rstrip() for ln in text.splitlines()]
-        text_clean = "\n".join(ln for ln in lines if ln.strip())
-        sections[key] = text_clean
-
-    return sections
-
-def extract_major_agenda(html: str) -> str:
-    """
-    회의록 HTML 안에서 '주요안건' 행 아래 minutes-editbox 내용을 우선 추출
-    """
-    if not html:
-        return ""
-
-    pattern = re.compile(
-        r'<th[^>]*>\s*주요안건\s*</th>.*?<div[^>]*class="[^"]*minutes-editbox[^"]*"[^>]*>(?P<body>.*?)</div>',
-        re.DOTALL | re.IGNORECASE,
+def minutes_download(request, meeting_id, fmt):
+    from meetings.utils.minutes_export import (
+        MINUTES_CONTENT_TYPES,
+        collect_minutes_payload,
+        minutes_filename,
     )
-    match = pattern.search(html)
-    if not match:
-        return ""
-
-    text = strip_tags(match.group("body")).replace("&nbsp;", " ").strip()
-    return text
+    from meetings.utils.renderer import BrokenProcessPool, RenderTimeout, render_minutes
 
+    meeting = get_object_or_404(Meeting.objects.select_related("host"), pk=meeting_id)
 
-def minutes_download(request, meeting_id, fmt):
-    meeting = get_object_or_404(Meeting, pk=meeting_id)
+    if fmt not in MINUTES_CONTENT_TYPES:
+        return HttpResponse("invalid format", status=400)
 
-    attendees_qs = (
+    attendees = list(
         meeting.attendees
                .select_related("user", "user__dept")
                .all()
     )
-    attendees_count = attendees_qs.count()
-
-    sections = parse_minutes_sections(meeting.meeting_notes or "")
-
-    raw_contents = sections.get("contents", "")
-    raw_results = sections.get("results", "")
-    raw_todos = sections.get("todos", "")
-    raw_base = sections.get("base", "")
-
-    def clean_section(text: str, header_keywords) -> str:
-        if not text:
-            return ""
-        lines = [ln.rstrip() for ln in text.splitlines()]
-        while lines and not lines[0].strip():
-            lines.pop(0)
-
-        if lines:
-            first = lines[0].replace(" ", "")
-            if all(keyword in first for keyword in header_keywords):
-                lines.pop(0)
-
-        return "\n".join(lines).strip()
-
-    contents_text = clean_section(raw_contents, ["회의", "내용"])
-    results_text = clean_section(raw_results, ["회의", "결과"])
-    todos_text = clean_section(raw_todos, ["해야", "할", "일"])
-    base_text = clean_section(raw_base, ["기본", "정보"])
-
-
-
-    has_base = "base" in sections
-    has_contents = "contents" in sections
-    has_results = "results" in sections
-    has_todos = "todos" in sections
-    has_attendees_section = "attendees" in sections
-
-    main_agenda = extract_major_agenda(meeting.meeting_notes or "")
-    if not main_agenda and base_text:
-        for ln in base_text.splitlines():
-            if ln.strip():
-                main_agenda = ln.strip()
-                break
-    if not main_agenda and contents_text:
-        for ln in contents_text.splitlines():
-            if ln.strip():
-                main_agenda = ln.strip()
-                break
-
-    agenda = meeting.title or ""
-    meeting_dt_str = (
-        meeting.meet_date_time.strftime("%Y.%m.%d %H:%M")
-        if meeting.meet_date_time
-        else ""
-    )
-    place = meeting.place or ""
-    if hasattr(meeting, "host") and meeting.host:
-        host_name = meeting.host.name
-    else:
-        host_name = getattr(meeting, "responsible_name", "")
-
-    if meeting.meeting_notes:
-        has_full_minutes = True
-        raw_html = (
-            meeting.meeting_notes
-            .replace("<br>", "\n")
-            .replace("<br/>", "\n")
-            .replace("<br />", "\n")
-        )
-        text_body = strip_tags(raw_html).replace("&nbsp;", " ")
-    else:
-        has_full_minutes = False
-        if meeting.summary:
-            text_body = meeting.summary
-        elif meeting.transcript:
-            text_body = meeting.transcript
-        else:
-            text_body = "회의 내용이 아직 등록되지 않았습니다."
-
-    if fmt == "pdf":
-        buffer = BytesIO()
-        p = canvas.Canvas(buffer, pagesize=A4)
-
-        width, height = A4
-        x_margin = 50
-        top_margin = height - 50
-        bottom_margin = 40
-        line_height = 14
-
-        font = KOREAN_FONT_NAME
-
-        def wrap_line_by_width(line: str, max_width: float, font_size: int = 10):
-            """
-            주어진 폭 안에 단어 단위로 줄바꿈. 너무 긴 단어는 폭에 맞게 강제 분리.
-            """
-            words = line.split()
-            if not words:
-                return [""]
-            lines_local = []
-            current = words[0]
-            for word in words[1:]:
-                candidate = f"{current} {word}"
-                if pdfmetrics.stringWidth(candidate, font, font_size) <= max_width:
-                    current = candidate
-                else:
-                    lines_local.append(current)
-                    current = word
-            if pdfmetrics.stringWidth(current, font, font_size) > max_width:
-                tmp = current
-                while pdfmetrics.stringWidth(tmp, font, font_size) > max_width:
-                    cut = len(tmp)
-                    while cut > 0 and pdfmetrics.stringWidth(tmp[:cut], font, font_size) > max_width:
-                        cut -= 1
-                    if cut <= 0:
-                        break
-                    lines_local.append(tmp[:cut])
-                    tmp = tmp[cut:]
-                if tmp:
-                    lines_local.append(tmp)
-            else:
-                lines_local.append(current)
-            return lines_local
-
-        def draw_page_border(top_y, bottom_y):
-            p.line(x_left, top_y, x_left, bottom_y)
-            p.line(x_right, top_y, x_right, bottom_y)
-
-        def start_new_page():
-            nonlocal current_top, table_top_y
-            p.setFont(font, 11)
-            current_top = top_margin
-            table_top_y = current_top
-
-        def finalize_current_page(outer_bottom_value):
-            draw_page_border(table_top_y, outer_bottom_value)
-
-        y = top_margin
-        p.setFont(font, 18)
-        p.drawString(x_margin, y, meeting.title or "회의록")
-        y -= 40
-
-        p.setFont(font, 11)
-        x_left = x_margin
-        x_right = width - x_margin
-
-        header_row_h = 24
-        label_row_h = 24
-        contents_h = 200
-        results_h = 200
-        todos_h = 150
-        attend_header_h = 24
-        attend_row_h = 24
-
-        rows_per_side = max(4, math.ceil(attendees_count / 2))
-        attend_rows_h = rows_per_side * attend_row_h
-
-        table_top_y = y
-        current_top = table_top_y
-
-        center_x = (x_left + x_right) / 2.0
-
-        if has_base:
-            label_w = 80
-            right_w = 120
-            x_label = x_left + label_w
-            x_right_block = x_right - right_w
-
-            header_top = current_top
-
-            for i in range(5):
-                y_line = header_top - header_row_h * i
-                p.line(x_left, y_line, x_right, y_line)
-
-            p.line(x_left, header_top, x_left, header_top - 4 * header_row_h)
-            p.line(x_right, header_top, x_right, header_top - 4 * header_row_h)
-
-            p.line(x_label, header_top, x_label, header_top - header_row_h)
-            p.line(x_label, header_top - header_row_h, x_label, header_top - 2 * header_row_h)
-            p.line(x_label, header_top - 2 * header_row_h, x_label, header_top - 3 * header_row_h)
-            p.line(x_label, header_top - 3 * header_row_h, x_label, header_top - 4 * header_row_h)
-
-            p.line(x_right_block, header_top - header_row_h, x_right_block, header_top - 3 * header_row_h)
-
-            def header_text_y(row_idx: int) -> float:
-                return header_top - header_row_h * row_idx - header_row_h + 8
-
-            y_row1 = header_text_y(0)
-            p.drawString(x_left + 5, y_row1, "제 목")
-            p.drawString(x_left + 5 + 80, y_row1, agenda)
-
-            y_row2 = header_text_y(1)
-            p.drawString(x_left + 5, y_row2, "일 시")
-            p.drawString(x_left + 5 + 80, y_row2, meeting_dt_str)
-            host_label = "주최자명"
-            if host_name:
-                host_label += f" {host_name}"
-            p.drawString(x_right_block + 5, y_row2, host_label)
-
-            y_row3 = header_text_y(2)
-            p.drawString(x_left + 5, y_row3, "장 소")
-            p.drawString(x_left + 5 + 80, y_row3, place)
-            p.drawString(x_right_block + 5, y_row3, f"참석인원  {attendees_count}")
-
-            y_row4 = header_text_y(3)
-            p.drawString(x_left + 5, y_row4, "주요안건")
-            if main_agenda:
-                agenda_box_width = x_right - (x_left + 80) - 10
-                agenda_lines = wrap_line_by_width(main_agenda, agenda_box_width, font_size=11)
-                agenda_y = y_row4
-                for line in agenda_lines:
-                    p.drawString(x_left + 5 + 80, agenda_y, line)
-                    agenda_y -= line_height
-
-            current_top = header_top - 4 * header_row_h
-        else:
-            current_top = y
-
-        if has_contents:
-            contents_title_top = current_top
-            contents_title_bottom = contents_title_top - label_row_h
-            p.line(x_left, contents_title_bottom, x_right, contents_title_bottom)
-            p.drawCentredString(center_x, contents_title_bottom + 8, "회의 내용")
+    payload = collect_minutes_payload(meeting, attendees)
 
-            contents_box_top = contents_title_bottom
-            contents_box_bottom = contents_box_top - contents_h
-            p.line(x_left, contents_box_bottom, x_right, contents_box_bottom)
+    # 문서 생성(CPU 작업)은 렌더러 프로세스 풀에서 수행하고 요청 스레드는 결과만 기다린다.
+    try:
+        file_bytes = render_minutes(fmt, payload)
+    except RenderTimeout:
+        return JsonResponse(
+            {"ok": False, "error": "회의록 생성 시간이 초과되었습니다. 잠시 후 다시 시도해 주세요."},
+            status=504,
+        )
+    except BrokenProcessPool:
+        return JsonResponse(
+            {"ok": False, "error": "회의록 생성 작업자가 재시작되었습니다. 잠시 후 다시 시도해 주세요."},
+            status=503,
+        )
 
-            current_top = contents_box_bottom
-        else:
-            contents_box_top = contents_box_bottom = None
+    filename = minutes_filename(meeting_id, fmt)
+    response = HttpResponse(
+        file_bytes,
+        content_type=MINUTES_CONTENT_TYPES[fmt],
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
-        if has_results:
-            results_title_top = current_top
-            results_title_bottom = results_title_top - label_row_h
-            p.line(x_left, results_title_bottom, x_right, results_title_bottom)
-            p.drawCentredString(center_x, results_title_bottom + 8, "회의 결과")
 
-            results_box_top = results_title_bottom
-            results_box_bottom = results_box_top - results_h
-            p.line(x_left, results_box_bottom, x_right, results_box_bottom)
+@require_GET
+def minutes_bulk_download(request, fmt):
+    """
+    부서/기간으로 걸러낸 회의들의 회의록을 ZIP 하나로 스트리밍한다. 관리자만 가능.
+    쿼리스트링: dept_id, date_from(YYYY-MM-DD), date_to(YYYY-MM-DD)
+    """
+    from meetings.utils.minutes_export import MINUTES_CONTENT_TYPES, collect_minutes_payload
+    from meetings.utils.renderer import stream_minutes_zip
 
-            current_top = results_box_bottom
-        else:
-            results_box_top = results_box_bottom = None
+    if not request.session.get("login_user_admin"):
+        return JsonResponse(
+            {"ok": False, "error": "회의록을 일괄 다운로드할 권한이 없습니다."},
+            status=403,
+        )
 
-        if has_todos:
-            todos_title_top = current_top
-            todos_title_bottom = todos_title_top - label_row_h
-            p.line(x_left, todos_title_bottom, x_right, todos_title_bottom)
-            p.drawCentredString(center_x, todos_title_bottom + 8, "해야 할 일")
+    if fmt not in MINUTES_CONTENT_TYPES:
+        return HttpResponse("invalid format", status=400)
 
-            todos_box_top = todos_title_bottom
-            todos_box_bottom = todos_box_top - todos_h
-            p.line(x_left, todos_box_bottom, x_right, todos_box_bottom)
+    meeting_qs = Meeting.objects.select_related("host")
 
-            current_top = todos_box_bottom
-        else:
-            todos_box_top = todos_box_bottom = None
-
-        p.setFont(font, 10)
-
-        def draw_multiline_in_box(text, x_left_box, x_right_box, top_y, bottom_y):
-            usable_width = (x_right_box - x_left_box) - 10  # 좌우 여백 5씩 확보
-            y_pos = top_y - 14
-            for raw_line in (text or "").splitlines():
-                wrapped = wrap_line_by_width(raw_line, usable_width)
-                for line in wrapped:
-                    if not line and len(wrapped) == 1:
-                        continue
-                    if y_pos < bottom_y + line_height:
-                        return
-                    p.drawString(x_left_box + 5, y_pos, line)
-                    y_pos -= line_height
-
-        if has_contents and contents_box_top is not None:
-            draw_multiline_in_box(
-                contents_text,
-                x_left,
-                x_right,
-                contents_box_top,
-                contents_box_bottom,
-            )
+    dept_id = (request.GET.get("dept_id") or "").strip()
+    if dept_id:
+        meeting_qs = meeting_qs.filter(
+            Q(host__dept_id=dept_id) | Q(attendees__user__dept_id=dept_id)
+        ).distinct()
 
-        if has_results and results_box_top is not None:
-            draw_multiline_in_box(
-                results_text,
-                x_left,
-                x_right,
-                results_box_top,
-                results_box_bottom,
+    date_range = {}
+    for param, lookup in (("date_from", "gte"), ("date_to", "lte")):
+        raw = (request.GET.get(param) or "").strip()
+        if not raw:
+            continue
+        try:
+            date_range[f"meet_date_time__date__{lookup}"] = date.fromisoformat(raw)
+        except ValueError:
+            return JsonResponse(
+                {"ok": False, "error": f"{param} 형식이 올바르지 않습니다. (YYYY-MM-DD)"},
+                status=400,
             )
-
-        if has_todos and todos_box_top is not None:
-            draw_multiline_in_box(
-                todos_text,
-                x_left,
-                x_right,
-                todos_box_top,
-                todos_box_bottom,
+    if date_range:
+        meeting_qs = meeting_qs.filter(**date_range)
+
+    meeting_qs = (
+        meeting_qs
+        .prefetch_related(
+            Prefetch(
+                "attendees",
+                queryset=Attendee.objects.select_related("user", "user__dept"),
             )
-
-        p.setFont(font, 11)
-
-        if has_attendees_section or not sections:
-            attend_label_top = current_top
-            attend_label_bottom = attend_label_top - label_row_h
-            attend_block_height = label_row_h + attend_header_h + attend_rows_h
-
-            if attend_label_top - attend_block_height < bottom_margin:
-                outer_bottom = current_top
-                finalize_current_page(outer_bottom)
-                p.showPage()
-                start_new_page()
-                attend_label_top = current_top
-                attend_label_bottom = attend_label_top - label_row_h
-
-            p.line(x_left, attend_label_bottom, x_right, attend_label_bottom)
-            p.drawCentredString(center_x, attend_label_bottom + 8, "참석자")
-
-            attend_header_top = attend_label_bottom
-            attend_header_bottom = attend_header_top - attend_header_h
-            p.line(x_left, attend_header_bottom, x_right, attend_header_bottom)
-
-            col_w = (x_right - x_left) / 6.0
-            x_cols = [x_left + col_w * i for i in range(7)]
-
-            attend_table_bottom = attend_header_bottom - attend_rows_h
-            for xv in x_cols:
-                p.line(xv, attend_header_top, xv, attend_table_bottom)
-
-            header_y = attend_header_bottom + 5
-            p.drawString(x_cols[0] + 5, header_y, "소 속")
-            p.drawString(x_cols[1] + 5, header_y, "성 명")
-            p.drawString(x_cols[2] + 5, header_y, "서 명")
-            p.drawString(x_cols[3] + 5, header_y, "소 속")
-            p.drawString(x_cols[4] + 5, header_y, "성 명")
-            p.drawString(x_cols[5] + 5, header_y, "서 명")
-
-            row_top = attend_header_bottom
-            for _ in range(rows_per_side):
-                row_top -= attend_row_h
-                p.line(x_left, row_top, x_right, row_top)
-
-            outer_bottom = attend_table_bottom
-        else:
-            outer_bottom = current_top
-
-        finalize_current_page(outer_bottom)
-
-        if has_attendees_section or not sections:
-            attendees_list = list(attendees_qs)
-            rows_per_side = max(4, math.ceil(len(attendees_list) / 2))
-            col_w = (x_right - x_left) / 6.0
-            x_cols = [x_left + col_w * i for i in range(7)]
-            for row_idx in range(rows_per_side):
-                row_text_y = attend_header_bottom - attend_row_h * row_idx - attend_row_h + 5
-
-                left_idx = row_idx
-                if left_idx < len(attendees_list):
-                    att = attendees_list[left_idx]
-                    dept = att.user.dept.dept_name if att.user.dept else ""
-                    name = att.user.name
-                    p.drawString(x_cols[0] + 5, row_text_y, dept)
-                    p.drawString(x_cols[1] + 5, row_text_y, name)
-                p.drawString(x_cols[2] + 5, row_text_y, "(인)")
-
-                right_idx = row_idx + rows_per_side
-                if right_idx < len(attendees_list):
-                    att = attendees_list[right_idx]
-                    dept = att.user.dept.dept_name if att.user.dept else ""
-                    name = att.user.name
-                    p.drawString(x_cols[3] + 5, row_text_y, dept)
-                    p.drawString(x_cols[4] + 5, row_text_y, name)
-                p.drawString(x_cols[5] + 5, row_text_y, "(인)")
-
-        p.showPage()
-        p.save()
-
-        pdf_value = buffer.getvalue()
-        buffer.close()
-
-        filename = f"meeting_{meeting_id}_minutes.pdf"
-        response = HttpResponse(pdf_value, content_type="application/pdf")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
-        return response
-
-    if fmt == "docx":
-        doc = Document()
-        doc.add_heading(meeting.title or "회의록", level=1)
-
-        info_rows = [
-            ("제목", agenda or "-"),
-            ("일시", meeting_dt_str or "-"),
-            ("장소", place or "-"),
-            ("주최자", host_name or "-"),
-            ("주요안건", main_agenda or "-"),
-            ("참석자 수", str(attendees_count)),
-        ]
-        info_table = doc.add_table(rows=len(info_rows), cols=2)
-        info_table.style = "Table Grid"
-        for idx, (label, value) in enumerate(info_rows):
-            cells = info_table.rows[idx].cells
-            cells[0].text = label
-            cells[1].text = value
-
-        def add_doc_section(title: str, text: str):
-            cleaned = (text or "").strip()
-            if not cleaned:
-                return
-            doc.add_paragraph("")
-            doc.add_heading(title, level=2)
-            for ln in cleaned.splitlines():
-                doc.add_paragraph(ln)
-
-        add_doc_section("회의 내용", contents_text)
-        add_doc_section("회의 결과", results_text)
-        add_doc_section("해야 할 일", todos_text)
-
-        doc.add_paragraph("")
-        doc.add_heading("참석자", level=2)
-        attendees_list = list(attendees_qs)
-        if attendees_list:
-            rows = max(1, math.ceil(len(attendees_list) / 2))
-            table = doc.add_table(rows=rows + 1, cols=4)
-            table.style = "Table Grid"
-            header_cells = table.rows[0].cells
-            header_cells[0].text = "소 속"
-            header_cells[1].text = "성 명"
-            header_cells[2].text = "소 속"
-            header_cells[3].text = "성 명"
-
-            for row_idx in range(rows):
-                row_cells = table.rows[row_idx + 1].cells
-                left_idx = row_idx
-                if left_idx < len(attendees_list):
-                    att = attendees_list[left_idx]
-                    dept = att.user.dept.dept_name if att.user.dept else ""
-                    name = att.user.name
-                    row_cells[0].text = dept
-                    row_cells[1].text = name
-                right_idx = row_idx + rows
-                if right_idx < len(attendees_list):
-                    att = attendees_list[right_idx]
-                    dept = att.user.dept.dept_name if att.user.dept else ""
-                    name = att.user.name
-                    row_cells[2].text = dept
-                    row_cells[3].text = name
-        else:
-            doc.add_paragraph("참석자 정보가 없습니다.")
-
-        if not meeting.meeting_notes and text_body:
-            doc.add_paragraph("")
-            doc.add_heading("회의 내용", level=2)
-            for line in text_body.splitlines():
-                doc.add_paragraph(line)
-
-        buf = BytesIO()
-        doc.save(buf)
-        buf.seek(0)
-
-        filename = f"meeting_{meeting_id}_minutes.docx"
-        response = HttpResponse(
-            buf.getvalue(),
-            content_type=(
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            ),
         )
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
-        return response
+        .order_by("meet_date_time", "meeting_id")
+    )
+
+    # iterator(chunk_size) 로 회의를 조금씩 읽어 전체 목록을 메모리에 올리지 않는다.
+    payloads = (
+        collect_minutes_payload(m, m.attendees.all())
+        for m in meeting_qs.iterator(chunk_size=100)
+    )
 
-    return HttpResponse("invalid format", status=400)
+    response = StreamingHttpResponse(
+        stream_minutes_zip(payloads, fmt),
+        content_type="application/zip",
+    )
+    filename = f"minutes_{date.today():%Y%m%d}_{fmt}.zip"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
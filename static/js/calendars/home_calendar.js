@@ -211,13 +211,73 @@ document.addEventListener("DOMContentLoaded", function () {
     });
   }
 
-  // 오늘·이번 달 일정 전체를 다시 불러와서
+  // 보이는 기간의 일정만 요청 (FullCalendar start/end 와 같은 형식)
+  function googleEventsUrl(startStr, endStr) {
+    const params = new URLSearchParams({ start: startStr, end: endStr });
+    return `/api/google-events/?${params.toString()}`;
+  }
+
+  const formatYmd = (d) =>
+    `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}-${String(d.getDate()).padStart(2, "0")}`;
+
+  function currentMonthRange() {
+    const now = new Date();
+    return {
+      start: new Date(now.getFullYear(), now.getMonth(), 1),
+      end: new Date(now.getFullYear(), now.getMonth() + 1, 1),
+    };
+  }
+
+  // 오른쪽 카드(오늘/이번 달)는 달력에서 보고 있는 기간과 관계없이 이번 달 기준
+  function rangeCoversCurrentMonth(start, end) {
+    const month = currentMonthRange();
+    return start <= month.start && end >= month.end;
+  }
+
+  function filterBySelectedCalendar(data) {
+    return homeCalendarFilter && homeCalendarFilter.value !== "all"
+      ? data.filter((event) => event.calendarId === homeCalendarFilter.value)
+      : data;
+  }
+
+  // 달력이 다른 달을 보고 있을 때 오른쪽 카드용 이번 달 일정을 따로 불러온다.
+  async function loadSideSchedules() {
+    try {
+      const month = currentMonthRange();
+      const res = await fetch(googleEventsUrl(formatYmd(month.start), formatYmd(month.end)));
+      const data = await res.json();
+      const list = Array.isArray(data) ? filterBySelectedCalendar(data) : [];
+      renderTodaySchedules(list);
+      renderMonthSchedules(list);
+    } catch (err) {
+      console.error("이번 달 일정 불러오기 실패:", err);
+      renderTodaySchedules([]);
+      renderMonthSchedules([]);
+    }
+  }
+
+  function renderSideSchedules(filteredData, start, end) {
+    if (rangeCoversCurrentMonth(start, end)) {
+      renderTodaySchedules(filteredData);
+      renderMonthSchedules(filteredData);
+    } else {
+      loadSideSchedules();
+    }
+  }
+
+  // 달력에 보이는 기간의 일정을 다시 불러와서
   // 캘린더와 오른쪽 카드(오늘/이번 달)를 한 번에 갱신
   // ---- override: 정리된 캘린더 로딩 & 일정 재로드 ----
   async function reloadAllSchedules() {
     try {
       await loadCalendarList();
-      const res = await fetch("/api/google-events/");
+      const view = calendar ? calendar.view : null;
+      const month = currentMonthRange();
+      const rangeStart = view ? view.activeStart : month.start;
+      const rangeEnd = view ? view.activeEnd : month.end;
+      const res = await fetch(
+        googleEventsUrl(rangeStart.toISOString(), rangeEnd.toISOString())
+      );
       const data = await res.json();
 
       if (data.error) {
@@ -255,12 +315,7 @@ document.addEventListener("DOMContentLoaded", function () {
       }
 
       // 필터링된 데이터로 오른쪽 카드도 업데이트
-      const filteredData = homeCalendarFilter && homeCalendarFilter.value !== "all"
-        ? data.filter((event) => event.calendarId === homeCalendarFilter.value)
-        : data;
-
-      if (typeof renderTodaySchedules === "function") renderTodaySchedules(filteredData);
-      if (typeof renderMonthSchedules === "function") renderMonthSchedules(filteredData);
+      renderSideSchedules(filterBySelectedCalendar(data), rangeStart, rangeEnd);
     } catch (err) {
       console.error("일정 재로드 실패:", err);
     }
@@ -678,7 +733,7 @@ document.addEventListener("DOMContentLoaded", function () {
     },
 
     events: function (info, successCallback, failureCallback) {
-      fetch("/api/google-events/")
+      fetch(googleEventsUrl(info.startStr, info.endStr))
         .then((res) => res.json())
         .then((data) => {
           if (data.error === "not_authenticated") {
@@ -712,12 +767,7 @@ document.addEventListener("DOMContentLoaded", function () {
             successCallback(filteredEvents);
 
             // 필터링된 데이터로 오른쪽 카드도 업데이트
-            const filteredData = homeCalendarFilter && homeCalendarFilter.value !== "all"
-              ? data.filter((event) => event.calendarId === homeCalendarFilter.value)
-              : data;
-
-            renderTodaySchedules(filteredData);
-            renderMonthSchedules(filteredData);
+            renderSideSchedules(filterBySelectedCalendar(data), info.start, info.end);
           }
         })
         .catch((err) => {
@@ -354,12 +354,12 @@ function bindRowAddButton(row) {
     };
   }
 
-  async function createGoogleTask(payload) {
-    const res = await fetch("/api/google-tasks/create/", {
+  // 회의 태스크 전체를 구글 Tasks 로 한 번에 내보낸다. (이미 내보낸 태스크는 수정)
+  async function pushMeetingTasksToGoogle() {
+    const res = await fetch(`/api/google-tasks/meetings/${meetingId}/push/`, {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
+      headers: { "X-CSRFToken": csrftoken },
       credentials: "include",
-      body: JSON.stringify(payload),
     });
     let data = null;
     try {
@@ -379,6 +379,27 @@ function bindRowAddButton(row) {
     return data;
   }
 
+  const taskPushGoogleBtn = document.getElementById("btn-tasks-push-google");
+  if (taskPushGoogleBtn && meetingId && isHost) {
+    taskPushGoogleBtn.addEventListener("click", async () => {
+      taskPushGoogleBtn.disabled = true;
+      try {
+        const data = await pushMeetingTasksToGoogle();
+        if (!data) return;
+        let msg = `구글 Tasks 내보내기 완료 (새로 추가 ${data.created}건, 수정 ${data.updated}건)`;
+        if (data.failed && data.failed.length) {
+          msg += `\n실패 ${data.failed.length}건은 다시 시도해 주세요.`;
+        }
+        alert(msg);
+      } catch (err) {
+        console.error("google tasks push error:", err);
+        alert(err.message || "구글 Tasks 내보내기에 실패했습니다.");
+      } finally {
+        taskPushGoogleBtn.disabled = false;
+      }
+    });
+  }
+
   async function createGoogleEvent(payload) {
     const res = await fetch("/api/google-events/create/", {
       method: "POST",
@@ -346,10 +346,123 @@ if (btnRecord) {
     });
 }
 
+// ===== 분할 업로드 =====
+// 파일을 서버가 정한 크기(chunk_size)로 잘라 보내고, 끊기면 받지 못한 조각부터 이어서 보낸다.
+const UPLOAD_PARALLEL = 3;      // 동시에 보내는 조각 수
+const UPLOAD_MAX_RETRIES = 5;   // 조각 하나당 재시도 횟수
+
+function uploadResumeKey(meetingId, file) {
+    return `record-upload:${meetingId}:${file.name}:${file.size}:${file.lastModified}`;
+}
+
+function sleep(ms) {
+    return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function uploadRequest(url, options = {}) {
+    const res = await fetch(url, {
+        ...options,
+        headers: { 'X-CSRFToken': csrftoken, ...(options.headers || {}) },
+    });
+    const data = await res.json().catch(() => ({}));
+    return { res, data };
+}
+
+async function sha256Hex(buffer) {
+    // crypto.subtle 은 https/localhost 에서만 제공되므로 없으면 체크섬 없이 보낸다.
+    if (!window.crypto || !window.crypto.subtle) return '';
+    const hash = await window.crypto.subtle.digest('SHA-256', buffer);
+    return Array.from(new Uint8Array(hash))
+        .map((b) => b.toString(16).padStart(2, '0'))
+        .join('');
+}
+
+// 같은 파일로 진행 중인 세션이 있으면 이어서, 없으면 새로 만든다.
+async function openUploadSession(meetingId, file) {
+    const key = uploadResumeKey(meetingId, file);
+    const savedId = localStorage.getItem(key);
+    if (savedId) {
+        const { res, data } = await uploadRequest(`/meetings/${meetingId}/upload/sessions/${savedId}/`);
+        if (res.ok && data.status === 'uploading') return data;
+        localStorage.removeItem(key);
+    }
+
+    const { res, data } = await uploadRequest(`/meetings/${meetingId}/upload/sessions/`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ filename: file.name, total_size: file.size }),
+    });
+    if (!res.ok || data.ok === false) {
+        throw new Error(data.error || res.statusText);
+    }
+    localStorage.setItem(key, data.upload_id);
+    return data;
+}
+
+async function putChunk(meetingId, session, file, index) {
+    const start = index * session.chunk_size;
+    const buffer = await file.slice(start, Math.min(start + session.chunk_size, file.size)).arrayBuffer();
+    const headers = { 'Content-Type': 'application/octet-stream' };
+    const checksum = await sha256Hex(buffer);
+    if (checksum) headers['X-Chunk-Sha256'] = checksum;
+
+    for (let attempt = 0; ; attempt++) {
+        let res = null;
+        let data = {};
+        try {
+            ({ res, data } = await uploadRequest(
+                `/meetings/${meetingId}/upload/sessions/${session.upload_id}/chunks/${index}/`,
+                { method: 'PUT', headers, body: buffer }
+            ));
+        } catch (err) {
+            // 네트워크 끊김: 잠시 뒤 같은 조각을 다시 보낸다.
+            if (attempt >= UPLOAD_MAX_RETRIES) throw err;
+        }
+        if (res) {
+            if (res.ok) return;
+            // 4xx(세션 만료, 크기 오류 등)는 다시 보내도 결과가 같다.
+            if (res.status < 500 || attempt >= UPLOAD_MAX_RETRIES) {
+                throw new Error(data.error || res.statusText);
+            }
+        }
+        await sleep(Math.min(30000, 1000 * 2 ** attempt));
+    }
+}
+
+async function uploadFileInChunks(meetingId, file, onProgress) {
+    const session = await openUploadSession(meetingId, file);
+    const received = new Set(session.received || []);
+    const pending = [];
+    for (let i = 0; i < session.total_chunks; i++) {
+        if (!received.has(i)) pending.push(i);
+    }
+
+    let done = received.size;
+    onProgress(done, session.total_chunks);
+    const worker = async () => {
+        while (pending.length > 0) {
+            const index = pending.shift();
+            await putChunk(meetingId, session, file, index);
+            done += 1;
+            onProgress(done, session.total_chunks);
+        }
+    };
+    await Promise.all(Array.from({ length: UPLOAD_PARALLEL }, worker));
+
+    const { res, data } = await uploadRequest(
+        `/meetings/${meetingId}/upload/sessions/${session.upload_id}/complete/`,
+        { method: 'POST' }
+    );
+    if (!res.ok || data.ok === false) {
+        throw new Error(data.error || res.statusText);
+    }
+    localStorage.removeItem(uploadResumeKey(meetingId, file));
+    return data;
+}
+
 // 업로드 버튼 클릭 시 실행
 uploadBtn.addEventListener('click', async (e) => {
     e.preventDefault();
-    uploadBtn.disabled = true;
     if (!selectedFiles || selectedFiles.length === 0) {
         // 파일이 선택되지 않았으면 파일 선택 창을 연다
         if (hiddenInput) {
@@ -359,43 +472,34 @@ uploadBtn.addEventListener('click', async (e) => {
         alert('업로드할 파일이 없습니다');
         return;
     }
+    uploadBtn.disabled = true;
     const pathParts = window.location.pathname.split('/');
     const meetingId = pathParts[2];
+    const originalLabel = uploadBtn.textContent;
 
-    const formData = new FormData();
-
-    formData.append('file', selectedFiles[0]);
     try {
-        const res = await fetch(`/meetings/${meetingId}/upload/`, {
-            method: 'POST',
-            headers: {
-                'X-CSRFToken': csrftoken,
-            },
-            body: formData,
+        await uploadFileInChunks(meetingId, selectedFiles[0], (done, total) => {
+            uploadBtn.textContent = `업로드 중... ${Math.floor((done / total) * 100)}%`;
         });
 
-        const data = await res.json().catch(() => ({}));
-
-        if (res.ok && data.ok !== false) {
-            alert('업로드 성공!');
-            // 필요하면 selectedFiles/preview 초기화
-            selectedFiles = [];
-            if (preview) preview.innerHTML = '';
-            if (hiddenInput) hiddenInput.value = "";
+        alert('업로드 성공!');
+        // 필요하면 selectedFiles/preview 초기화
+        selectedFiles = [];
+        if (preview) preview.innerHTML = '';
+        if (hiddenInput) hiddenInput.value = "";
 
-            // 녹음 관련 초기화
-            if (recordingTimer) recordingTimer.textContent = '00:00';
-            if (recordingStatus) recordingStatus.textContent = '';
+        // 녹음 관련 초기화
+        if (recordingTimer) recordingTimer.textContent = '00:00';
+        if (recordingStatus) recordingStatus.textContent = '';
 
-            window.location.href = `/meetings/${meetingId}/rendering/stt/`;
-        } else {
-            alert(`업로드 실패: ${data.error ?? res.statusText ?? '알 수 없는 오류'}`);
-        }
+        window.location.href = `/meetings/${meetingId}/rendering/stt/`;
     } catch (err) {
         console.error(err);
-        alert(`업로드 중 오류가 발생했습니다: ${err.message || err}`);
+        // 받은 조각은 서버에 남아 있으므로 다시 누르면 이어서 올린다.
+        alert(`업로드 실패: ${err.message || err}\n다시 업로드하면 이어서 진행합니다.`);
     } finally {
-    // 완료 후 다시 활성화
-    uploadBtn.disabled = false;
-  }
+        // 완료 후 다시 활성화
+        uploadBtn.disabled = false;
+        uploadBtn.textContent = originalLabel;
+    }
 });
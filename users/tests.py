@@ -1,3 +1,151 @@
-from django.test import TestCase
+"""
+로그인 화면 쿼리 수 회귀 테스트 (meetings.tests 의 팩토리 사용)와 로그인 실패 제한 테스트.
+"""
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from meetings.tests import QueryCountTestCase, SIZES, make_dataset, make_dept, make_users, query_test_settings
+from users import throttle
+from users.models import User
+
+
+@query_test_settings
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "throttle": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "users-tests"},
+    },
+)
+class UserQueryTests(QueryCountTestCase):
+    def test_login_page(self):
+        with self.assertNumQueries(0):
+            self.get("/users/login/")
+
+    def test_login_api(self):
+        dept = make_dept()
+        for i, (n, m, k) in enumerate(SIZES):
+            with self.subTest(n=n, m=m, k=k):
+                make_dataset(n, m, k, prefix=f"login{i}-", dept=dept)
+                user = make_users(dept, 1, prefix=f"member{i}-")[0]
+                User.objects.filter(pk=user.pk).update(password=make_password("password1"))
+                self.client = self.client_class()   # 세션 없이 새로 로그인
+                with self.assertNumQueries(5):
+                    res = self.client.post("/users/login-api/", {"user_id": user.user_id, "password": "password1"})
+                self.assertEqual(res.status_code, 200)
+                self.assertTrue(res.json()["ok"])
+                self.assertIn(settings.SESSION_COOKIE_NAME, res.cookies)
+
+
+@query_test_settings
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "throttle": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "throttle-tests"},
+    },
+    LOGIN_FAIL_WINDOW=3600,
+    LOGIN_MAX_FAILURES=5,
+    LOGIN_IP_MAX_FAILURES=8,
+)
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        caches["throttle"].clear()
+        self.dept = make_dept()
+        self.user = make_users(self.dept, 1, prefix="lock-")[0]
+        User.objects.filter(pk=self.user.pk).update(password=make_password("password1"))
+        # 구간 시작에서 100초 지난 시각으로 고정
+        self.now = 1_000 * 3600 + 100
+        patcher = mock.patch("users.throttle.time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self, user_id=None, password="wrong", ip="10.0.0.1"):
+        return self.client.post(
+            "/users/login-api/",
+            {"user_id": user_id or self.user.user_id, "password": password},
+            HTTP_X_REAL_IP=ip,
+        )
+
+    def test_lockout_at_threshold(self):
+        for i in range(4):
+            res = self.login()
+            self.assertEqual(res.status_code, 400)
+            self.assertIn(f"({4 - i}회 남음)", res.json()["errors"]["__all__"][0])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.status, User.STATUS_ACTIVE)
+
+        res = self.login()
+        self.assertEqual(res.status_code, 403)
+        self.assertTrue(res.json()["locked"])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.status, User.STATUS_INACTIVE)
+        self.assertEqual(self.user.login_fail_count, 5)
+
+        # 한도에 닿은 뒤에는 DB 를 보기 전에 429
+        with self.assertNumQueries(0):
+            res = self.login(password="password1")
+        self.assertEqual(res.status_code, 429)
+        # 이번 구간 5회가 다음 구간에서 4회 아래로 줄어드는 시점(다음 구간 20% 지점)까지
+        self.assertEqual(res["Retry-After"], str(3600 - 100 + 720 + 1))
+
+    def test_window_expiry_resets_count(self):
+        for _ in range(4):
+            self.login()
+        self.now += 3600 * 2
+        res = self.login()
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("(4회 남음)", res.json()["errors"]["__all__"][0])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.status, User.STATUS_ACTIVE)
+
+    def test_failures_across_bucket_boundary(self):
+        # 구간이 끝나기 10초 전에 4회, 경계를 넘긴 10초 뒤에 1회 → 20초 안에 5회이므로 잠긴다
+        self.now = 1_001 * 3600 - 10
+        for _ in range(4):
+            self.login()
+        self.now += 20
+        res = self.login()
+        self.assertEqual(res.status_code, 403)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.status, User.STATUS_INACTIVE)
+
+    def test_old_failures_fade_out_of_window(self):
+        self.now = 1_001 * 3600 - 10
+        for _ in range(4):
+            self.login()
+        # 창이 3/4 지나 이전 구간 4회 중 1회만 겹친다 (1 + 이번 1회)
+        self.now = 1_001 * 3600 + 3600 * 3 // 4
+        self.assertIn("(3회 남음)", self.login().json()["errors"]["__all__"][0])
+
+    def test_ip_retry_after_matches_window(self):
+        for i in range(8):
+            self.login(user_id=f"nobody-{i}")
+        retry_after = int(self.login(user_id="nobody-x")["Retry-After"])
+        self.now += retry_after
+        self.assertEqual(self.login(user_id="nobody-y").status_code, 400)
+
+    def test_success_resets_count(self):
+        for _ in range(4):
+            self.login()
+        self.assertEqual(self.login(password="password1").status_code, 200)
+        self.assertIn("(4회 남음)", self.login().json()["errors"]["__all__"][0])
+
+    def test_ip_limit_across_user_ids(self):
+        for i in range(8):
+            self.assertEqual(self.login(user_id=f"nobody-{i}").status_code, 400)
+        self.assertEqual(self.login(user_id="nobody-x").status_code, 429)
+        self.assertEqual(self.login(ip="10.0.0.2").status_code, 400)
+
+    def test_parallel_failures_are_all_counted(self):
+        with tempfile.TemporaryDirectory() as location, override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "throttle": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location},
+        }):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda i: throttle.record_login_failure("racer", f"10.1.0.{i}"), range(40)))
+            self.assertEqual(throttle.record_login_failure("racer", "10.2.0.1"), 41)
@@ -0,0 +1,143 @@
+import math
+import os
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경 (runserver 단일 프로세스)
+    fcntl = None
+
+
+def _cache():
+    return caches[settings.LOGIN_THROTTLE_CACHE]
+
+
+def _bucket(now) -> int:
+    """
+    LOGIN_FAIL_WINDOW 초 단위 구간 번호. 실패 횟수는 구간마다 원자적 카운터로 세고,
+    판단은 지금부터 LOGIN_FAIL_WINDOW 초 전까지의 창으로 한다. (_window_count)
+    """
+    return int(now // settings.LOGIN_FAIL_WINDOW)
+
+
+def _window_count(previous: int, current: int, now: float) -> int:
+    """
+    지금부터 LOGIN_FAIL_WINDOW 초 전까지의 실패 횟수(추정).
+    이전 구간 횟수는 창과 겹치는 비율만큼만 더한다. 구간 경계 앞뒤로 나눠 틀려도 한도를 넘지 못하도록 올림한다.
+    """
+    window = settings.LOGIN_FAIL_WINDOW
+    overlap = 1 - (now % window) / window
+    return math.ceil(previous * overlap + current - 1e-9)
+
+
+def _retry_after(previous: int, current: int, limit: int, now: float) -> int:
+    """더 틀리지 않는다고 할 때 창 안의 실패가 limit 아래로 내려가기까지 남은 초"""
+    window = settings.LOGIN_FAIL_WINDOW
+    bucket_start = _bucket(now) * window
+    if current <= limit - 1:
+        # 이번 구간 안에서 이전 구간의 겹치는 비율이 줄어들며 풀린다.
+        until = bucket_start + window * (1 - (limit - 1 - current) / previous)
+    else:
+        # 다음 구간에서 이번 구간의 겹치는 비율이 줄어들며 풀린다.
+        until = bucket_start + window + window * (1 - (limit - 1) / current)
+    return max(1, int(until - now) + 1)
+
+
+def _user_key(user_id, bucket):
+    return f"login-fail:user:{user_id}:{bucket}"
+
+
+def _ip_key(ip, bucket):
+    return f"login-fail:ip:{ip}:{bucket}"
+
+
+def client_ip(request) -> str:
+    """
+    nginx(nginx/default.conf)가 덮어쓰는 X-Real-IP 를 우선 사용한다.
+    없으면 X-Forwarded-For 의 마지막 값(바로 앞 프록시가 붙인 값), 그다음 REMOTE_ADDR.
+    (X-Forwarded-For 앞쪽 값은 클라이언트가 임의로 넣을 수 있으므로 쓰지 않는다)
+    """
+    real_ip = request.META.get("HTTP_X_REAL_IP", "").strip()
+    if real_ip:
+        return real_ip
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    if forwarded:
+        return forwarded.split(",")[-1].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+@contextmanager
+def _counter_lock():
+    """
+    파일 캐시의 add/incr 는 읽고-쓰기라 워커끼리 겹치면 실패가 덜 세어진다.
+    캐시 디렉터리의 잠금 파일로 워커 사이의 증가를 한 줄로 세운다.
+    (locmem 처럼 프로세스 안에서 원자적으로 증가하는 캐시는 잠그지 않음)
+    """
+    if fcntl is None or not isinstance(_cache(), FileBasedCache):
+        yield
+        return
+    location = settings.CACHES[settings.LOGIN_THROTTLE_CACHE]["LOCATION"]
+    os.makedirs(location, exist_ok=True)
+    with open(os.path.join(location, "login-fail.lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _limits(user_id, ip):
+    return (
+        (lambda bucket: _ip_key(ip, bucket), settings.LOGIN_IP_MAX_FAILURES),
+        (lambda bucket: _user_key(user_id, bucket), settings.LOGIN_MAX_FAILURES),
+    )
+
+
+def check_login_allowed(user_id, ip):
+    """
+    DB 조회 전에 호출. 아이디/IP 중 하나라도 창(LOGIN_FAIL_WINDOW) 안의 실패 횟수가 한도에 닿았으면
+    다시 시도할 수 있을 때까지 남은 초를, 아니면 None 을 반환한다.
+    """
+    now = time.time()
+    bucket = _bucket(now)
+    limits = _limits(user_id, ip)
+    counts = _cache().get_many([key(b) for key, _ in limits for b in (bucket - 1, bucket)])
+    for key, limit in limits:
+        previous, current = counts.get(key(bucket - 1), 0), counts.get(key(bucket), 0)
+        if _window_count(previous, current, now) >= limit:
+            return _retry_after(previous, current, limit, now)
+    return None
+
+
+def record_login_failure(user_id, ip) -> int:
+    """실패를 기록하고 창 안의 해당 아이디 실패 횟수를 반환한다. (DB 는 건드리지 않음)"""
+    cache = _cache()
+    # 다음 구간에서도 이전 구간 횟수로 읽히도록 두 구간 동안 둔다.
+    ttl = settings.LOGIN_FAIL_WINDOW * 2
+    now = time.time()
+    bucket = _bucket(now)
+    count = 0
+    with _counter_lock():
+        for key, _ in _limits(user_id, ip):
+            current_key = key(bucket)
+            # 구간 카운터가 없으면 0 으로 만들고 올린다. (add 는 이미 있으면 건드리지 않음)
+            cache.add(current_key, 0, ttl)
+            try:
+                current = cache.incr(current_key)
+            except ValueError:
+                # add 와 incr 사이에 만료된 경우
+                cache.set(current_key, 1, ttl)
+                current = 1
+            count = _window_count(cache.get(key(bucket - 1), 0), current, now)
+    return count
+
+
+def reset_login_failures(user_id):
+    """로그인 성공 또는 관리자 잠금 해제/비밀번호 초기화 시 아이디 기준 실패 기록을 지운다."""
+    bucket = _bucket(time.time())
+    _cache().delete_many([_user_key(user_id, bucket - 1), _user_key(user_id, bucket)])
@@ -5,6 +5,8 @@ from django.contrib.auth.hashers import check_password, make_password
 from django.views.decorators.http import require_POST
 from .models import User
 from .forms import LoginForm
+from .throttle import check_login_allowed, client_ip, record_login_failure, reset_login_failures
+from django.conf import settings
 from django.contrib.auth import logout as django_logout
 from django.utils import timezone
 import re
@@ -27,9 +29,28 @@ def login_api(request):
     user_id = form.cleaned_data["user_id"]
     password = form.cleaned_data["password"]
 
+    # 최근 실패가 한도를 넘은 아이디/IP 는 DB 를 보기 전에 거절
+    ip = client_ip(request)
+    retry_after = check_login_allowed(user_id, ip)
+    if retry_after is not None:
+        response = JsonResponse(
+            {
+                "ok": False,
+                "throttled": True,
+                "retry_after": retry_after,
+                "errors": {"__all__": [f"로그인 시도가 너무 많습니다. {retry_after}초 후 다시 시도해 주세요."]}
+            },
+            status=429
+        )
+        response["Retry-After"] = str(retry_after)
+        return response
+
     try:
-        user = User.objects.get(user_id=user_id)
+        # 세션에 부서명을 넣으므로 dept 를 같이 읽는다
+        user = User.objects.select_related("dept").get(user_id=user_id)
     except User.DoesNotExist:
+        # 없는 아이디로 여러 번 시도하는 것도 IP 기준으로 제한
+        record_login_failure(user_id, ip)
         return JsonResponse(
             {"ok": False, "errors": {"__all__": ["존재하지 않는 아이디입니다."]}},
             status=400
@@ -54,24 +75,24 @@ def login_api(request):
         pw_ok = (password == db_pw)
 
     if not pw_ok:
-        # 로그인 실패 카운트 증가
-        user.login_fail_count += 1
+        # 실패는 캐시에만 기록하고, 한도에 닿았을 때만 계정 상태를 DB 에 반영
+        fail_count = record_login_failure(user_id, ip)
+        max_failures = settings.LOGIN_MAX_FAILURES
 
-        # 5회 이상 실패 시 계정 비활성화
-        if user.login_fail_count >= 5:
-            user.status = User.STATUS_INACTIVE
-            user.save()
+        if fail_count >= max_failures:
+            User.objects.filter(pk=user.pk).update(
+                status=User.STATUS_INACTIVE, login_fail_count=fail_count
+            )
             return JsonResponse(
                 {
                     "ok": False,
                     "locked": True,
-                    "errors": {"__all__": ["비밀번호를 5회 이상 틀렸습니다. 계정이 비활성화되었습니다. 관리자에게 비밀번호 초기화를 문의하세요."]}
+                    "errors": {"__all__": [f"비밀번호를 {max_failures}회 이상 틀렸습니다. 계정이 비활성화되었습니다. 관리자에게 비밀번호 초기화를 문의하세요."]}
                 },
                 status=403
             )
 
-        user.save()
-        remaining_attempts = 5 - user.login_fail_count
+        remaining_attempts = max_failures - fail_count
 
         return JsonResponse(
             {
@@ -81,9 +102,10 @@ def login_api(request):
             status=400
         )
 
-    # 로그인 성공 - 실패 카운트 초기화
-    user.login_fail_count = 0
-    user.save()
+    # 로그인 성공 - 실패 기록 초기화 (예전 방식으로 남은 카운트가 있을 때만 DB 갱신)
+    reset_login_failures(user_id)
+    if user.login_fail_count:
+        User.objects.filter(pk=user.pk).update(login_fail_count=0)
 
     # 비밀번호 정책(8~15자, 영문+숫자) 미충족 시 로그인 막고 변경 플래그 반환
     # 주의: 세션에 정상 로그인 키(`login_user_id`)를 넣으면 사이트 접근이 허용되므로
@@ -109,8 +131,7 @@ def login_api(request):
     request.session["login_user_dept_name"] = getattr(user.dept, "dept_name", "")
     request.session["login_user_admin"] = user.admin_yn
 
-    # 세션 명시적 저장
-    request.session.save()
+    # 세션은 응답 시 SessionMiddleware 가 저장한다 (여기서 save() 하면 같은 세션을 두 번 쓴다)
 
     print("[DEBUG] 로그인 성공 - 세션:", dict(request.session))
 
@@ -339,6 +360,7 @@ def admin_reset_password(request):
     target_user.status = User.STATUS_ACTIVE
     target_user.login_fail_count = 0
     target_user.save()
+    reset_login_failures(target_user_id)
 
     return JsonResponse({
         "ok": True,